@@ -92,7 +92,7 @@ export default function BeautyLayout({ children }) {
   const navigate = useNavigate();
   const { t, i18n } = useTranslation();
 
-  const isRTL = i18n.language === 'ar';
+  const isRTL = i18n.dir() === 'rtl';
 
   useEffect(() => {
     document.documentElement.dir = isRTL ? 'rtl' : 'ltr';
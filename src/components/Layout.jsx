@@ -156,7 +156,7 @@ export default function Layout({ children }) {
   const navigate = useNavigate();
   const { t, i18n } = useTranslation();
 
-  const isRTL = i18n.language === 'ar';
+  const isRTL = i18n.dir() === 'rtl';
 
   useEffect(() => {
     document.documentElement.dir = isRTL ? 'rtl' : 'ltr';
@@ -181,9 +181,8 @@ export default function Layout({ children }) {
   };
 
   const changeLanguage = (lng) => {
-    const rtlLangs = ['ar'];
     i18n.changeLanguage(lng);
-    document.documentElement.dir = rtlLangs.includes(lng) ? 'rtl' : 'ltr';
+    document.documentElement.dir = i18n.dir(lng);
     document.documentElement.lang = lng;
     setShowLangMenu(false);
   };
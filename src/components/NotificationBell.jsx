@@ -58,7 +58,7 @@ export default function NotificationBell() {
   const dropdownRef = useRef(null);
   const navigate = useNavigate();
   const { t, i18n } = useTranslation();
-  const isRTL = i18n.language === 'ar';
+  const isRTL = i18n.dir() === 'rtl';
 
   /* ── fetch unread count ──────────────────────────────────── */
   const fetchCount = useCallback(async () => {
@@ -0,0 +1,49 @@
+/**
+ * Compiled locale bundles
+ * Formats strings from bundles written by `update_translations.py compile`,
+ * where interpolated strings are pre-split into literal and placeholder segments
+ * so nothing is scanned at render time.
+ */
+
+const lookup = (tree, key) => {
+  let node = tree;
+  for (const part of key.split('.')) {
+    if (node == null || typeof node !== 'object' || Array.isArray(node)) return undefined;
+    node = node[part];
+  }
+  return node;
+};
+
+/** Create `format(key, values)` for a compiled bundle; `formatters` maps `{{value, name}}` formats to functions */
+export function createFormatter(bundle, { formatters = {}, fallback = null } = {}) {
+  if (!bundle || bundle.v !== 1) throw new Error('Unsupported compiled locale bundle');
+  const rules = new Intl.PluralRules(bundle.lng);
+  const render = (template, values) => {
+    if (!Array.isArray(template)) return template;
+    let out = '';
+    for (const segment of template) {
+      if (typeof segment === 'string') {
+        out += segment;
+        continue;
+      }
+      const [name, format] = segment;
+      const value = name.includes('.') ? lookup(values, name) : values[name];
+      if (value === undefined) out += `{{${name}}}`;
+      else out += format && formatters[format] ? formatters[format](value, bundle.lng) : value;
+    }
+    return out;
+  };
+  const format = (key, values = {}) => {
+    let template;
+    if (typeof values.count === 'number') {
+      if (values.count === 0) template = lookup(bundle.t, `${key}_zero`);
+      if (template === undefined) template = lookup(bundle.t, `${key}_${rules.select(values.count)}`);
+    }
+    if (template === undefined) template = lookup(bundle.t, key);
+    if (template === undefined || typeof template === 'object' && !Array.isArray(template)) {
+      return fallback ? fallback(key, values) : key;
+    }
+    return render(template, values);
+  };
+  return format;
+}
@@ -0,0 +1,36 @@
+/**
+ * Locale release deltas
+ * Applies documents written by `update_translations.py release`, which list the
+ * flattened keys `added`, `changed` and `removed` between two versions of a bundle.
+ */
+
+/** Return a copy of `bundle` (at version `delta.from`) brought up to `delta.to` */
+export function applyDelta(bundle, delta) {
+  const out = structuredClone(bundle);
+  for (const key of delta.removed) {
+    const path = key.split('.');
+    const parents = [out];
+    for (const part of path.slice(0, -1)) {
+      const node = parents[parents.length - 1]?.[part];
+      if (!node || typeof node !== 'object') break;
+      parents.push(node);
+    }
+    if (parents.length !== path.length) continue;
+    delete parents[parents.length - 1][path[path.length - 1]];
+    for (let i = parents.length - 1; i > 0 && Object.keys(parents[i]).length === 0; i--) {
+      delete parents[i - 1][path[i - 1]];
+    }
+  }
+  for (const changes of [delta.added, delta.changed]) {
+    for (const key in changes) {
+      const path = key.split('.');
+      let node = out;
+      for (const part of path.slice(0, -1)) {
+        if (!node[part] || typeof node[part] !== 'object') node[part] = {};
+        node = node[part];
+      }
+      node[path[path.length - 1]] = changes[key];
+    }
+  }
+  return out;
+}
@@ -18,6 +18,14 @@ const resources = {
   tl: { translation: tl }
 };
 
+// Pseudo-locales from `update_translations.py pseudo` (en-XA, ar-XB), dev server only
+if (import.meta.env.DEV) {
+  const pseudo = import.meta.glob('../../build/i18n/pseudo/*.json', { eager: true, import: 'default' });
+  for (const [file, translation] of Object.entries(pseudo)) {
+    resources[file.split('/').pop().replace('.json', '')] = { translation };
+  }
+}
+
 i18n
   .use(LanguageDetector)
   .use(initReactI18next)
@@ -0,0 +1,22 @@
+/**
+ * Interned locale bundles
+ * Expands bundles written by `update_translations.py build --intern`, where
+ * repeated strings are stored once in `s` and leaves of `t` reference them by index.
+ */
+
+/** Rebuild the plain nested translation object from an interned bundle */
+export function expandInterned(bundle) {
+  if (!bundle || bundle.v !== 1) throw new Error('Unsupported interned locale bundle');
+  const strings = bundle.s;
+  const walk = (node) => {
+    const out = {};
+    for (const key in node) {
+      const value = node[key];
+      if (typeof value === 'number') out[key] = strings[value];
+      else if (value && typeof value === 'object') out[key] = walk(value);
+      else out[key] = value;
+    }
+    return out;
+  };
+  return walk(bundle.t);
+}
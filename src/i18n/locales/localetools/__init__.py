@@ -0,0 +1 @@
+"""Helpers behind update_translations.py for maintaining the locale JSON files."""
@@ -0,0 +1,191 @@
+"""Benchmarks for the locale tooling on synthetic catalogs.
+
+Generates locale trees of a given size (deterministically, from a seed) in a
+temporary directory and times each pipeline stage on them (best of a few
+runs), recording peak traced memory per stage in a separate pass. Results are plain JSON so two runs
+can be compared with ``compare``.
+"""
+import gc
+import json
+import random
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+from . import build, coverage, engine, intern, memory, placeholders, split
+from .build import BUILD_DIR
+from .catalog import SOURCE_LOCALE, dumps, flatten, load_locale, locale_path, validate, write_json, write_locale
+from .patches import LEDGER_NAME
+
+RESULTS_PATH = BUILD_DIR.parent / 'bench' / 'results.json'
+ALPHABETS = {
+    'latin': 'abcdefghijklmnopqrstuvwxyz',
+    'arabic': ''.join(chr(c) for c in range(0x0621, 0x064B)),
+    'devanagari': ''.join(chr(c) for c in range(0x0905, 0x0939)),
+}
+LOCALE_SCRIPTS = ['latin', 'arabic', 'latin', 'devanagari', 'latin', 'latin']
+PLACEHOLDER_NAMES = ('count', 'total', 'name', 'time', 'status')
+
+
+def words(rng, alphabet, count):
+    return ' '.join(''.join(rng.choice(alphabet) for _ in range(rng.randint(2, 9))) for _ in range(count))
+
+
+def synthetic_tree(keys, depth=4, namespaces=40, script='latin', seed=0, long_factor=1.0):
+    """A locale tree with ``keys`` leaves spread over ``namespaces`` and up to ``depth`` levels.
+
+    Key shapes depend only on ``seed`` so locales generated with the same seed
+    line up; values depend on ``script``.
+    """
+    shape = random.Random(seed)
+    text = random.Random(f'{seed}-{script}')
+    alphabet = ALPHABETS[script]
+    tree = {}
+    for i in range(keys):
+        path = [f'ns{shape.randrange(namespaces)}']
+        for level in range(shape.randint(0, depth - 2)):
+            path.append(f'g{level}_{shape.randrange(8)}')
+        path.append(f'k{i}')
+        node = tree
+        for part in path[:-1]:
+            node = node.setdefault(part, {})
+        value = words(text, alphabet, max(1, int(shape.randint(1, 8) * long_factor)))
+        if shape.random() < 0.05:
+            value += ' {{%s}}' % shape.choice(PLACEHOLDER_NAMES)
+        node[path[-1]] = value
+    return tree
+
+
+def write_catalog(root, keys, locales=6, depth=4, coverage_ratio=0.9, seed=0):
+    """Write ``locales`` synthetic locale files to ``root``; non-source locales miss some keys."""
+    codes = [SOURCE_LOCALE] + [f'x{chr(ord("a") + i // 26)}{chr(ord("a") + i % 26)}' for i in range(locales - 1)]
+    for index, lng in enumerate(codes):
+        script = LOCALE_SCRIPTS[index % len(LOCALE_SCRIPTS)]
+        tree = synthetic_tree(keys, depth, script=script, seed=seed, long_factor=1.0 if script == 'latin' else 1.6)
+        if lng != SOURCE_LOCALE:
+            rng = random.Random(f'{seed}-{lng}')
+            flat = {k: v for k, v in flatten(tree).items() if rng.random() < coverage_ratio}
+            tree = {}
+            for key, value in flat.items():
+                node = tree
+                *parents, leaf = key.split('.')
+                for part in parents:
+                    node = node.setdefault(part, {})
+                node[leaf] = value
+        write_locale(locale_path(lng, root), tree)
+    return codes
+
+
+def write_patches(root, codes, keys, seed=0, fraction=0.01):
+    """One merge patch per namespace touching ``fraction`` of the keys in every locale."""
+    patch_dir = Path(root) / 'patches'
+    rng = random.Random(f'{seed}-patches')
+    docs = {}
+    for i in range(max(1, int(keys * fraction))):
+        ns = f'ns{rng.randrange(40)}'
+        for lng in codes:
+            docs.setdefault(ns, {}).setdefault(lng, {})[f'bench_{i}'] = words(rng, ALPHABETS['latin'], 3)
+    for ns, locales in docs.items():
+        write_json(patch_dir / f'{ns}.json', {'mode': 'merge', 'locales': locales})
+    write_json(patch_dir / LEDGER_NAME, {})
+    return patch_dir
+
+
+def stages(root, codes, patch_dir):
+    """(name, callable) pairs; each callable runs one stage over the catalog in ``root``."""
+    paths = [locale_path(lng, root) for lng in codes]
+    trees = {}
+
+    def load():
+        for lng, path in zip(codes, paths):
+            trees[lng] = load_locale(path)
+
+    def serialize():
+        for tree in trees.values():
+            dumps(tree)
+
+    def dedupe():
+        for tree in trees.values():
+            intern.intern(tree)
+
+    def tm():
+        tm_index = memory.TranslationMemory.from_locales(root)
+        for text in list(tm_index.texts)[:200]:
+            tm_index.suggest(text, codes[-1])
+
+    out = Path(root) / 'out'
+    return [
+        ('load', load),
+        ('validate', lambda: [validate(tree) for tree in trees.values()]),
+        ('flatten', lambda: [flatten(tree) for tree in trees.values()]),
+        ('coverage', lambda: coverage.matrix(root)),
+        ('placeholders', lambda: placeholders.check(root)),
+        ('serialize', serialize),
+        ('apply', lambda: engine.run(root, patch_dir, force=True, use_cache=False)),
+        ('split', lambda: split.run(root, out / 'split')),
+        ('build', lambda: build.build(root, out / 'build')),
+        ('intern', dedupe),
+        ('memory', tm),
+    ]
+
+
+def best_time(fn, repeat):
+    """Fastest of ``repeat`` runs; the minimum is the least noisy estimate."""
+    best = None
+    for _ in range(repeat):
+        gc.collect()
+        started = time.perf_counter()
+        fn()
+        elapsed = time.perf_counter() - started
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def peak_memory(fn):
+    gc.collect()
+    tracemalloc.start()
+    try:
+        fn()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def run(sizes=(10_000, 50_000), locales=6, depth=4, seed=0, repeat=3, trace_memory=True, only=None,
+        on_result=None):
+    """Time every stage (or those in ``only``; ``load`` always runs) for each catalog size."""
+    results = []
+    for keys in sizes:
+        with tempfile.TemporaryDirectory(prefix='locale-bench-') as tmp:
+            root = Path(tmp)
+            codes = write_catalog(root, keys, locales, depth, seed=seed)
+            patch_dir = write_patches(root, codes, keys, seed=seed)
+            size_bytes = sum(locale_path(lng, root).stat().st_size for lng in codes)
+            for name, fn in stages(root, codes, patch_dir):
+                if only and name not in only and name != 'load':
+                    continue
+                seconds = best_time(fn, repeat)
+                peak = peak_memory(fn) if trace_memory else None
+                result = {'keys': keys, 'locales': locales, 'depth': depth, 'bytes': size_bytes,
+                          'stage': name, 'seconds': round(seconds, 6), 'peak_bytes': peak}
+                results.append(result)
+                if on_result:
+                    on_result(result)
+    return results
+
+
+def save(results, path):
+    write_json(path, {'created': time.strftime('%Y-%m-%dT%H:%M:%S'), 'results': results})
+
+
+def compare(results, baseline_path):
+    """Pair each result with the same (keys, locales, depth, stage) in a saved run."""
+    with open(baseline_path, 'r', encoding='utf-8') as f:
+        baseline = {(r['keys'], r['locales'], r['depth'], r['stage']): r for r in json.load(f)['results']}
+    rows = []
+    for result in results:
+        before = baseline.get((result['keys'], result['locales'], result['depth'], result['stage']))
+        if before and before['seconds']:
+            rows.append((result, before, result['seconds'] / before['seconds']))
+    return rows
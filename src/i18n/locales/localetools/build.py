@@ -0,0 +1,78 @@
+"""Minified production locale artifacts and their size report.
+
+``build`` writes ``<out>/<lng>.json`` as compact JSON, or in the interned
+format from intern.py (optionally with ``.gz``/``.br`` siblings), and
+measures raw, gzip and brotli size per locale and per namespace. Brotli
+sizes need the optional ``brotli`` package.
+"""
+import gzip
+from pathlib import Path
+
+from .catalog import (LOCALES_DIR, SOURCE_LOCALE, atomic_write, discover_locales, dumps_compact, flatten,
+                      load_locale, locale_path, unflatten, write_json)
+from .intern import intern as intern_strings
+
+try:
+    import brotli
+except ImportError:  # optional: pip install brotli
+    brotli = None
+
+BUILD_DIR = LOCALES_DIR.parents[2] / 'build' / 'i18n'
+METRICS = ('raw', 'gzip', 'brotli')
+
+
+def gzip_bytes(encoded):
+    return gzip.compress(encoded, compresslevel=9, mtime=0)
+
+
+def brotli_bytes(encoded):
+    return brotli.compress(encoded, quality=11)
+
+
+def measure(encoded):
+    return {
+        'raw': len(encoded),
+        'gzip': len(gzip_bytes(encoded)),
+        'brotli': len(brotli_bytes(encoded)) if brotli else None,
+    }
+
+
+def drop_fallback_duplicates(data, source):
+    """Leaves identical to the source locale's value, which i18next's fallback resolves anyway."""
+    flat = flatten(data)
+    kept = {key: value for key, value in flat.items() if source.get(key) != value}
+    return unflatten(kept), len(flat) - len(kept)
+
+
+def build(root=LOCALES_DIR, out_dir=BUILD_DIR, locales=None, compress=False, dedupe=False, intern=False):
+    out_dir = Path(out_dir)
+    source = flatten(load_locale(locale_path(SOURCE_LOCALE, root))) if dedupe else None
+    report = {}
+    for lng in discover_locales(root):
+        if locales is not None and lng not in locales:
+            continue
+        data = load_locale(locale_path(lng, root))
+        dropped = 0
+        if dedupe and lng != SOURCE_LOCALE:
+            data, dropped = drop_fallback_duplicates(data, source)
+        encoded = dumps_compact(intern_strings(data) if intern else data).encode('utf-8')
+        target = out_dir / f'{lng}.json'
+        atomic_write(target, [encoded], binary=True)
+        if compress:
+            atomic_write(target.with_name(target.name + '.gz'), [gzip_bytes(encoded)], binary=True)
+            if brotli:
+                atomic_write(target.with_name(target.name + '.br'), [brotli_bytes(encoded)], binary=True)
+        report[lng] = {
+            'sizes': measure(encoded),
+            'dropped_fallback_duplicates': dropped,
+            'namespaces': {ns: measure(dumps_compact(value).encode('utf-8')) for ns, value in sorted(data.items())},
+        }
+    write_json(out_dir / 'size-report.json', report)
+    return report
+
+
+def over_budget(report, budget, metric='gzip'):
+    """Locales whose ``metric`` size exceeds ``budget`` bytes; the metric must have been measured."""
+    if any(entry['sizes'][metric] is None for entry in report.values()):
+        raise ValueError(f'{metric} sizes were not measured')
+    return sorted(lng for lng, entry in report.items() if entry['sizes'][metric] > budget)
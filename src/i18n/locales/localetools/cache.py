@@ -0,0 +1,64 @@
+"""Sidecar manifest of locale content hashes.
+
+``.cache/manifest.json`` remembers, for every locale file that last passed
+validation, its size, mtime and SHA-256 plus a hash per top-level namespace.
+Runs use it to skip files (and namespaces) that have not changed since.
+"""
+import hashlib
+import json
+import os
+from pathlib import Path
+
+from .catalog import LOCALES_DIR, write_json
+
+MANIFEST_VERSION = 1
+
+
+def cache_dir(root=LOCALES_DIR):
+    return Path(root) / '.cache'
+
+
+def manifest_path(root=LOCALES_DIR):
+    return cache_dir(root) / 'manifest.json'
+
+
+def digest(raw):
+    return hashlib.sha256(raw).hexdigest()
+
+
+def namespace_digests(tree):
+    return {
+        ns: digest(json.dumps(value, ensure_ascii=False, sort_keys=True).encode('utf-8'))
+        for ns, value in tree.items()
+    }
+
+
+def file_entry(path, sha, namespaces):
+    stat = os.stat(path)
+    return {'size': stat.st_size, 'mtime_ns': stat.st_mtime_ns, 'sha256': sha, 'namespaces': namespaces}
+
+
+def is_fresh(entry, path):
+    """True when ``path`` still has the size and mtime recorded in ``entry``."""
+    if not entry:
+        return False
+    try:
+        stat = os.stat(path)
+    except FileNotFoundError:
+        return False
+    return stat.st_size == entry['size'] and stat.st_mtime_ns == entry['mtime_ns']
+
+
+def load_manifest(path):
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            manifest = json.load(f)
+    except (FileNotFoundError, ValueError):
+        manifest = {}
+    if manifest.get('version') != MANIFEST_VERSION:
+        manifest = {'version': MANIFEST_VERSION, 'files': {}}
+    return manifest
+
+
+def save_manifest(manifest, path):
+    write_json(path, manifest)
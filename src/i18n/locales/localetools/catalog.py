@@ -0,0 +1,141 @@
+"""Reading, writing and flattening of the locale JSON files."""
+import json
+import os
+import re
+import tempfile
+from pathlib import Path
+
+LOCALES_DIR = Path(__file__).resolve().parent.parent
+SOURCE_LOCALE = 'en'
+LOCALE_CODE = re.compile(r'^[a-z]{2,3}(-[A-Za-z0-9]+)?$')
+WRITE_BUFFER = 64 * 1024
+
+
+def locale_path(locale, root=LOCALES_DIR):
+    return Path(root) / f'{locale}.json'
+
+
+def discover_locales(root=LOCALES_DIR):
+    """Locale codes of every ``<lng>.json`` file directly under ``root``."""
+    return sorted(p.stem for p in Path(root).glob('*.json') if LOCALE_CODE.match(p.stem))
+
+
+def load_locale(path):
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def encoder(compact=False):
+    """The canonical encoder: sorted keys so output never depends on mutation order."""
+    if compact:
+        return json.JSONEncoder(ensure_ascii=False, sort_keys=True, separators=(',', ':'))
+    return json.JSONEncoder(ensure_ascii=False, sort_keys=True, indent=2)
+
+
+def dumps(data):
+    return encoder().encode(data) + '\n'
+
+
+def dumps_compact(data):
+    return encoder(compact=True).encode(data)
+
+
+def iter_json(data, compact=False):
+    yield from encoder(compact).iterencode(data)
+    if not compact:
+        yield '\n'
+
+
+def same_bytes(a, b, block=WRITE_BUFFER):
+    with open(a, 'rb') as fa, open(b, 'rb') as fb:
+        while True:
+            chunk = fa.read(block)
+            if chunk != fb.read(block):
+                return False
+            if not chunk:
+                return True
+
+
+def atomic_write(path, chunks, binary=False):
+    """Stream ``chunks`` (text, or bytes with ``binary``) to a temp file next to
+    ``path`` and rename it into place.
+
+    An interrupted run never leaves a truncated file behind, and when the new
+    content matches the existing file the temp file is discarded so the target
+    keeps its mtime. Returns True when ``path`` was replaced.
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=f'.{path.name}.', suffix='.tmp')
+    try:
+        if binary:
+            f = open(fd, 'wb', buffering=WRITE_BUFFER)
+        else:
+            f = open(fd, 'w', encoding='utf-8', newline='\n', buffering=WRITE_BUFFER)
+        with f:
+            f.writelines(chunks)
+            f.flush()
+            os.fsync(f.fileno())
+        try:
+            mode = path.stat().st_mode & 0o777
+        except FileNotFoundError:
+            mode = 0o644
+        else:
+            if os.path.getsize(tmp) == path.stat().st_size and same_bytes(tmp, path):
+                os.unlink(tmp)
+                return False
+        os.chmod(tmp, mode)
+        os.replace(tmp, path)
+        return True
+    except BaseException:
+        if os.path.exists(tmp):
+            os.unlink(tmp)
+        raise
+
+
+def write_json(path, data, compact=False):
+    return atomic_write(path, iter_json(data, compact))
+
+
+def write_locale(path, data):
+    """Write a locale file in canonical form; returns True if its bytes changed."""
+    return write_json(path, data)
+
+
+def validate(tree, prefix=''):
+    """Problems that would break i18next lookups, as readable messages."""
+    if not isinstance(tree, dict):
+        return [f'{prefix or "<root>"}: expected an object']
+    problems = []
+    for key, value in tree.items():
+        path = f'{prefix}.{key}' if prefix else key
+        if not key or '.' in key:
+            problems.append(f'{path}: invalid key {key!r}')
+        if isinstance(value, dict):
+            problems.extend(validate(value, path))
+        elif not isinstance(value, str):
+            problems.append(f'{path}: expected a string, got {type(value).__name__}')
+    return problems
+
+
+def flatten(tree, prefix=''):
+    """Map every leaf of a nested locale dict to its dotted key."""
+    flat = {}
+    for key, value in tree.items():
+        path = f'{prefix}.{key}' if prefix else key
+        if isinstance(value, dict):
+            flat.update(flatten(value, path))
+        else:
+            flat[path] = value
+    return flat
+
+
+def unflatten(flat):
+    tree = {}
+    for path, value in flat.items():
+        node = tree
+        *parents, leaf = path.split('.')
+        for part in parents:
+            node = node.setdefault(part, {})
+        node[leaf] = value
+    return tree
@@ -0,0 +1,70 @@
+"""Cross-locale key coverage computed with set operations on flattened keys."""
+from .catalog import LOCALES_DIR, SOURCE_LOCALE, discover_locales, flatten, load_locale, locale_path
+
+
+class KeySet:
+    """Leaf keys (with their value type) and object paths of one locale."""
+
+    def __init__(self, tree):
+        flat = flatten(tree)
+        self.types = {key: type(value).__name__ for key, value in flat.items()}
+        self.leaves = set(flat)
+        self.objects = set()
+        for key in flat:
+            parent = key.rpartition('.')[0]
+            while parent and parent not in self.objects:
+                self.objects.add(parent)
+                parent = parent.rpartition('.')[0]
+
+
+def compare(a, b):
+    """Keys of ``a`` that ``b`` lacks, keys only ``b`` has, and keys whose shape differs."""
+    mismatched = (a.leaves & b.objects) | (a.objects & b.leaves)
+    mismatched.update(key for key in a.leaves & b.leaves if a.types[key] != b.types[key])
+    return {
+        'missing': sorted(a.leaves - b.leaves - mismatched),
+        'extra': sorted(b.leaves - a.leaves - mismatched),
+        'type_mismatch': sorted(mismatched),
+    }
+
+
+def matrix(root=LOCALES_DIR, locales=None, details=False):
+    """Coverage of every ordered locale pair.
+
+    ``pairs[a][b]`` describes ``b`` measured against ``a``. Only counts are
+    included unless ``details`` is set.
+    """
+    codes = [lng for lng in discover_locales(root) if locales is None or lng in locales]
+    sets = {lng: KeySet(load_locale(locale_path(lng, root))) for lng in codes}
+    pairs = {}
+    for a in codes:
+        pairs[a] = {}
+        for b in codes:
+            if a == b:
+                continue
+            diff = compare(sets[a], sets[b])
+            shared = len(sets[a].leaves & sets[b].leaves)
+            entry = {name: len(keys) for name, keys in diff.items()}
+            entry['coverage'] = round(100 * shared / len(sets[a].leaves), 2) if sets[a].leaves else 100.0
+            if details:
+                entry['details'] = diff
+            pairs[a][b] = entry
+    return {
+        'source': SOURCE_LOCALE,
+        'locales': codes,
+        'keys': {lng: len(sets[lng].leaves) for lng in codes},
+        'namespaces': {lng: len({key.partition('.')[0] for key in sets[lng].leaves}) for lng in codes},
+        'pairs': pairs,
+    }
+
+
+def format_table(result):
+    """Coverage percentages as a text table: row = reference, column = measured locale."""
+    codes = result['locales']
+    lines = ['ref \\ lng ' + ''.join(f'{lng:>9}' for lng in codes) + '      keys']
+    for a in codes:
+        cells = ''.join(
+            f'{"-":>9}' if a == b else f"{result['pairs'][a][b]['coverage']:>8.1f}%" for b in codes
+        )
+        lines.append(f'{a:<10}{cells}{result["keys"][a]:>10}')
+    return '\n'.join(lines)
@@ -0,0 +1,165 @@
+"""Apply every pending patch to every locale in a single pass."""
+import json
+import os
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+
+from .cache import digest, file_entry, is_fresh, load_manifest, manifest_path, namespace_digests, save_manifest
+from .catalog import LOCALES_DIR, discover_locales, locale_path, validate, write_locale
+from .patches import (PATCHES_DIR, PatchError, apply_patch, is_pending, load_ledger, load_patches, record,
+                      save_ledger)
+from .profiling import Profiler, stage
+
+
+def plan(patches, ledger, locales=None, force=False):
+    """Group the patches that still need applying by locale."""
+    by_locale = defaultdict(list)
+    for patch in patches:
+        if locales is not None and patch.locale not in locales:
+            continue
+        if force or is_pending(patch, ledger):
+            by_locale[patch.locale].append(patch)
+    return dict(sorted(by_locale.items()))
+
+
+def process_locale(path, patches, dry_run=False, cached=None, profile=False):
+    """Load and validate ``path``, apply ``patches`` in order and write it back once.
+
+    ``cached`` is the manifest entry from the previous run: an unpatched file
+    whose bytes still hash the same is not parsed at all, and only namespaces
+    whose hash changed are re-validated. The file is rewritten (atomically, in
+    canonical key order) only when the serialized bytes differ. Runs in a
+    worker process when ``--jobs`` is above one, so it only takes and returns
+    picklable values; with ``profile`` the stage events ride along in
+    ``report['profile']``.
+    """
+    report = {'locale': path.stem, 'namespaces': [p.namespace for p in patches], 'changed': 0,
+              'applied': False, 'written': False, 'skipped': False, 'errors': [], 'entry': None}
+    if not profile:
+        return patch_locale(report, path, patches, dry_run, cached, None)
+    with Profiler() as profiler:
+        patch_locale(report, path, patches, dry_run, cached, profiler)
+    report['profile'] = profiler.events
+    return report
+
+
+def patch_locale(report, path, patches, dry_run, cached, profiler):
+    lng = report['locale']
+    with stage(profiler, 'read', lng) as event:
+        raw = path.read_bytes()
+        sha = digest(raw)
+        event['bytes_read'] = len(raw)
+    if cached and cached['sha256'] == sha and not patches:
+        report['skipped'] = True
+        report['entry'] = file_entry(path, sha, cached['namespaces'])
+        return report
+    with stage(profiler, 'parse', lng):
+        try:
+            data = json.loads(raw.decode('utf-8'))
+        except ValueError as exc:
+            report['errors'].append(f'invalid JSON: {exc}')
+    if report['errors']:
+        return report
+    if not isinstance(data, dict):
+        report['errors'] = validate(data)
+        return report
+
+    with stage(profiler, 'validate', lng):
+        known = cached['namespaces'] if cached else {}
+        hashes = namespace_digests(data)
+        for ns, value in data.items():
+            if known.get(ns) != hashes[ns]:
+                report['errors'].extend(validate(value, ns))
+    if report['errors']:
+        return report
+
+    with stage(profiler, 'patch', lng):
+        for patch in patches:
+            report['changed'] += apply_patch(data, patch)
+            report['errors'].extend(validate(data[patch.namespace], patch.namespace))
+    if report['errors']:
+        return report
+    if patches:
+        hashes.update(namespace_digests({p.namespace: data[p.namespace] for p in patches}))
+
+    if patches:
+        if dry_run:
+            return report
+        with stage(profiler, 'write', lng) as event:
+            if write_locale(path, data):
+                report['written'] = True
+                written = path.read_bytes()
+                sha = digest(written)
+                event['bytes_written'] = len(written)
+        report['applied'] = True
+    report['entry'] = file_entry(path, sha, hashes)
+    return report
+
+
+def resolve_jobs(jobs):
+    return jobs if jobs > 0 else os.cpu_count() or 1
+
+
+def run(root=LOCALES_DIR, patch_dir=PATCHES_DIR, locales=None, force=False, dry_run=False, jobs=1,
+        use_cache=True, profiler=None):
+    """Validate every selected locale and apply its pending patches.
+
+    Locales without pending patches whose size and mtime match the cache
+    manifest are skipped without being read. With ``jobs`` above one the rest
+    are handled concurrently on a process pool. Reports always come back
+    ordered by locale. With a ``profiler`` every stage, including those run
+    in workers, is recorded on it. A ``dry_run`` writes nothing, not even the
+    ledger or the cache manifest.
+    """
+    with stage(profiler, 'plan'):
+        patches = load_patches(patch_dir)
+        ledger = load_ledger(patch_dir)
+        available = discover_locales(root)
+        work = plan(patches, ledger, locales, force)
+    unknown = sorted(set(work) - set(available))
+    if unknown:
+        raise PatchError(f'patches target missing locale files: {", ".join(unknown)}')
+
+    manifest_file = manifest_path(root)
+    manifest = load_manifest(manifest_file)
+    files = manifest['files']
+    reports = {}
+    tasks = []
+    for lng in available:
+        if locales is not None and lng not in locales:
+            continue
+        path = locale_path(lng, root)
+        cached = files.get(lng) if use_cache else None
+        if lng not in work and is_fresh(cached, path):
+            reports[lng] = {'locale': lng, 'namespaces': [], 'changed': 0, 'applied': False,
+                            'written': False, 'skipped': True, 'errors': [], 'entry': cached}
+        else:
+            tasks.append((path, work.get(lng, []), dry_run, cached, profiler is not None))
+
+    jobs = min(resolve_jobs(jobs), len(tasks)) or 1
+    if jobs > 1:
+        with ProcessPoolExecutor(max_workers=jobs) as pool:
+            results = list(pool.map(process_locale, *zip(*tasks)))
+    else:
+        results = [process_locale(*task) for task in tasks]
+    reports.update((report['locale'], report) for report in results)
+    if profiler:
+        for report in results:
+            profiler.events.extend(report.pop('profile'))
+
+    if dry_run:
+        return [reports[lng] for lng in sorted(reports)]
+    for report in results:
+        if report['applied']:
+            for patch in work[report['locale']]:
+                record(patch, ledger)
+        if report['entry']:
+            files[report['locale']] = report['entry']
+        else:
+            files.pop(report['locale'], None)
+    with stage(profiler, 'save'):
+        if any(report['applied'] for report in results):
+            save_ledger(ledger, patch_dir)
+        if results:
+            save_manifest(manifest, manifest_file)
+    return [reports[lng] for lng in sorted(reports)]
@@ -0,0 +1,188 @@
+"""Read-only indexed catalogs that are memory-mapped instead of parsed.
+
+``write_index`` flattens a locale file into ``.cache/index/<lng>.idx``::
+
+    header   magic, version, entry count, source size/mtime/sha256, blob offsets
+    entries  count x (key offset, key length, value offset, value length)
+    keys     UTF-8 dotted keys, sorted bytewise
+    values   compact JSON of each leaf
+
+``IndexedCatalog`` maps the file and binary-searches the entry table, so a
+lookup touches a few pages and nothing is materialized beyond the keys and
+values asked for. Keys under one prefix are contiguous, which makes prefix
+queries a range scan. ``open_catalog`` rebuilds the index when the source
+file's size or mtime no longer match the header.
+"""
+import json
+import mmap
+import struct
+from pathlib import Path
+
+from .cache import cache_dir, digest
+from .catalog import LOCALES_DIR, atomic_write, discover_locales, flatten, locale_path, unflatten
+
+MAGIC = b'LCAT'
+INDEX_VERSION = 1
+HEADER = struct.Struct('<4sHHIQQQQ32s')
+ENTRY = struct.Struct('<IIII')
+
+
+class CatalogIndexError(ValueError):
+    pass
+
+
+def index_path(lng, root=LOCALES_DIR):
+    return cache_dir(root) / 'index' / f'{lng}.idx'
+
+
+def encode_value(value):
+    return json.dumps(value, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+
+def write_index(source, target):
+    """Index the locale file ``source`` into ``target``; returns True if ``target`` changed."""
+    source = Path(source)
+    raw = source.read_bytes()
+    stat = source.stat()
+    flat = flatten(json.loads(raw.decode('utf-8')))
+    items = sorted((key.encode('utf-8'), encode_value(value)) for key, value in flat.items())
+    entries, keys, values = [], [], []
+    key_pos = value_pos = 0
+    for key, value in items:
+        entries.append(ENTRY.pack(key_pos, len(key), value_pos, len(value)))
+        keys.append(key)
+        values.append(value)
+        key_pos += len(key)
+        value_pos += len(value)
+    keys_offset = HEADER.size + ENTRY.size * len(items)
+    values_offset = keys_offset + key_pos
+    header = HEADER.pack(MAGIC, INDEX_VERSION, 0, len(items), stat.st_size, stat.st_mtime_ns,
+                         keys_offset, values_offset, bytes.fromhex(digest(raw)))
+    return atomic_write(target, [header, *entries, *keys, *values], binary=True)
+
+
+class IndexedCatalog:
+    """Memory-mapped view of one ``.idx`` file; usable as a context manager."""
+
+    def __init__(self, path):
+        self.path = Path(path)
+        with open(self.path, 'rb') as f:
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        (magic, version, _reserved, self.count, self.source_size, self.source_mtime_ns,
+         self._keys, self._values, sha) = HEADER.unpack_from(self._map, 0)
+        if magic != MAGIC or version != INDEX_VERSION:
+            self._map.close()
+            raise CatalogIndexError(f'{self.path} is not a version {INDEX_VERSION} locale index')
+        self.source_sha256 = sha.hex()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        self._map.close()
+
+    def __len__(self):
+        return self.count
+
+    def _entry(self, i):
+        return ENTRY.unpack_from(self._map, HEADER.size + i * ENTRY.size)
+
+    def _key(self, i):
+        key_off, key_len, _, _ = self._entry(i)
+        start = self._keys + key_off
+        return self._map[start:start + key_len]
+
+    def _value(self, i):
+        _, _, value_off, value_len = self._entry(i)
+        start = self._values + value_off
+        return json.loads(self._map[start:start + value_len].decode('utf-8'))
+
+    def _lower_bound(self, key):
+        lo, hi = 0, self.count
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self._key(mid) < key:
+                lo = mid + 1
+            else:
+                hi = mid
+        return lo
+
+    def _find(self, key):
+        i = self._lower_bound(key)
+        return i if i < self.count and self._key(i) == key else None
+
+    def get(self, key, default=None):
+        i = self._find(key.encode('utf-8'))
+        return default if i is None else self._value(i)
+
+    def __contains__(self, key):
+        return self._find(key.encode('utf-8')) is not None
+
+    def items(self, prefix=''):
+        """(key, value) pairs for ``prefix`` itself and every key below it, in key order."""
+        if not prefix:
+            for i in range(self.count):
+                yield self._key(i).decode('utf-8'), self._value(i)
+            return
+        exact = prefix.encode('utf-8')
+        i = self._find(exact)
+        if i is not None:
+            yield prefix, self._value(i)
+        below = exact + b'.'
+        i = self._lower_bound(below)
+        while i < self.count:
+            key = self._key(i)
+            if not key.startswith(below):
+                break
+            yield key.decode('utf-8'), self._value(i)
+            i += 1
+
+    def keys(self, prefix=''):
+        return (key for key, _ in self.items(prefix))
+
+    def subtree(self, prefix):
+        """The nested object at ``prefix`` (a leaf value if ``prefix`` is a leaf), or None."""
+        found = list(self.items(prefix))
+        if found and found[0][0] == prefix:
+            return found[0][1]
+        cut = len(prefix) + 1 if prefix else 0
+        return unflatten({key[cut:]: value for key, value in found}) if found else None
+
+
+def is_current(path, source):
+    """Whether the index at ``path`` was built from ``source`` as it is now."""
+    try:
+        with open(path, 'rb') as f:
+            header = f.read(HEADER.size)
+        stat = Path(source).stat()
+    except FileNotFoundError:
+        return False
+    if len(header) < HEADER.size:
+        return False
+    magic, version, _, _, size, mtime_ns, _, _, _ = HEADER.unpack(header)
+    return magic == MAGIC and version == INDEX_VERSION and (size, mtime_ns) == (stat.st_size, stat.st_mtime_ns)
+
+
+def open_catalog(lng, root=LOCALES_DIR):
+    """An ``IndexedCatalog`` for ``lng``, (re)building its index first if it is missing or stale."""
+    source = locale_path(lng, root)
+    path = index_path(lng, root)
+    if not is_current(path, source):
+        write_index(source, path)
+    return IndexedCatalog(path)
+
+
+def build_all(root=LOCALES_DIR, locales=None):
+    """Refresh the index of every selected locale; returns {lng: rebuilt}."""
+    rebuilt = {}
+    for lng in discover_locales(root):
+        if locales is not None and lng not in locales:
+            continue
+        source, path = locale_path(lng, root), index_path(lng, root)
+        rebuilt[lng] = not is_current(path, source)
+        if rebuilt[lng]:
+            write_index(source, path)
+    return rebuilt
@@ -0,0 +1,68 @@
+"""Duplicate string analysis and the interned bundle format.
+
+An interned bundle stores each repeated string once::
+
+    {"v": 1, "s": ["Revenue", "Status"], "t": {"reports": {"col": {"revenue": 0}}, ...}}
+
+Leaves of ``t`` are either inline strings or an index into ``s``. Only
+strings whose repetitions cost more than the table entry and references are
+interned; ``src/i18n/interned.js`` expands a bundle back into a plain tree.
+"""
+import json
+from collections import Counter
+
+from .catalog import flatten
+
+FORMAT_VERSION = 1
+
+
+def encoded_len(value):
+    return len(json.dumps(value, ensure_ascii=False).encode('utf-8'))
+
+
+def duplicates(data):
+    """Values that occur more than once, with the bytes the extra copies cost, most costly first."""
+    counts = Counter(value for value in flatten(data).values() if isinstance(value, str))
+    found = [
+        {'value': value, 'count': count, 'bytes_wasted': (count - 1) * encoded_len(value)}
+        for value, count in counts.items() if count > 1
+    ]
+    found.sort(key=lambda item: (-item['bytes_wasted'], item['value']))
+    return found
+
+
+def string_table(data):
+    """Index of every string worth interning; cheaper-to-reference strings get lower indexes."""
+    counts = Counter(value for value in flatten(data).values() if isinstance(value, str))
+    candidates = sorted(
+        ((count, encoded_len(value), value) for value, count in counts.items() if count > 1),
+        key=lambda item: (-(item[0] - 1) * item[1], item[2]),
+    )
+    table = {}
+    for count, length, value in candidates:
+        digits = len(str(len(table)))
+        # inline: count copies; interned: one copy plus a comma in the table and count references
+        if count * length > length + 1 + count * digits:
+            table[value] = len(table)
+    return table
+
+
+def intern(data):
+    table = string_table(data)
+
+    def walk(node):
+        return {key: walk(value) if isinstance(value, dict) else table.get(value, value)
+                for key, value in node.items()}
+
+    return {'v': FORMAT_VERSION, 's': list(table), 't': walk(data)}
+
+
+def expand(bundle):
+    """Inverse of ``intern``; mirrors ``expandInterned`` in src/i18n/interned.js."""
+    strings = bundle['s']
+
+    def walk(node):
+        return {key: walk(value) if isinstance(value, dict) else strings[value] if isinstance(value, int) else value
+                for key, value in node.items()}
+
+    return walk(bundle['t'])
@@ -0,0 +1,127 @@
+"""Translation memory: fuzzy reuse of existing translations.
+
+Every English string that already has translations becomes one entry. A
+character-trigram inverted index over the English side finds entries similar
+to a new string, scored with the Dice coefficient of their trigram sets.
+
+Each posting list is kept sorted by entry size, so the entries whose size
+makes the threshold unreachable are cut off by bisection before anything is
+counted; the remaining slices are counted in one ``Counter`` pass and only
+entries sharing enough trigrams are scored.
+"""
+import bisect
+import math
+import re
+from collections import Counter, defaultdict
+from itertools import chain
+
+from .catalog import LOCALES_DIR, SOURCE_LOCALE, discover_locales, flatten, load_locale, locale_path
+
+NGRAM = 3
+SPACES = re.compile(r'\s+')
+
+
+def normalize(text):
+    return SPACES.sub(' ', text.strip().lower())
+
+
+def ngrams(text):
+    padded = f' {normalize(text)} '
+    return frozenset(padded[i:i + NGRAM] for i in range(max(len(padded) - NGRAM + 1, 1)))
+
+
+class TranslationMemory:
+    def __init__(self):
+        self.texts = []          # normalized English text per entry
+        self.sizes = []          # trigram count per entry
+        self.translations = []   # {lng: (translation, source key)} per entry
+        self.by_text = {}
+        self.postings = defaultdict(list)
+        self.by_size = None      # {trigram: (sizes, entry ids)} sorted by size, built on first search
+
+    @classmethod
+    def from_locales(cls, root=LOCALES_DIR, locales=None):
+        memory = cls()
+        source = flatten(load_locale(locale_path(SOURCE_LOCALE, root)))
+        for lng in discover_locales(root):
+            if lng == SOURCE_LOCALE or (locales is not None and lng not in locales):
+                continue
+            for key, value in flatten(load_locale(locale_path(lng, root))).items():
+                english = source.get(key)
+                if isinstance(english, str) and isinstance(value, str):
+                    memory.add(english, lng, value, key)
+        return memory
+
+    def add(self, english, lng, translation, key):
+        text = normalize(english)
+        entry = self.by_text.get(text)
+        if entry is None:
+            entry = self.by_text[text] = len(self.texts)
+            grams = ngrams(text)
+            self.texts.append(text)
+            self.sizes.append(len(grams))
+            self.translations.append({})
+            for gram in grams:
+                self.postings[gram].append(entry)
+            self.by_size = None
+        self.translations[entry].setdefault(lng, (translation, key))
+
+    def __len__(self):
+        return len(self.texts)
+
+    def sorted_postings(self):
+        if self.by_size is None:
+            sizes = self.sizes
+            self.by_size = {}
+            for gram, entries in self.postings.items():
+                entries = sorted(entries, key=sizes.__getitem__)
+                self.by_size[gram] = ([sizes[entry] for entry in entries], entries)
+        return self.by_size
+
+    def search(self, english, threshold=0.5, limit=5):
+        """Entries similar to ``english`` as (score, entry id), best first."""
+        grams = ngrams(english)
+        size = len(grams)
+        # Dice >= t requires t/(2-t) * |A| <= |B| <= (2-t)/t * |A| and |A & B| >= t * (|A| + |B|) / 2.
+        low = size * threshold / (2 - threshold)
+        high = size * (2 - threshold) / threshold if threshold else float('inf')
+        overlap = max(1, math.ceil(threshold * (size + low) / 2 - 1e-9))
+        index = self.sorted_postings()
+        windows = []
+        for gram in grams:
+            posting = index.get(gram)
+            if posting:
+                sizes, entries = posting
+                windows.append(entries[bisect.bisect_left(sizes, low):bisect.bisect_right(sizes, high)])
+        scored = []
+        sizes = self.sizes
+        for entry, count in Counter(chain.from_iterable(windows)).items():
+            if count >= overlap:
+                score = 2 * count / (size + sizes[entry])
+                if score >= threshold:
+                    scored.append((score, entry))
+        scored.sort(key=lambda item: (-item[0], self.texts[item[1]]))
+        return scored[:limit]
+
+    def suggest(self, english, lng, threshold=0.5, limit=3):
+        """Existing ``lng`` translations of strings similar to ``english``.
+
+        Returns dicts with ``score``, the matched ``source`` text, the
+        ``translation`` and the ``key`` it came from.
+        """
+        suggestions = []
+        for score, entry in self.search(english, threshold, limit=limit * 4):
+            found = self.translations[entry].get(lng)
+            if found:
+                suggestions.append({'score': round(score, 3), 'source': self.texts[entry],
+                                    'translation': found[0], 'key': found[1]})
+                if len(suggestions) == limit:
+                    break
+        return suggestions
+
+
+def untranslated(root=LOCALES_DIR, lng='ar'):
+    """English strings of keys ``lng`` does not have yet, keyed by dotted key."""
+    source = flatten(load_locale(locale_path(SOURCE_LOCALE, root)))
+    target = flatten(load_locale(locale_path(lng, root)))
+    return {key: value for key, value in source.items() if key not in target and isinstance(value, str)}
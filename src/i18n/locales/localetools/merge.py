@@ -0,0 +1,133 @@
+"""Three-way structural merge of locale trees.
+
+Trees are compared as flattened key maps, so edits to different keys of the
+same section never clash, whatever the nesting. For every key:
+
+* both sides agree (including both deleting it) -> that value,
+* only one side changed it from base -> that side's value,
+* both changed it differently -> a conflict.
+
+A key that is a string on one side and an object on the other is a ``shape``
+conflict; ours wins. Conflicting values are resolved per ``style``: ``ours``,
+``theirs`` or ``markers`` (the default), which keeps both texts in the value
+between ``<<<<<<<``/``>>>>>>>`` lines so the result is still valid JSON and
+easy to grep. ``.gitattributes`` routes the locale files to it as a git
+merge driver once it is configured::
+
+    git config merge.locales.driver "python src/i18n/locales/update_translations.py merge %O %A %B %P"
+"""
+import json
+from pathlib import Path
+
+from .catalog import discover_locales, flatten, locale_path, unflatten, write_locale
+
+STYLES = ('markers', 'ours', 'theirs')
+MISSING = object()
+
+
+class MergeError(ValueError):
+    pass
+
+
+def marker_value(ours, theirs):
+    ours = '' if ours is MISSING else ours
+    theirs = '' if theirs is MISSING else theirs
+    return f'<<<<<<< ours\n{ours}\n=======\n{theirs}\n>>>>>>> theirs'
+
+
+def resolve(ours, theirs, style):
+    if style == 'ours':
+        return theirs if ours is MISSING else ours
+    if style == 'theirs':
+        return ours if theirs is MISSING else theirs
+    return marker_value(ours, theirs)
+
+
+def merge_flat(base, ours, theirs, style='markers'):
+    """Merge flattened maps; returns (merged, conflicts) with merged in ours' key order."""
+    merged = {}
+    conflicts = []
+    for key in {**ours, **theirs, **base}:
+        b, o, t = base.get(key, MISSING), ours.get(key, MISSING), theirs.get(key, MISSING)
+        if o == t or t == b:
+            value = o
+        elif o == b:
+            value = t
+        else:
+            conflicts.append({'key': key, 'kind': 'value', 'base': b, 'ours': o, 'theirs': t})
+            value = resolve(o, t, style)
+        if value is not MISSING:
+            merged[key] = value
+    for prefix in shape_clashes(merged):
+        if prefix not in merged:  # inside a clash already resolved further out
+            continue
+        conflicts.append({'key': prefix, 'kind': 'shape', 'base': base.get(prefix, MISSING),
+                          'ours': ours.get(prefix, MISSING), 'theirs': theirs.get(prefix, MISSING)})
+        if prefix in ours:
+            for key in [k for k in merged if k.startswith(prefix + '.')]:
+                del merged[key]
+        else:
+            del merged[prefix]
+    for conflict in conflicts:
+        for side in ('base', 'ours', 'theirs'):
+            if conflict[side] is MISSING:
+                conflict[side] = None
+    conflicts.sort(key=lambda c: c['key'])
+    return merged, conflicts
+
+
+def shape_clashes(flat):
+    """Keys that are leaves and also parents of other leaves, outermost first."""
+    clashes = set()
+    for key in flat:
+        parent = key.rpartition('.')[0]
+        while parent:
+            if parent in flat:
+                clashes.add(parent)
+            parent = parent.rpartition('.')[0]
+    return sorted(clashes, key=lambda k: (k.count('.'), k))
+
+
+def merge_trees(base, ours, theirs, style='markers'):
+    merged, conflicts = merge_flat(flatten(base), flatten(ours), flatten(theirs), style)
+    return unflatten(merged), conflicts
+
+
+def read_tree(path):
+    """A locale tree from ``path``; a missing or empty file (no common ancestor) is ``{}``."""
+    try:
+        raw = Path(path).read_text(encoding='utf-8')
+    except FileNotFoundError:
+        return {}
+    if not raw.strip():
+        return {}
+    try:
+        data = json.loads(raw)
+    except ValueError as exc:
+        raise MergeError(f'{path}: invalid JSON: {exc}') from None
+    if not isinstance(data, dict):
+        raise MergeError(f'{path}: expected an object')
+    return data
+
+
+def merge_files(base, ours, theirs, out=None, style='markers'):
+    """Merge three locale files into ``out`` (default: ``ours``, as git expects); returns the conflicts."""
+    tree, conflicts = merge_trees(read_tree(base), read_tree(ours), read_tree(theirs), style)
+    write_locale(out or ours, tree)
+    return conflicts
+
+
+def merge_dirs(base, ours, theirs, out=None, style='markers'):
+    """Merge every locale present in any of three directories; returns {lng: conflicts}."""
+    out = Path(out or ours)
+    results = {}
+    for lng in sorted(set(discover_locales(base)) | set(discover_locales(ours)) | set(discover_locales(theirs))):
+        paths = [locale_path(lng, d) for d in (base, ours, theirs)]
+        tree, conflicts = merge_trees(*(read_tree(p) for p in paths), style)
+        target = locale_path(lng, out)
+        if tree or conflicts:
+            write_locale(target, tree)
+        elif target.exists():  # deleted on one side, untouched on the other
+            target.unlink()
+        results[lng] = conflicts
+    return results
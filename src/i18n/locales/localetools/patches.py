@@ -0,0 +1,123 @@
+"""Declarative translation patches.
+
+A patch document lives in ``patches/<namespace>.json`` and carries the
+changes for that top-level namespace, keyed by locale::
+
+    {
+      "mode": "merge",
+      "locales": {
+        "en": {"saving": "Saving…"},
+        "ar": {"saving": "جارٍ الحفظ…"}
+      }
+    }
+
+``merge`` deep-merges the body into the namespace, ``replace`` swaps the
+namespace out wholesale. The hash of every (namespace, locale) body that has
+been applied is kept in ``patches/_applied.json`` so only pending ones run.
+"""
+import copy
+import hashlib
+import json
+from dataclasses import dataclass
+from pathlib import Path
+
+from .catalog import LOCALES_DIR, flatten, write_json
+
+PATCHES_DIR = LOCALES_DIR / 'patches'
+LEDGER_NAME = '_applied.json'
+MODES = ('merge', 'replace')
+
+
+class PatchError(ValueError):
+    pass
+
+
+@dataclass(frozen=True)
+class Patch:
+    namespace: str
+    locale: str
+    mode: str
+    body: dict
+
+    @property
+    def digest(self):
+        payload = json.dumps([self.mode, self.body], ensure_ascii=False, sort_keys=True)
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+
+def load_patch_file(path):
+    """The patches in one ``<namespace>.json`` document, ordered by locale."""
+    path = Path(path)
+    with open(path, 'r', encoding='utf-8') as f:
+        try:
+            doc = json.load(f)
+        except ValueError as exc:
+            raise PatchError(f'{path.name}: invalid JSON: {exc}') from None
+    if not isinstance(doc, dict):
+        raise PatchError(f'{path.name}: expected an object')
+    mode = doc.get('mode', 'merge')
+    if mode not in MODES:
+        raise PatchError(f'{path.name}: unknown mode {mode!r}')
+    locales = doc.get('locales')
+    if not isinstance(locales, dict) or not locales:
+        raise PatchError(f'{path.name}: "locales" must be a non-empty object')
+    patches = []
+    for locale, body in sorted(locales.items()):
+        if not isinstance(body, dict):
+            raise PatchError(f'{path.name}: body for {locale!r} must be an object')
+        patches.append(Patch(path.stem, locale, mode, body))
+    return patches
+
+
+def is_patch_file(path):
+    return path.suffix == '.json' and not path.name.startswith(('_', '.'))
+
+
+def load_patches(patch_dir=PATCHES_DIR):
+    """Every patch in ``patch_dir``, ordered by namespace then locale."""
+    patches = []
+    for path in sorted(Path(patch_dir).glob('*.json')):
+        if is_patch_file(path):
+            patches.extend(load_patch_file(path))
+    return patches
+
+
+def load_ledger(patch_dir=PATCHES_DIR):
+    path = Path(patch_dir) / LEDGER_NAME
+    if not path.exists():
+        return {}
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def save_ledger(ledger, patch_dir=PATCHES_DIR):
+    write_json(Path(patch_dir) / LEDGER_NAME, ledger)
+
+
+def is_pending(patch, ledger):
+    return ledger.get(patch.namespace, {}).get(patch.locale) != patch.digest
+
+
+def record(patch, ledger):
+    ledger.setdefault(patch.namespace, {})[patch.locale] = patch.digest
+
+
+def deep_merge(target, source):
+    for key, value in source.items():
+        if isinstance(value, dict) and isinstance(target.get(key), dict):
+            deep_merge(target[key], value)
+        else:
+            target[key] = value
+    return target
+
+
+def apply_patch(data, patch):
+    """Apply ``patch`` to a loaded locale tree in place; returns the number of leaves it changed."""
+    current = data.get(patch.namespace)
+    before = flatten(current) if isinstance(current, dict) else {}
+    if patch.mode == 'replace' or not isinstance(current, dict):
+        data[patch.namespace] = copy.deepcopy(patch.body)
+    else:
+        deep_merge(data[patch.namespace], copy.deepcopy(patch.body))
+    after = flatten(data[patch.namespace])
+    return sum(1 for key in before.keys() | after.keys() if before.get(key) != after.get(key))
@@ -0,0 +1,67 @@
+"""Check that translations keep the ``{{placeholders}}`` of the source strings."""
+import re
+
+from .catalog import LOCALES_DIR, SOURCE_LOCALE, discover_locales, flatten, load_locale, locale_path
+from .usage import PLURAL_SUFFIXES, strip_plural
+
+PLACEHOLDER = re.compile(r'\{\{\s*-?\s*([^{}\s,]+)[^{}]*\}\}')
+# Singular-ish plural forms may spell the number out ("one order") instead of using {{count}}.
+COUNT_OPTIONAL = ('_zero', '_one', '_two')
+
+
+def extract(value):
+    """Placeholder names in ``value`` (``{{count}}``, ``{{ name }}``, ``{{date, datetime}}``)."""
+    if '{{' not in value:
+        return frozenset()
+    return frozenset(PLACEHOLDER.findall(value))
+
+
+def signatures(flat):
+    """Placeholder set of every string leaf, keyed by dotted key."""
+    return {key: extract(value) for key, value in flat.items() if isinstance(value, str)}
+
+
+def reference_for(key, source):
+    """The source key a translated key is checked against, accounting for plural forms
+    the source language does not have (``_few``, ``_many``, ...)."""
+    if key in source:
+        return key
+    base = strip_plural(key)
+    if base != key:
+        for suffix in ('_other',) + PLURAL_SUFFIXES:
+            if base + suffix in source:
+                return base + suffix
+        if base in source:
+            return base
+    return None
+
+
+def compare(source, target):
+    """Mismatches of ``target`` placeholder signatures against ``source``."""
+    problems = []
+    for key, found in target.items():
+        ref = reference_for(key, source)
+        if ref is None:
+            continue
+        expected = source[ref]
+        if found == expected:
+            continue
+        missing = expected - found
+        if 'count' in missing and key.endswith(COUNT_OPTIONAL):
+            missing = missing - {'count'}
+        unexpected = found - expected
+        if missing or unexpected:
+            problems.append({'key': key, 'missing': sorted(missing), 'unexpected': sorted(unexpected)})
+    return problems
+
+
+def check(root=LOCALES_DIR, locales=None, source_locale=SOURCE_LOCALE):
+    """Placeholder mismatches per locale against ``source_locale``."""
+    source = signatures(flatten(load_locale(locale_path(source_locale, root))))
+    results = {}
+    for lng in discover_locales(root):
+        if lng == source_locale or (locales is not None and lng not in locales):
+            continue
+        target = signatures(flatten(load_locale(locale_path(lng, root))))
+        results[lng] = compare(source, target)
+    return results
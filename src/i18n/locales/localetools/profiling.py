@@ -0,0 +1,91 @@
+"""Per-stage timing for ``apply --profile``.
+
+A ``Profiler`` records one event per stage (read, parse, validate, patch,
+write of each locale, plus the run-wide plan and save stages) with wall time,
+CPU time, tracemalloc allocations and the bytes the stage read or wrote.
+Events are plain dicts so worker processes can send theirs back inside the
+locale report. ``write_trace`` saves them in Chrome's trace event format
+(load it in chrome://tracing or Perfetto).
+"""
+import os
+import time
+import tracemalloc
+from contextlib import contextmanager, nullcontext
+
+from .catalog import write_json
+
+
+class Profiler:
+    def __init__(self, memory=True):
+        self.events = []
+        self.memory = memory
+        self._started_tracing = False
+
+    def __enter__(self):
+        if self.memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracing = True
+        return self
+
+    def __exit__(self, *exc):
+        if self._started_tracing:
+            tracemalloc.stop()
+            self._started_tracing = False
+
+    @contextmanager
+    def stage(self, name, locale=None):
+        """Time the enclosed block; the yielded event takes ``bytes_read``/``bytes_written``."""
+        event = {'stage': name, 'locale': locale, 'pid': os.getpid(), 'bytes_read': 0, 'bytes_written': 0}
+        tracing = tracemalloc.is_tracing()
+        if tracing:
+            before = tracemalloc.get_traced_memory()[0]
+            tracemalloc.reset_peak()
+        wall, cpu = time.perf_counter(), time.process_time()
+        try:
+            yield event
+        finally:
+            event['start'] = wall
+            event['wall'] = time.perf_counter() - wall
+            event['cpu'] = time.process_time() - cpu
+            if tracing:
+                current, peak = tracemalloc.get_traced_memory()
+                event['alloc_peak'] = max(peak - before, 0)
+                event['alloc_net'] = current - before
+            else:
+                event['alloc_peak'] = event['alloc_net'] = None
+            self.events.append(event)
+
+
+def stage(profiler, name, locale=None):
+    """``profiler.stage(...)``, or a no-op context yielding a throwaway event when not profiling."""
+    return profiler.stage(name, locale) if profiler else nullcontext({})
+
+
+def totals(events):
+    """Events summed per stage name, in first-seen order."""
+    summed = {}
+    for event in events:
+        entry = summed.setdefault(event['stage'], {'count': 0, 'wall': 0.0, 'cpu': 0.0, 'alloc_peak': None,
+                                                   'bytes_read': 0, 'bytes_written': 0})
+        entry['count'] += 1
+        for field in ('wall', 'cpu', 'bytes_read', 'bytes_written'):
+            entry[field] += event[field]
+        if event['alloc_peak'] is not None:
+            entry['alloc_peak'] = max(entry['alloc_peak'] or 0, event['alloc_peak'])
+    return summed
+
+
+def write_trace(events, path):
+    """Chrome trace JSON with one complete ("X") event per stage, a row per worker process."""
+    if not events:
+        write_json(path, {'traceEvents': []})
+        return
+    origin = min(event['start'] for event in events)
+    trace = []
+    for event in events:
+        args = {key: event[key] for key in ('cpu', 'alloc_peak', 'alloc_net', 'bytes_read', 'bytes_written')}
+        name = f"{event['stage']} {event['locale']}" if event['locale'] else event['stage']
+        trace.append({'name': name, 'cat': event['stage'], 'ph': 'X', 'pid': event['pid'], 'tid': event['pid'],
+                      'ts': round((event['start'] - origin) * 1e6, 1), 'dur': round(event['wall'] * 1e6, 1),
+                      'args': args})
+    write_json(path, {'traceEvents': trace, 'displayTimeUnit': 'ms'})
@@ -0,0 +1,58 @@
+"""Drop keys that no source file references from every locale."""
+import copy
+
+from .catalog import LOCALES_DIR, discover_locales, dumps, flatten, load_locale, locale_path, write_locale
+from .usage import load_index
+
+
+def remove_keys(tree, keys):
+    """Copy of ``tree`` without the dotted ``keys``; objects left empty are removed too."""
+    pruned = copy.deepcopy(tree)
+    for key in keys:
+        *parents, leaf = key.split('.')
+        trail = [pruned]
+        for part in parents:
+            trail.append(trail[-1][part])
+        del trail[-1][leaf]
+        for node, part in zip(reversed(trail[:-1]), reversed(parents)):
+            if node[part]:
+                break
+            del node[part]
+    return pruned
+
+
+def encoded_size(value):
+    return len(dumps(value).encode('utf-8'))
+
+
+def prune_locale(data, index):
+    """Pruned tree plus a report of removed keys and bytes saved per namespace."""
+    unused = index.unused(flatten(data))
+    pruned = remove_keys(data, unused)
+    namespaces = {}
+    for key in unused:
+        ns = key.partition('.')[0]
+        namespaces.setdefault(ns, {'keys': 0, 'bytes_saved': 0})['keys'] += 1
+    for ns, stats in namespaces.items():
+        stats['bytes_saved'] = encoded_size(data[ns]) - (encoded_size(pruned[ns]) if ns in pruned else 0)
+    report = {
+        'keys': len(unused),
+        'bytes_before': encoded_size(data),
+        'bytes_after': encoded_size(pruned),
+        'namespaces': dict(sorted(namespaces.items())),
+        'removed': unused,
+    }
+    return pruned, report
+
+
+def run(root=LOCALES_DIR, locales=None, write=False):
+    index = load_index(root)
+    reports = {}
+    for lng in discover_locales(root):
+        if locales is not None and lng not in locales:
+            continue
+        path = locale_path(lng, root)
+        pruned, reports[lng] = prune_locale(load_locale(path), index)
+        if write and reports[lng]['keys']:
+            write_locale(path, pruned)
+    return reports
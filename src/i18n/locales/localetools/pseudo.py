@@ -0,0 +1,77 @@
+"""Pseudo-locales generated from the source locale.
+
+``en-XA`` replaces letters with accented look-alikes, pads every string to a
+length factor and brackets it, so hard-coded strings, truncation and reflow
+show up before real translations exist. ``ar-XB`` keeps the text readable but
+forces it right-to-left with bidi overrides; its ``ar`` base language makes
+the layout switch to ``dir="rtl"``. ``{{placeholders}}``, ``$t()`` nesting
+and ``<tags>`` are copied unchanged and not counted towards the length.
+"""
+import re
+from pathlib import Path
+
+from .build import BUILD_DIR
+from .catalog import LOCALES_DIR, SOURCE_LOCALE, load_locale, locale_path, write_locale
+
+PSEUDO_DIR = BUILD_DIR / 'pseudo'
+ACCENTED = 'en-XA'
+MIRRORED = 'ar-XB'
+PROTECTED = re.compile(r'\{\{[^{}]*\}\}|\$t\([^)]*\)|</?[A-Za-z0-9]+>')
+ACCENTS = str.maketrans(
+    'abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ',
+    'åƀçđéƒĝĥîĵķļɱñöþǫŕšţûṽŵẋýžÅƁÇĐÉƑĜĤÎĴĶĻṀÑÖÞǪŔŠŢÛṼŴẊÝŽ',
+)
+PADDING = ' one two three four five six seven eight nine ten'
+RLO, PDF = '\u202e', '\u202c'  # right-to-left override, pop directional formatting
+
+
+def segments(value):
+    """Alternating (is_text, chunk) pairs; protected tokens have ``is_text`` False."""
+    pos = 0
+    for match in PROTECTED.finditer(value):
+        if match.start() > pos:
+            yield True, value[pos:match.start()]
+        yield False, match.group()
+        pos = match.end()
+    if pos < len(value):
+        yield True, value[pos:]
+
+
+def padding(length, factor):
+    extra = max(int(round(length * (factor - 1))), 0)
+    return (PADDING * (extra // len(PADDING) + 1))[:extra]
+
+
+def accent(value, factor=1.4):
+    """``[Šéţţîñĝš one two]``: accented text padded to ``factor`` times its length."""
+    parts = list(segments(value))
+    text_length = sum(len(chunk) for is_text, chunk in parts if is_text)
+    body = ''.join(chunk.translate(ACCENTS) if is_text else chunk for is_text, chunk in parts)
+    return f'[{body}{padding(text_length, factor)}]'
+
+
+def mirror(value, factor=1.0):
+    """Each text run forced right-to-left, so the whole string renders mirrored."""
+    parts = list(segments(value))
+    text_length = sum(len(chunk) for is_text, chunk in parts if is_text)
+    parts.append((True, padding(text_length, factor)))
+    return ''.join(f'{RLO}{chunk}{PDF}' if is_text and chunk.strip() else chunk for is_text, chunk in parts)
+
+
+def transform(tree, fn, factor):
+    return {key: transform(value, fn, factor) if isinstance(value, dict)
+            else fn(value, factor) if isinstance(value, str) else value
+            for key, value in tree.items()}
+
+
+def variants(factors=(1.4,), rtl_factor=1.0):
+    """(locale code, transform, factor) for every pseudo-locale to generate."""
+    found = [(ACCENTED if len(factors) == 1 else f'{ACCENTED}{round(f * 100)}', accent, f) for f in factors]
+    return found + [(MIRRORED, mirror, rtl_factor)]
+
+
+def generate(root=LOCALES_DIR, out_dir=PSEUDO_DIR, factors=(1.4,), rtl_factor=1.0):
+    """Write every pseudo-locale of the source locale; returns {code: written}."""
+    source = load_locale(locale_path(SOURCE_LOCALE, root))
+    return {code: write_locale(locale_path(code, Path(out_dir)), transform(source, fn, factor))
+            for code, fn, factor in variants(tuple(factors), rtl_factor)}
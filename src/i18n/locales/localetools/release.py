@@ -0,0 +1,157 @@
+"""Versioned locale releases and key-level deltas between them.
+
+``release`` snapshots every locale whose content changed since its last
+release into ``<out>/<lng>/<version>.json`` (compact JSON; the version is a
+hash of that content) and records it in ``<out>/releases.json``::
+
+    {"version": 1, "locales": {"ar": {"current": "3f9c…", "history": [
+        {"version": "3f9c…", "seq": 4, "created": "…", "keys": 2801, "bytes": 118525}, …]}}}
+
+For each of the last ``deltas`` earlier versions it writes
+``<out>/<lng>/delta/<from>..<to>.json``::
+
+    {"from": "…", "to": "…", "added": {"a.b": "…"}, "changed": {…}, "removed": ["c.d"]}
+
+so a client holding any recent version fetches one small document instead
+of the whole bundle; ``src/i18n/delta.js`` applies it. Only the newest
+``keep`` snapshots (and deltas between them) are kept.
+"""
+import json
+import time
+from pathlib import Path
+
+from .build import BUILD_DIR
+from .cache import digest
+from .catalog import (LOCALES_DIR, atomic_write, discover_locales, dumps_compact, flatten, load_locale,
+                      locale_path, write_json)
+
+RELEASES_DIR = BUILD_DIR / 'releases'
+MANIFEST_NAME = 'releases.json'
+VERSION_LENGTH = 12
+
+
+class ReleaseError(ValueError):
+    pass
+
+
+def content_version(encoded):
+    return digest(encoded)[:VERSION_LENGTH]
+
+
+def load_manifest(out_dir):
+    try:
+        with open(Path(out_dir) / MANIFEST_NAME, 'r', encoding='utf-8') as f:
+            manifest = json.load(f)
+    except (FileNotFoundError, ValueError):
+        manifest = {}
+    if manifest.get('version') != 1:
+        manifest = {'version': 1, 'locales': {}}
+    return manifest
+
+
+def snapshot_path(out_dir, lng, version):
+    return Path(out_dir) / lng / f'{version}.json'
+
+
+def delta_path(out_dir, lng, old, new):
+    return Path(out_dir) / lng / 'delta' / f'{old}..{new}.json'
+
+
+def load_snapshot(out_dir, lng, version):
+    try:
+        return flatten(load_locale(snapshot_path(out_dir, lng, version)))
+    except FileNotFoundError:
+        raise ReleaseError(f'{lng} snapshot {version} is missing from {out_dir}') from None
+
+
+def diff(old, new):
+    """Key-level changes turning flattened ``old`` into flattened ``new``."""
+    added = {key: value for key, value in new.items() if key not in old}
+    changed = {key: value for key, value in new.items() if key in old and old[key] != value}
+    removed = sorted(old.keys() - new.keys())
+    return {'added': added, 'changed': changed, 'removed': removed}
+
+
+def apply_delta(flat, delta):
+    """Inverse of ``diff`` on flattened maps; mirrors ``applyDelta`` in src/i18n/delta.js."""
+    removed = set(delta['removed'])
+    result = {key: value for key, value in flat.items() if key not in removed}
+    result.update(delta['added'])
+    result.update(delta['changed'])
+    return result
+
+
+def delta_document(out_dir, lng, old, new, new_flat):
+    return {'from': old, 'to': new, **diff(load_snapshot(out_dir, lng, old), new_flat)}
+
+
+def release_locale(data, lng, entry, out_dir, keep, deltas):
+    """Snapshot one locale if it changed and write deltas to it; returns (version, released, deltas written)."""
+    text = dumps_compact(data)
+    encoded = text.encode('utf-8')
+    version = content_version(encoded)
+    history = entry.setdefault('history', [])
+    if entry.get('current') == version:
+        return version, False, 0
+    # content reverted to a kept version: it moves to the front instead of appearing twice
+    history[:] = [item for item in history if item['version'] != version]
+    atomic_write(snapshot_path(out_dir, lng, version), [text])
+    flat = flatten(data)
+    written = 0
+    # deltas from versions about to be pruned would be deleted straight away
+    for previous in history[:min(deltas, keep - 1)]:
+        old = previous['version']
+        document = delta_document(out_dir, lng, old, version, flat)
+        atomic_write(delta_path(out_dir, lng, old, version), [dumps_compact(document)])
+        written += 1
+    seq = history[0]['seq'] + 1 if history else 1
+    history.insert(0, {'version': version, 'seq': seq, 'created': time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime()),
+                       'keys': len(flat), 'bytes': len(encoded)})
+    entry['current'] = version
+    prune(out_dir, lng, history, keep)
+    return version, True, written
+
+
+def prune(out_dir, lng, history, keep):
+    """Drop snapshots beyond the newest ``keep`` (never the current one) and every delta touching one."""
+    keep = max(keep, 1)
+    for old in history[keep:]:
+        snapshot_path(out_dir, lng, old['version']).unlink(missing_ok=True)
+    del history[keep:]
+    kept = {item['version'] for item in history}
+    delta_dir = Path(out_dir) / lng / 'delta'
+    if delta_dir.is_dir():
+        for path in delta_dir.glob('*.json'):
+            old, _, new = path.stem.partition('..')
+            if old not in kept or new not in kept:
+                path.unlink()
+
+
+def run(root=LOCALES_DIR, out_dir=RELEASES_DIR, locales=None, keep=10, deltas=5):
+    """Release every selected locale; returns the manifest and {lng: (version, released, deltas written)}."""
+    manifest = load_manifest(out_dir)
+    results = {}
+    for lng in discover_locales(root):
+        if locales is not None and lng not in locales:
+            continue
+        entry = manifest['locales'].setdefault(lng, {})
+        results[lng] = release_locale(load_locale(locale_path(lng, root)), lng, entry, out_dir, keep, deltas)
+    write_json(Path(out_dir) / MANIFEST_NAME, manifest)
+    return manifest, results
+
+
+def resolve(manifest, lng, ref):
+    """A version from a full or abbreviated hash, ``@seq``, or ``current``."""
+    history = manifest['locales'].get(lng, {}).get('history', [])
+    if ref == 'current' and history:
+        return history[0]['version']
+    for item in history:
+        if ref.startswith('@') and str(item['seq']) == ref[1:] or item['version'].startswith(ref):
+            return item['version']
+    raise ReleaseError(f'{lng} has no kept release {ref!r}')
+
+
+def delta_between(out_dir, lng, old, new):
+    """Delta between any two kept versions, computed from their snapshots."""
+    return {'from': old, 'to': new, **diff(load_snapshot(out_dir, lng, old), load_snapshot(out_dir, lng, new))}
+
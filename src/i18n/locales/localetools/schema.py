@@ -0,0 +1,155 @@
+"""Key manifest, JSON Schema and TypeScript declarations generated from en.json.
+
+``generate`` writes three files to ``build/i18n/types``:
+
+* ``keys.json``          – every key path with its placeholder names,
+* ``locale.schema.json`` – a JSON Schema any locale file can be validated
+  against (editors, ajv): unknown keys are rejected, every string must keep
+  the placeholders of its English source, and plural groups accept every
+  CLDR suffix so translations may add ``_few``/``_many`` forms,
+* ``keys.d.ts``          – a ``TranslationKey`` union, the interpolation
+  values of each key and an i18next ``CustomTypeOptions`` augmentation.
+
+All three record the SHA-256 of en.json and are skipped when it is
+unchanged.
+"""
+import json
+import re
+from pathlib import Path
+
+from .build import BUILD_DIR
+from .cache import digest
+from .catalog import LOCALES_DIR, SOURCE_LOCALE, atomic_write, flatten, locale_path, write_json
+from .placeholders import extract
+from .usage import PLURAL_SUFFIXES, strip_plural
+
+TYPES_DIR = BUILD_DIR / 'types'
+MANIFEST_NAME = 'keys.json'
+SCHEMA_NAME = 'locale.schema.json'
+DECLARATIONS_NAME = 'keys.d.ts'
+PLURAL_GROUP = '(' + '|'.join(suffix[1:] for suffix in PLURAL_SUFFIXES) + ')'
+
+
+def placeholder_pattern(names):
+    """ECMAScript regex requiring every ``{{name}}`` in ``names``, or None."""
+    if not names:
+        return None
+    lookaheads = ''.join(r'(?=[\s\S]*\{\{\s*-?\s*' + re.escape(name) + r'\s*(,[^{}]*)?\}\})'
+                         for name in sorted(names))
+    return f'^{lookaheads}'
+
+
+def string_schema(names):
+    schema = {'type': 'string'}
+    pattern = placeholder_pattern(names)
+    if pattern:
+        schema['pattern'] = pattern
+    return schema
+
+
+def object_schema(tree):
+    properties, plurals = {}, {}
+    for key, value in tree.items():
+        if isinstance(value, dict):
+            properties[key] = object_schema(value)
+            continue
+        base = strip_plural(key)
+        if base != key:
+            # a group's pattern requires what every English form has in common, except
+            # {{count}}, which forms like _one may spell out
+            names = extract(value) - {'count'}
+            plurals[base] = names if base not in plurals else plurals[base] & names
+        else:
+            properties[key] = string_schema(extract(value))
+    schema = {'type': 'object', 'properties': properties, 'additionalProperties': False}
+    if plurals:
+        schema['patternProperties'] = {
+            f'^{re.escape(base)}_{PLURAL_GROUP}$': string_schema(names)
+            for base, names in sorted(plurals.items())
+        }
+    return schema
+
+
+def json_schema(data, sha):
+    schema = object_schema(data)
+    return {
+        '$schema': 'https://json-schema.org/draft/2020-12/schema',
+        '$comment': f'Generated by update_translations.py types from {SOURCE_LOCALE}.json (sha256 {sha})',
+        'title': 'Locale file',
+        **schema,
+    }
+
+
+def key_manifest(flat):
+    """Every callable key with its placeholders; plural groups also list their base key with ``count``."""
+    keys = {}
+    for key, value in flat.items():
+        names = set(extract(value)) if isinstance(value, str) else set()
+        keys[key] = names
+        base = strip_plural(key)
+        if base != key:
+            keys[base] = keys.get(base, set()) | names | {'count'}
+    return {key: sorted(names) for key, names in sorted(keys.items())}
+
+
+def ts_object(tree, indent='  '):
+    lines = ['{']
+    for key, value in tree.items():
+        kind = ts_object(value, indent + '  ') if isinstance(value, dict) else 'string'
+        lines.append(f'{indent}{json.dumps(key, ensure_ascii=False)}: {kind};')
+    lines.append(indent[:-2] + '}')
+    return '\n'.join(lines)
+
+
+def ts_params(names):
+    if not names:
+        return 'Record<string, never>'
+    fields = ' '.join(f"{json.dumps(name)}: {'number' if name == 'count' else 'string | number'};"
+                      for name in names)
+    return '{ ' + fields + ' }'
+
+
+def declarations(data, keys, sha):
+    lines = [
+        f'// Generated by `update_translations.py types` from {SOURCE_LOCALE}.json (sha256 {sha}). Do not edit.',
+        '',
+        '/** Every key that resolves to a string, including the base key of plural groups */',
+        'export type TranslationKey =',
+    ]
+    lines += [f'  | {json.dumps(key, ensure_ascii=False)}' for key in keys]
+    lines[-1] += ';'
+    lines += ['', '/** Interpolation values each key expects */', 'export interface TranslationParams {']
+    lines += [f'  {json.dumps(key, ensure_ascii=False)}: {ts_params(names)};' for key, names in keys.items()]
+    lines += ['}', '', 'export interface TranslationResources ' + ts_object(data), '',
+              "declare module 'i18next' {",
+              '  interface CustomTypeOptions {',
+              "    defaultNS: 'translation';",
+              '    resources: { translation: TranslationResources };',
+              '  }',
+              '}', '']
+    return '\n'.join(lines)
+
+
+def generated_from(out_dir):
+    try:
+        with open(Path(out_dir) / MANIFEST_NAME, 'r', encoding='utf-8') as f:
+            return json.load(f).get('source_sha256')
+    except (FileNotFoundError, ValueError):
+        return None
+
+
+def generate(root=LOCALES_DIR, out_dir=TYPES_DIR, force=False):
+    """Write the manifest, schema and declarations; returns False when en.json is unchanged."""
+    out_dir = Path(out_dir)
+    raw = locale_path(SOURCE_LOCALE, root).read_bytes()
+    sha = digest(raw)
+    outputs = (MANIFEST_NAME, SCHEMA_NAME, DECLARATIONS_NAME)
+    if not force and generated_from(out_dir) == sha and all((out_dir / name).exists() for name in outputs):
+        return False
+    data = json.loads(raw.decode('utf-8'))
+    keys = key_manifest(flatten(data))
+    write_json(out_dir / SCHEMA_NAME, json_schema(data, sha))
+    atomic_write(out_dir / DECLARATIONS_NAME, [declarations(data, keys, sha)])
+    # the manifest carries the hash the others are checked against, so it goes last
+    write_json(out_dir / MANIFEST_NAME, {'source_sha256': sha, 'keys': keys})
+    return True
@@ -0,0 +1,168 @@
+"""Full-text search over every locale's values, linked to source call sites.
+
+Values are folded before tokenizing: NFKC, case-folded, Latin accents and
+Arabic diacritics/tatweel removed, alef/yeh/teh marbuta variants unified and
+``{{placeholders}}`` dropped, so a string quoted from a screenshot or a
+support ticket matches whatever spelling the locale file uses. Each locale
+contributes an inverted index token -> key ids; a query matches a key when
+one value contains every query token (the last one as a prefix). Values are
+read from the memory-mapped catalogs of indexed.py and call sites from the
+usage index.
+
+The index is kept in ``.cache/search.json`` and only locales whose size or
+mtime changed are re-tokenized.
+"""
+import bisect
+import json
+import re
+import unicodedata
+from collections import defaultdict
+
+from .cache import cache_dir
+from .catalog import LOCALES_DIR, discover_locales, flatten, load_locale, locale_path, write_json
+from .indexed import open_catalog
+
+INDEX_VERSION = 1
+PLACEHOLDER = re.compile(r'\{\{[^{}]*\}\}|\$t\([^)]*\)|</?[A-Za-z0-9]+>')
+# runs of anything but whitespace and ASCII/Latin-1/Arabic/Devanagari/general punctuation
+TOKEN = re.compile(r'[^\s!-/:-@\[-`{-~\u00a1-\u00bf\u060c\u061b\u061f\u066a-\u066d\u06d4'
+                   r'\u0964\u0965\u2000-\u206f\u3000-\u303f]+')
+LATIN_MARKS = re.compile(r'[\u0300-\u036f]')
+# harakat, Quranic marks, superscript alef and tatweel
+ARABIC_MARKS = re.compile(r'[\u0610-\u061a\u064b-\u065f\u0670\u06d6-\u06ed\u0640]')
+ARABIC_LETTERS = str.maketrans({'أ': 'ا', 'إ': 'ا', 'آ': 'ا', 'ٱ': 'ا',
+                                'ى': 'ي', 'ة': 'ه', 'ؤ': 'و', 'ئ': 'ي'})
+
+
+def index_path(root=LOCALES_DIR):
+    return cache_dir(root) / 'search.json'
+
+
+def fold(text):
+    """Normalized form used for both indexing and queries."""
+    text = unicodedata.normalize('NFKD', PLACEHOLDER.sub(' ', text).casefold())
+    text = LATIN_MARKS.sub('', text)
+    text = ARABIC_MARKS.sub('', unicodedata.normalize('NFKC', text))
+    return text.translate(ARABIC_LETTERS)
+
+
+def tokens(text):
+    return TOKEN.findall(fold(text))
+
+
+def index_locale(data):
+    """(keys, {token: [key ids]}) for one locale tree."""
+    keys = []
+    postings = defaultdict(list)
+    for key, value in flatten(data).items():
+        if not isinstance(value, str):
+            continue
+        key_id = len(keys)
+        keys.append(key)
+        for token in set(tokens(value)):
+            postings[token].append(key_id)
+    return keys, dict(postings)
+
+
+class SearchIndex:
+    """Persistent token -> (locale, key) index over the locale files."""
+
+    def __init__(self, locales=None, root=LOCALES_DIR):
+        self.root = root
+        self.locales = locales or {}
+        self._aggregate()
+
+    @classmethod
+    def load(cls, path, root=LOCALES_DIR):
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (FileNotFoundError, ValueError):
+            data = {}
+        if data.get('version') != INDEX_VERSION:
+            data = {}
+        return cls(data.get('locales'), root)
+
+    def save(self, path):
+        write_json(path, {'version': INDEX_VERSION, 'locales': self.locales}, compact=True)
+
+    def refresh(self):
+        """Re-tokenize new or modified locales and drop deleted ones; returns the number changed."""
+        available = discover_locales(self.root)
+        changed = 0
+        for lng in available:
+            path = locale_path(lng, self.root)
+            stat = path.stat()
+            entry = self.locales.get(lng)
+            if entry and entry['mtime_ns'] == stat.st_mtime_ns and entry['size'] == stat.st_size:
+                continue
+            keys, postings = index_locale(load_locale(path))
+            self.locales[lng] = {'mtime_ns': stat.st_mtime_ns, 'size': stat.st_size, 'keys': keys,
+                                 'tokens': postings}
+            changed += 1
+        removed = self.locales.keys() - set(available)
+        for lng in removed:
+            del self.locales[lng]
+        if changed or removed:
+            self._aggregate()
+        return changed + len(removed)
+
+    def _aggregate(self):
+        self.vocabulary = sorted({token for entry in self.locales.values() for token in entry['tokens']})
+
+    def _expand(self, prefix):
+        """Vocabulary tokens starting with ``prefix``."""
+        start = bisect.bisect_left(self.vocabulary, prefix)
+        end = bisect.bisect_left(self.vocabulary, prefix + '\U0010ffff')
+        return self.vocabulary[start:end]
+
+    def matches(self, query, locales=None):
+        """{key: [locales whose value contains every query token]}."""
+        words = tokens(query)
+        if not words:
+            return {}
+        *exact, last = words
+        completions = self._expand(last)
+        found = defaultdict(list)
+        for lng, entry in sorted(self.locales.items()):
+            if locales is not None and lng not in locales:
+                continue
+            postings = entry['tokens']
+            ids = set()
+            for token in completions:
+                ids.update(postings.get(token, ()))
+            for word in exact:
+                if not ids:
+                    break
+                ids.intersection_update(postings.get(word, ()))
+            for key_id in ids:
+                found[entry['keys'][key_id]].append(lng)
+        return found
+
+    def search(self, query, locales=None, limit=20):
+        """Ranked hits: whole-value matches first, then phrase matches, then token matches."""
+        found = self.matches(query, locales)
+        folded = ' '.join(tokens(query))
+        values = {}
+        ranked = []
+        for key, hit_locales in found.items():
+            rank = 0
+            for lng in hit_locales:
+                if lng not in values:
+                    values[lng] = open_catalog(lng, self.root)
+                text = ' '.join(tokens(values[lng].get(key) or ''))
+                rank = max(rank, 2 if text == folded else 1 if folded in text else 0)
+            ranked.append((-rank, -len(hit_locales), key, hit_locales))
+        for catalog in values.values():
+            catalog.close()
+        ranked.sort()
+        return [{'key': key, 'locales': hit_locales} for _, _, key, hit_locales in ranked[:limit]]
+
+
+def load_index(root=LOCALES_DIR):
+    """Load the persisted index, bring it up to date and save it if anything changed."""
+    path = index_path(root)
+    index = SearchIndex.load(path, root)
+    if index.refresh() or not path.exists():
+        index.save(path)
+    return index
@@ -0,0 +1,55 @@
+"""Split each locale into one compact file per top-level namespace.
+
+Produces ``<out>/<lng>/<namespace>.json`` plus ``<out>/namespaces.json``::
+
+    {"version": 1, "locales": {"en": {"common": {"file": "en/common.json",
+                                                 "hash": "…", "bytes": 1234}}}}
+
+so the frontend can fetch only the active language and the namespaces a page
+needs, and use the hash for cache busting. Files whose bytes are unchanged
+are left alone.
+"""
+import json
+from pathlib import Path
+
+from .cache import digest
+from .catalog import (LOCALES_DIR, atomic_write, discover_locales, dumps_compact, load_locale, locale_path,
+                      write_json)
+
+MANIFEST_NAME = 'namespaces.json'
+
+
+def split_locale(data, lng, out_dir):
+    """Write the namespace files of one locale; returns (entries, files written)."""
+    target = Path(out_dir) / lng
+    entries = {}
+    written = 0
+    for ns, value in data.items():
+        text = dumps_compact(value)
+        written += atomic_write(target / f'{ns}.json', [text])
+        encoded = text.encode('utf-8')
+        entries[ns] = {'file': f'{lng}/{ns}.json', 'hash': digest(encoded)[:16], 'bytes': len(encoded)}
+    if target.is_dir():
+        for stale in target.glob('*.json'):
+            if stale.stem not in data:
+                stale.unlink()
+    return entries, written
+
+
+def run(root=LOCALES_DIR, out_dir=None, locales=None):
+    out_dir = Path(out_dir or root)
+    manifest_file = out_dir / MANIFEST_NAME
+    try:
+        with open(manifest_file, 'r', encoding='utf-8') as f:
+            manifest = json.load(f)
+    except FileNotFoundError:
+        manifest = {'version': 1, 'locales': {}}
+
+    written = {}
+    for lng in discover_locales(root):
+        if locales is not None and lng not in locales:
+            continue
+        entries, written[lng] = split_locale(load_locale(locale_path(lng, root)), lng, out_dir)
+        manifest['locales'][lng] = entries
+    write_json(manifest_file, manifest)
+    return manifest, written
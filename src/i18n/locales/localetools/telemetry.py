@@ -0,0 +1,203 @@
+"""Production key-hit counts and the hot/cold bundle tiers built from them.
+
+Hit logs are newline-delimited JSON, one object per event or per batch::
+
+    {"lng": "ar", "key": "orders.status.pending", "count": 3}
+    {"lng": "en", "hits": {"common.save": 12, "dispatch.popup.active_orders_other": 4}}
+
+Logs are streamed line by line. Counts live in one ``array('I')`` per locale
+indexed by the position of the key in the sorted list of all catalog keys,
+so memory depends on the catalog size, not the log size. Keys that are not
+in the catalog are only totalled (plus a capped sample for the report).
+``.cache/telemetry.json`` keeps the counters and how far each log has been
+read, so re-ingesting an append-only log only reads the new lines.
+
+``tiers`` splits each locale into ``<out>/<lng>.json`` (the hot keys that
+cover the requested share of hits, with all plural forms of a hot key) and
+cold chunks ``<out>/<lng>/<namespace>.json`` in the layout split.py uses,
+plus ``<out>/tiers.json`` describing both.
+"""
+import json
+from array import array
+from pathlib import Path
+
+from .build import BUILD_DIR
+from .cache import cache_dir, digest
+from .catalog import (LOCALES_DIR, atomic_write, discover_locales, dumps_compact, flatten,
+                      load_locale, locale_path, unflatten, write_json)
+from .split import split_locale
+from .usage import strip_plural
+
+STATE_VERSION = 1
+TIERS_DIR = BUILD_DIR / 'tiers'
+UNKNOWN_SAMPLE = 200
+# below this many hits a locale is ranked by the hits of all locales together
+MIN_LOCALE_HITS = 1000
+
+
+def state_path(root=LOCALES_DIR):
+    return cache_dir(root) / 'telemetry.json'
+
+
+def events(obj):
+    """(lng, key, count) triples of one decoded log line."""
+    lng = obj.get('lng') or obj.get('locale')
+    if not isinstance(lng, str):
+        return
+    if isinstance(obj.get('hits'), dict):
+        for key, count in obj['hits'].items():
+            if isinstance(count, int) and count > 0:
+                yield lng, key, count
+    elif isinstance(obj.get('key'), str):
+        count = obj.get('count', 1)
+        if isinstance(count, int) and count > 0:
+            yield lng, obj['key'], count
+
+
+class HitCounter:
+    """Per-locale hit counts over a fixed key list."""
+
+    def __init__(self, keys):
+        self.keys = keys
+        self.ids = {key: i for i, key in enumerate(keys)}
+        self.counts = {}
+        self.unknown = 0
+        self.unknown_sample = {}
+        self.offsets = {}
+        self.malformed = 0
+
+    @classmethod
+    def for_catalog(cls, root=LOCALES_DIR):
+        """A counter over every key of every locale (translations may have extra plural forms)."""
+        keys = set()
+        for lng in discover_locales(root):
+            keys.update(flatten(load_locale(locale_path(lng, root))))
+        return cls(sorted(keys))
+
+    @classmethod
+    def load(cls, path, keys):
+        counter = cls(keys)
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                state = json.load(f)
+        except (FileNotFoundError, ValueError):
+            return counter
+        if state.get('version') != STATE_VERSION:
+            return counter
+        for lng, counts in state['counts'].items():
+            for key, count in zip(state['keys'], counts):
+                if count:
+                    counter.add(lng, key, count)
+        counter.unknown += state['unknown']
+        counter.unknown_sample.update(state['unknown_sample'])
+        counter.offsets = state['offsets']
+        counter.malformed = state['malformed']
+        return counter
+
+    def save(self, path):
+        write_json(path, {
+            'version': STATE_VERSION, 'keys': self.keys,
+            'counts': {lng: counts.tolist() for lng, counts in sorted(self.counts.items())},
+            'unknown': self.unknown, 'unknown_sample': self.unknown_sample,
+            'offsets': self.offsets, 'malformed': self.malformed,
+        }, compact=True)
+
+    def add(self, lng, key, count=1):
+        key_id = self.ids.get(key)
+        if key_id is None:
+            self.unknown += count
+            if key in self.unknown_sample or len(self.unknown_sample) < UNKNOWN_SAMPLE:
+                self.unknown_sample[key] = self.unknown_sample.get(key, 0) + count
+            return
+        counts = self.counts.get(lng)
+        if counts is None:
+            counts = self.counts[lng] = array('I', bytes(4 * len(self.keys)))
+        counts[key_id] = min(counts[key_id] + count, 0xFFFFFFFF)
+
+    def ingest(self, path):
+        """Count the complete lines of ``path`` not read before; returns the number of events."""
+        path = Path(path)
+        name = str(path.resolve())
+        start = self.offsets.get(name, 0)
+        if path.stat().st_size < start:  # truncated or rotated: read it again from the top
+            start = 0
+        seen = 0
+        with open(path, 'rb') as f:
+            f.seek(start)
+            for line in f:
+                if not line.endswith(b'\n'):
+                    break  # a writer is still appending this line
+                start += len(line)
+                if not line.strip():
+                    continue
+                try:
+                    obj = json.loads(line)
+                except ValueError:
+                    self.malformed += 1
+                    continue
+                if not isinstance(obj, dict):
+                    self.malformed += 1
+                    continue
+                for lng, key, count in events(obj):
+                    self.add(lng, key, count)
+                    seen += 1
+        self.offsets[name] = start
+        return seen
+
+    def totals(self):
+        """Hits per key summed over every locale."""
+        summed = array('Q', bytes(8 * len(self.keys)))
+        for counts in self.counts.values():
+            for i, count in enumerate(counts):
+                summed[i] += count
+        return summed
+
+    def ranking(self, lng):
+        """Counts used to rank ``lng``'s keys: its own, or every locale's when it has too few hits."""
+        counts = self.counts.get(lng)
+        if counts is not None and sum(counts) >= MIN_LOCALE_HITS:
+            return counts
+        return self.totals()
+
+
+def load_counter(root=LOCALES_DIR):
+    return HitCounter.load(state_path(root), HitCounter.for_catalog(root).keys)
+
+
+def hot_keys(counter, lng, coverage=0.95):
+    """Most-hit keys of ``lng`` covering ``coverage`` of its hits, widened to whole plural groups."""
+    counts = counter.ranking(lng)
+    total = sum(counts)
+    hot = set()
+    if total:
+        covered = 0
+        for count, key_id in sorted(((c, i) for i, c in enumerate(counts) if c), reverse=True):
+            if covered >= coverage * total:
+                break
+            hot.add(strip_plural(counter.keys[key_id]))
+            covered += count
+    return hot
+
+
+def tiers(root=LOCALES_DIR, out_dir=TIERS_DIR, counter=None, coverage=0.95, locales=None):
+    """Write the core bundle and cold namespace chunks of every selected locale; returns the manifest."""
+    counter = counter or load_counter(root)
+    out_dir = Path(out_dir)
+    manifest = {'version': 1, 'coverage': coverage, 'locales': {}}
+    for lng in discover_locales(root):
+        if locales is not None and lng not in locales:
+            continue
+        hot = hot_keys(counter, lng, coverage)
+        flat = flatten(load_locale(locale_path(lng, root)))
+        core = {key: value for key, value in flat.items() if strip_plural(key) in hot}
+        cold = {key: value for key, value in flat.items() if key not in core}
+        text = dumps_compact(unflatten(core))
+        atomic_write(out_dir / f'{lng}.json', [text])
+        encoded = text.encode('utf-8')
+        chunks, _ = split_locale(unflatten(cold), lng, out_dir)
+        manifest['locales'][lng] = {
+            'core': {'file': f'{lng}.json', 'hash': digest(encoded)[:16], 'bytes': len(encoded), 'keys': len(core)},
+            'chunks': chunks,
+        }
+    write_json(out_dir / 'tiers.json', manifest)
+    return manifest
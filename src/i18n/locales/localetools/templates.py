@@ -0,0 +1,113 @@
+"""Precompiled interpolation templates and plural-form validation.
+
+``compile_locale`` turns every string with ``{{placeholders}}`` into a segment
+array so the runtime never scans strings::
+
+    "Showing {{from}}–{{to}}"  ->  ["Showing ", ["from"], "–", ["to"]]
+
+Literals stay strings; a placeholder is ``[name]`` or ``[name, format]``.
+Strings without placeholders are kept as they are. The compiled bundle is
+``{"v": 1, "lng": ..., "t": tree}`` and is read by
+``src/i18n/compiled.js``.
+
+Plural groups (``key_one``, ``key_other``, ...) are checked against the
+language's CLDR cardinal categories. ``_zero`` is accepted in every language
+because i18next uses it for a count of 0 even where CLDR has no zero form.
+"""
+import re
+from pathlib import Path
+
+from .build import BUILD_DIR
+from .catalog import LOCALES_DIR, discover_locales, flatten, load_locale, locale_path, write_json
+from .placeholders import extract
+from .usage import PLURAL_SUFFIXES, strip_plural
+
+FORMAT_VERSION = 1
+COMPILED_DIR = BUILD_DIR / 'compiled'
+TOKEN = re.compile(r'\{\{\s*-?\s*([^{}\s,]+)\s*(?:,\s*([^{}]*?))?\s*\}\}')
+
+# CLDR 44 cardinal plural categories, by base language
+PLURAL_CATEGORIES = {
+    'af': ('one', 'other'), 'ar': ('zero', 'one', 'two', 'few', 'many', 'other'), 'bn': ('one', 'other'),
+    'de': ('one', 'other'), 'en': ('one', 'other'), 'es': ('one', 'many', 'other'), 'fa': ('one', 'other'),
+    'fil': ('one', 'other'), 'fr': ('one', 'many', 'other'), 'he': ('one', 'two', 'other'),
+    'hi': ('one', 'other'), 'id': ('other',), 'it': ('one', 'many', 'other'), 'ja': ('other',),
+    'ko': ('other',), 'ms': ('other',), 'nl': ('one', 'other'), 'pl': ('one', 'few', 'many', 'other'),
+    'pt': ('one', 'many', 'other'), 'ru': ('one', 'few', 'many', 'other'), 'sv': ('one', 'other'),
+    'th': ('other',), 'tl': ('one', 'other'), 'tr': ('one', 'other'), 'uk': ('one', 'few', 'many', 'other'),
+    'ur': ('one', 'other'), 'vi': ('other',), 'zh': ('other',),
+}
+
+
+def plural_categories(lng):
+    """CLDR categories for ``lng`` (by base language), or None if unknown."""
+    return PLURAL_CATEGORIES.get(lng.split('-')[0].lower())
+
+
+def tokenize(value):
+    """Segment array of ``value``, or ``value`` itself when it has no placeholders."""
+    if '{{' not in value:
+        return value
+    segments = []
+    pos = 0
+    for match in TOKEN.finditer(value):
+        if match.start() > pos:
+            segments.append(value[pos:match.start()])
+        name, fmt = match.groups()
+        segments.append([name, fmt] if fmt else [name])
+        pos = match.end()
+    if pos < len(value):
+        segments.append(value[pos:])
+    return segments if any(isinstance(s, list) for s in segments) else value
+
+
+def compile_tree(tree):
+    return {key: compile_tree(value) if isinstance(value, dict)
+            else tokenize(value) if isinstance(value, str) else value
+            for key, value in tree.items()}
+
+
+def plural_groups(flat):
+    """{base key: set of suffixes} for keys that form a plural group (have ``_other`` or use ``{{count}}``)."""
+    groups = {}
+    for key, value in flat.items():
+        base = strip_plural(key)
+        if base != key:
+            groups.setdefault(base, {})[key[len(base):]] = value
+    return {base: set(forms) for base, forms in groups.items()
+            if '_other' in forms or any(isinstance(v, str) and 'count' in extract(v) for v in forms.values())}
+
+
+def check_plurals(flat, lng):
+    """Missing and unexpected plural forms of every plural group in a flattened locale."""
+    categories = plural_categories(lng)
+    if categories is None:
+        return {'unknown_language': True, 'missing': {}, 'unexpected': {}}
+    allowed = {f'_{c}' for c in categories} | {'_zero'}
+    required = {f'_{c}' for c in categories}
+    missing, unexpected = {}, {}
+    for base, forms in sorted(plural_groups(flat).items()):
+        if required - forms:
+            missing[base] = sorted(required - forms, key=PLURAL_SUFFIXES.index)
+        if forms - allowed:
+            unexpected[base] = sorted(forms - allowed, key=PLURAL_SUFFIXES.index)
+    return {'unknown_language': False, 'missing': missing, 'unexpected': unexpected}
+
+
+def compile_locale(data, lng):
+    return {'v': FORMAT_VERSION, 'lng': lng, 't': compile_tree(data)}
+
+
+def run(root=LOCALES_DIR, out_dir=COMPILED_DIR, locales=None):
+    """Compile every selected locale to ``<out>/<lng>.json``; returns a report per locale."""
+    report = {}
+    for lng in discover_locales(root):
+        if locales is not None and lng not in locales:
+            continue
+        data = load_locale(locale_path(lng, root))
+        flat = flatten(data)
+        entry = check_plurals(flat, lng)
+        entry['templates'] = sum(1 for value in flat.values() if isinstance(value, str) and TOKEN.search(value))
+        entry['written'] = write_json(Path(out_dir) / f'{lng}.json', compile_locale(data, lng), compact=True)
+        report[lng] = entry
+    return report
@@ -0,0 +1,167 @@
+"""Index of which translation keys the source tree references.
+
+One pass over the JS/JSX under ``src/`` records, per file:
+
+* ``keys``     – literal ``t('ns.key')`` / ``t(`ns.key`)`` calls,
+* ``patterns`` – the static prefix of template calls such as
+  ``t(`orders.status.${s}`)`` or ``t('orders.status.' + s)`` (``orders.status.``),
+* ``literals`` – other quoted dotted strings (``labelKey: 'common.orders'``)
+  that may be passed to ``t`` indirectly.
+
+The index is kept in ``.cache/usage.json`` and only files whose mtime or size
+changed are rescanned.
+"""
+import json
+import os
+import re
+from collections import defaultdict
+from pathlib import Path
+
+from .cache import cache_dir
+from .catalog import LOCALES_DIR, write_json
+
+SRC_DIR = LOCALES_DIR.parent.parent
+SOURCE_SUFFIXES = ('.js', '.jsx', '.ts', '.tsx')
+SKIP_DIRS = {'assets', 'i18n', 'node_modules'}
+INDEX_VERSION = 2
+PLURAL_SUFFIXES = ('_zero', '_one', '_two', '_few', '_many', '_other')
+
+CALL = re.compile(r"""\bt\(\s*(?:'([^'\\\n]+)'|"([^"\\\n]+)"|`([^`\\\n]*)`)""")
+DOTTED = re.compile(r"""['"]([A-Za-z_][\w-]*(?:\.[\w-]+)+)['"]""")
+
+
+def index_path(root=LOCALES_DIR):
+    return cache_dir(root) / 'usage.json'
+
+
+def scan_text(text):
+    """Keys, dynamic prefixes and dotted literals in one source file, with line numbers."""
+    keys, patterns, literals = defaultdict(list), defaultdict(list), defaultdict(list)
+    for lineno, line in enumerate(text.splitlines(), 1):
+        if 't(' in line:
+            for match in CALL.finditer(line):
+                key = match.group(1) or match.group(2)
+                template = match.group(3)
+                if template is not None:
+                    prefix, dynamic, _ = template.partition('${')
+                    if not dynamic:
+                        key = template
+                    elif prefix:
+                        patterns[prefix].append(lineno)
+                if key and line[match.end():].lstrip().startswith('+'):  # t('orders.status.' + s)
+                    patterns[key].append(lineno)
+                elif key:
+                    keys[key].append(lineno)
+        if '.' in line:
+            for match in DOTTED.finditer(line):
+                literals[match.group(1)].append(lineno)
+    return {'keys': dict(keys), 'patterns': dict(patterns), 'literals': dict(literals)}
+
+
+def source_files(src=SRC_DIR):
+    for dirpath, dirnames, filenames in os.walk(src):
+        dirnames[:] = sorted(d for d in dirnames if d not in SKIP_DIRS)
+        for name in sorted(filenames):
+            if name.endswith(SOURCE_SUFFIXES):
+                yield Path(dirpath) / name
+
+
+class UsageIndex:
+    """Persistent key -> call-site index over the source tree."""
+
+    def __init__(self, files=None, src=SRC_DIR):
+        self.src = Path(src)
+        self.files = files or {}
+        self._aggregate()
+
+    @classmethod
+    def load(cls, path, src=SRC_DIR):
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (FileNotFoundError, ValueError):
+            data = {}
+        if data.get('version') != INDEX_VERSION or data.get('src') != str(src):
+            data = {}
+        return cls(data.get('files'), src)
+
+    def save(self, path):
+        write_json(path, {'version': INDEX_VERSION, 'src': str(self.src), 'files': self.files}, compact=True)
+
+    def refresh(self):
+        """Rescan new or modified files and drop deleted ones; returns the number rescanned."""
+        seen = set()
+        rescanned = 0
+        for path in source_files(self.src):
+            rel = path.relative_to(self.src).as_posix()
+            seen.add(rel)
+            stat = path.stat()
+            entry = self.files.get(rel)
+            if entry and entry['mtime_ns'] == stat.st_mtime_ns and entry['size'] == stat.st_size:
+                continue
+            scanned = scan_text(path.read_text(encoding='utf-8', errors='replace'))
+            self.files[rel] = {'mtime_ns': stat.st_mtime_ns, 'size': stat.st_size, **scanned}
+            rescanned += 1
+        removed = self.files.keys() - seen
+        for rel in removed:
+            del self.files[rel]
+        if rescanned or removed:
+            self._aggregate()
+        return rescanned + len(removed)
+
+    def _aggregate(self):
+        self.keys = defaultdict(list)
+        self.literals = set()
+        prefixes = set()
+        for rel, entry in self.files.items():
+            for key, lines in entry['keys'].items():
+                self.keys[key].extend((rel, line) for line in lines)
+            prefixes.update(entry['patterns'])
+            self.literals.update(entry['literals'])
+        self.prefixes = tuple(sorted(prefixes))
+
+    def where(self, key):
+        """Call sites of ``key`` as (file, line) pairs."""
+        return sorted(self.keys.get(key, ()))
+
+    def is_used(self, key):
+        """True when ``key``, its plural base or a parent object is referenced, or a prefix matches it."""
+        base = strip_plural(key)
+        if base in self.keys or base in self.literals or key in self.keys or key in self.literals:
+            return True
+        if key.startswith(self.prefixes):
+            return True
+        parent = key.rpartition('.')[0]
+        while parent:
+            if parent in self.keys:
+                return True
+            parent = parent.rpartition('.')[0]
+        return False
+
+    def unused(self, flat_keys):
+        return sorted(key for key in flat_keys if not self.is_used(key))
+
+    def missing(self, flat_keys):
+        """Literal ``t()`` keys that resolve to nothing in ``flat_keys``."""
+        known = set()
+        for key in flat_keys:
+            known.add(strip_plural(key))
+            parts = key.split('.')
+            known.update('.'.join(parts[:i]) for i in range(1, len(parts) + 1))
+        return sorted(key for key in self.keys if key not in known)
+
+
+def strip_plural(key):
+    for suffix in PLURAL_SUFFIXES:
+        if key.endswith(suffix):
+            return key[:-len(suffix)]
+    return key
+
+
+def load_index(root=LOCALES_DIR, src=SRC_DIR):
+    """Load the persisted index, bring it up to date and save it if anything changed."""
+    path = index_path(root)
+    index = UsageIndex.load(path, src)
+    if index.refresh() or not path.exists():
+        index.save(path)
+    return index
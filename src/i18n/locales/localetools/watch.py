@@ -0,0 +1,242 @@
+"""Long-running watch mode for ``apply``.
+
+Every locale stays parsed in memory. When a patch document changes, only its
+pending (namespace, locale) patches are applied to the resident trees and
+only those locale files are written. When a locale file is edited by hand it
+is re-read and re-validated. Change events come from inotify on Linux (via
+ctypes, no extra dependency) and from mtime polling elsewhere; bursts are
+debounced so an editor's save sequence triggers one update.
+"""
+import copy
+import ctypes
+import ctypes.util
+import json
+import os
+import select
+import struct
+import time
+from pathlib import Path
+
+from .cache import digest, file_entry, load_manifest, manifest_path, namespace_digests, save_manifest
+from .catalog import LOCALE_CODE, LOCALES_DIR, discover_locales, locale_path, validate, write_locale
+from .patches import (PATCHES_DIR, PatchError, apply_patch, is_patch_file, is_pending, load_ledger,
+                      load_patch_file, record, save_ledger)
+
+IN_MODIFY = 0x002
+IN_CLOSE_WRITE = 0x008
+IN_MOVED_FROM = 0x040
+IN_MOVED_TO = 0x080
+IN_CREATE = 0x100
+IN_DELETE = 0x200
+WATCH_MASK = IN_MODIFY | IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE | IN_DELETE
+EVENT_HEADER = struct.Struct('iIII')
+
+
+def interesting(path):
+    return path.suffix == '.json' and not path.name.startswith('.')
+
+
+class InotifyWatcher:
+    def __init__(self, dirs):
+        libc = ctypes.CDLL(ctypes.util.find_library('c'), use_errno=True)
+        self.fd = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), 'inotify_init1 failed')
+        self.dirs = {}
+        for directory in dirs:
+            wd = libc.inotify_add_watch(self.fd, os.fsencode(directory), WATCH_MASK)
+            if wd < 0:
+                raise OSError(ctypes.get_errno(), f'inotify_add_watch failed for {directory}')
+            self.dirs[wd] = Path(directory)
+
+    def poll(self, timeout):
+        """Changed paths seen within ``timeout`` seconds (empty if none)."""
+        changed = set()
+        if not select.select([self.fd], [], [], timeout)[0]:
+            return changed
+        try:
+            buf = os.read(self.fd, 64 * 1024)
+        except BlockingIOError:
+            return changed
+        offset = 0
+        while offset < len(buf):
+            wd, _mask, _cookie, length = EVENT_HEADER.unpack_from(buf, offset)
+            offset += EVENT_HEADER.size
+            name = buf[offset:offset + length].rstrip(b'\0')
+            offset += length
+            if name and wd in self.dirs:
+                path = self.dirs[wd] / os.fsdecode(name)
+                if interesting(path):
+                    changed.add(path)
+        return changed
+
+    def close(self):
+        os.close(self.fd)
+
+
+class PollingWatcher:
+    def __init__(self, dirs, interval=0.5):
+        self.dirs = [Path(d) for d in dirs]
+        self.interval = interval
+        self.state = self._snapshot()
+
+    def _snapshot(self):
+        state = {}
+        for directory in self.dirs:
+            for path in directory.glob('*.json'):
+                if interesting(path):
+                    stat = path.stat()
+                    state[path] = (stat.st_mtime_ns, stat.st_size)
+        return state
+
+    def poll(self, timeout):
+        time.sleep(min(timeout, self.interval))
+        current = self._snapshot()
+        changed = {path for path in current.keys() | self.state.keys() if current.get(path) != self.state.get(path)}
+        self.state = current
+        return changed
+
+    def close(self):
+        pass
+
+
+def make_watcher(dirs, poll=False):
+    if not poll and hasattr(select, 'select') and ctypes.util.find_library('c'):
+        try:
+            return InotifyWatcher(dirs)
+        except (OSError, AttributeError):
+            pass
+    return PollingWatcher(dirs)
+
+
+def wait_for_changes(watcher, debounce):
+    """Block until something changes, then collect events until ``debounce`` seconds pass quietly."""
+    changed = set()
+    while not changed:
+        changed = watcher.poll(1.0)
+    while True:
+        more = watcher.poll(debounce)
+        if not more:
+            return changed
+        changed |= more
+
+
+class Workspace:
+    """Parsed locales, patch ledger and cache manifest kept resident between updates.
+
+    Only ``locales`` (default: all) are loaded and patched. With ``dry_run``
+    patches are applied to a copy and nothing is written or recorded.
+    """
+
+    def __init__(self, root=LOCALES_DIR, patch_dir=PATCHES_DIR, locales=None, dry_run=False):
+        self.root = Path(root)
+        self.patch_dir = Path(patch_dir)
+        self.locales = locales
+        self.dry_run = dry_run
+        self.ledger = load_ledger(patch_dir)
+        self.manifest_file = manifest_path(root)
+        self.manifest = load_manifest(self.manifest_file)
+        self.trees = {}
+        self.digests = {}
+        self.dirty = False
+        for lng in discover_locales(root):
+            if self.selected(lng):
+                self.reload_locale(lng)
+
+    def selected(self, lng):
+        return self.locales is None or lng in self.locales
+
+    def reload_locale(self, lng):
+        """Re-read a locale edited outside the tool; returns validation errors."""
+        path = locale_path(lng, self.root)
+        if not path.exists():
+            self.trees.pop(lng, None)
+            self.digests.pop(lng, None)
+            return []
+        raw = path.read_bytes()
+        sha = digest(raw)
+        if self.digests.get(lng) == sha:
+            return []
+        try:
+            data = json.loads(raw.decode('utf-8'))
+        except ValueError as exc:
+            return [f'invalid JSON: {exc}']
+        errors = validate(data)
+        if not errors:
+            self.trees[lng] = data
+            self.digests[lng] = sha
+            self.manifest['files'][lng] = file_entry(path, sha, namespace_digests(data))
+            self.dirty = True
+        return errors
+
+    def apply_file(self, patch_file):
+        """Apply the pending patches of one patch document; returns per-locale reports."""
+        by_locale = {}
+        for patch in load_patch_file(patch_file):
+            if self.selected(patch.locale) and is_pending(patch, self.ledger):
+                by_locale.setdefault(patch.locale, []).append(patch)
+        reports = []
+        for lng, patches in sorted(by_locale.items()):
+            if lng not in self.trees:
+                raise PatchError(f'{patch_file.name} targets missing locale file {lng}.json')
+            data = copy.deepcopy(self.trees[lng]) if self.dry_run else self.trees[lng]
+            report = {'locale': lng, 'namespaces': [p.namespace for p in patches], 'changed': 0,
+                      'applied': False, 'written': False, 'errors': []}
+            for patch in patches:
+                report['changed'] += apply_patch(data, patch)
+                report['errors'].extend(validate(data[patch.namespace], patch.namespace))
+            if report['errors']:
+                if not self.dry_run:
+                    self.digests.pop(lng)
+                    self.reload_locale(lng)
+            elif not self.dry_run:
+                path = locale_path(lng, self.root)
+                report['written'] = write_locale(path, data)
+                sha = digest(path.read_bytes())
+                self.digests[lng] = sha
+                self.manifest['files'][lng] = file_entry(path, sha, namespace_digests(data))
+                for patch in patches:
+                    record(patch, self.ledger)
+                report['applied'] = True
+                self.dirty = True
+            reports.append(report)
+        return reports
+
+    def handle(self, changed):
+        """Process one debounced batch of changed paths."""
+        reports = []
+        for path in sorted(changed):
+            if path.parent == self.patch_dir:
+                if is_patch_file(path) and path.exists():
+                    reports.extend(self.apply_file(path))
+            elif path.parent == self.root and LOCALE_CODE.match(path.stem) and self.selected(path.stem):
+                errors = self.reload_locale(path.stem)
+                if errors:
+                    reports.append({'locale': path.stem, 'namespaces': [], 'changed': 0,
+                                    'applied': False, 'written': False, 'errors': errors})
+        if any(report['applied'] for report in reports):
+            save_ledger(self.ledger, self.patch_dir)
+        if self.dirty:
+            save_manifest(self.manifest, self.manifest_file)
+            self.dirty = False
+        return reports
+
+
+def run(root=LOCALES_DIR, patch_dir=PATCHES_DIR, debounce=0.2, poll=False, on_update=print, locales=None,
+        dry_run=False):
+    workspace = Workspace(root, patch_dir, locales, dry_run)
+    started = time.perf_counter()
+    on_update(workspace.handle(set(Path(patch_dir).glob('*.json'))), time.perf_counter() - started)
+    watcher = make_watcher([root, patch_dir], poll=poll)
+    try:
+        while True:
+            changed = wait_for_changes(watcher, debounce)
+            started = time.perf_counter()
+            try:
+                reports = workspace.handle(changed)
+            except (PatchError, ValueError) as exc:
+                reports = [{'locale': '-', 'namespaces': [], 'changed': 0, 'applied': False, 'written': False,
+                            'errors': [str(exc)]}]
+            on_update(reports, time.perf_counter() - started)
+    finally:
+        watcher.close()
@@ -0,0 +1,30 @@
+import json
+import shutil
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+LOCALES_DIR = Path(__file__).resolve().parents[1]
+I18N_DIR = LOCALES_DIR.parent
+sys.path.insert(0, str(LOCALES_DIR))
+
+
+@pytest.fixture
+def run_js():
+    """Call an exported function of a module in src/i18n with JSON arguments under node."""
+    node = shutil.which('node')
+    if node is None:
+        pytest.skip('node is not installed')
+
+    def call(module, function, *args):
+        script = (f'import {{ {function} }} from {json.dumps((I18N_DIR / module).as_uri())};'
+                  'let input = "";'
+                  'for await (const chunk of process.stdin) input += chunk;'
+                  f'process.stdout.write(JSON.stringify({function}(...JSON.parse(input))));')
+        result = subprocess.run([node, '--input-type=module', '-e', script], input=json.dumps(args),
+                                capture_output=True, text=True, check=True)
+        return json.loads(result.stdout)
+
+    return call
@@ -0,0 +1,66 @@
+"""Locale file writes (user-009): atomic replacement and canonical form."""
+import os
+
+import pytest
+
+from localetools.catalog import atomic_write, dumps, write_locale
+
+
+def leftovers(directory):
+    return [path.name for path in directory.iterdir() if path.name.endswith('.tmp')]
+
+
+def test_atomic_write_creates_parents_and_reports_a_change(tmp_path):
+    path = tmp_path / 'nested' / 'en.json'
+    assert atomic_write(path, ['{', '}']) is True
+    assert path.read_text(encoding='utf-8') == '{}'
+    assert leftovers(path.parent) == []
+
+
+def test_identical_content_keeps_the_file_and_its_mtime(tmp_path):
+    path = tmp_path / 'en.json'
+    atomic_write(path, ['same'])
+    os.utime(path, ns=(1_000_000_000, 1_000_000_000))
+    assert atomic_write(path, ['sa', 'me']) is False
+    assert path.stat().st_mtime_ns == 1_000_000_000
+    assert leftovers(tmp_path) == []
+
+
+def test_replacement_keeps_the_file_mode(tmp_path):
+    path = tmp_path / 'en.json'
+    path.write_text('old', encoding='utf-8')
+    path.chmod(0o600)
+    assert atomic_write(path, ['new']) is True
+    assert path.read_text(encoding='utf-8') == 'new'
+    assert path.stat().st_mode & 0o777 == 0o600
+
+
+def test_a_failure_mid_write_leaves_the_original_intact(tmp_path):
+    path = tmp_path / 'en.json'
+    path.write_text('original', encoding='utf-8')
+
+    def chunks():
+        yield 'partial'
+        raise RuntimeError('interrupted')
+
+    with pytest.raises(RuntimeError):
+        atomic_write(path, chunks())
+    assert path.read_text(encoding='utf-8') == 'original'
+    assert leftovers(tmp_path) == []
+
+
+def test_binary_chunks(tmp_path):
+    path = tmp_path / 'en.json.gz'
+    assert atomic_write(path, [b'\x1f\x8b', b'\x00'], binary=True) is True
+    assert path.read_bytes() == b'\x1f\x8b\x00'
+
+
+def test_write_locale_is_canonical_and_idempotent(tmp_path):
+    path = tmp_path / 'ar.json'
+    data = {'zones': {'title': 'المناطق', 'add': 'إضافة'}, 'common': {'save': 'حفظ'}}
+    assert write_locale(path, data) is True
+    text = path.read_text(encoding='utf-8')
+    assert text == dumps(data)
+    assert text.index('"common"') < text.index('"zones"') and text.index('"add"') < text.index('"title"')
+    assert 'المناطق' in text and text.endswith('\n')
+    assert write_locale(path, dict(reversed(list(data.items())))) is False
@@ -0,0 +1,120 @@
+"""Patch application (user-001..003): what ``apply`` writes to locale files, the ledger and the cache."""
+import json
+
+import pytest
+
+from localetools import engine
+from localetools.cache import manifest_path
+from localetools.patches import LEDGER_NAME, Patch, PatchError, apply_patch, load_patch_file
+
+
+@pytest.fixture
+def tree(tmp_path):
+    """A locales root with en/ar files (not in canonical form) and an empty patches directory."""
+    (tmp_path / 'en.json').write_text('{"common": {"save": "Save", "cancel": "Cancel"}}', encoding='utf-8')
+    (tmp_path / 'ar.json').write_text('{"common": {"save": "حفظ"}}', encoding='utf-8')
+    (tmp_path / 'patches').mkdir()
+    return tmp_path
+
+
+def write_patch(root, namespace, locales, mode='merge'):
+    path = root / 'patches' / f'{namespace}.json'
+    path.write_text(json.dumps({'mode': mode, 'locales': locales}, ensure_ascii=False), encoding='utf-8')
+    return path
+
+
+def read(path):
+    return json.loads(path.read_text(encoding='utf-8'))
+
+
+def apply(root, **options):
+    return {report['locale']: report for report in engine.run(root, root / 'patches', **options)}
+
+
+def test_pending_patches_are_written_and_recorded(tree):
+    write_patch(tree, 'common', {'en': {'saving': 'Saving…'}, 'ar': {'saving': 'جارٍ الحفظ…'}})
+    reports = apply(tree)
+    assert reports['en']['written'] and reports['ar']['written']
+    assert read(tree / 'en.json')['common'] == {'cancel': 'Cancel', 'save': 'Save', 'saving': 'Saving…'}
+    assert (tree / 'en.json').read_text(encoding='utf-8').startswith('{\n  "common": {\n    "cancel"')
+    assert set(read(tree / 'patches' / LEDGER_NAME)['common']) == {'ar', 'en'}
+
+    again = apply(tree)
+    assert not any(report['written'] or report['namespaces'] for report in again.values())
+
+
+def test_dry_run_writes_nothing(tree):
+    apply(tree)  # populate the cache manifest
+    manifest = manifest_path(tree).read_bytes()
+    write_patch(tree, 'common', {'en': {'save': 'Store'}})
+    before = (tree / 'en.json').read_bytes()
+    reports = apply(tree, dry_run=True)
+    assert reports['en']['changed'] == 1 and not reports['en']['written']
+    assert (tree / 'en.json').read_bytes() == before
+    assert not (tree / 'patches' / LEDGER_NAME).exists()
+    assert manifest_path(tree).read_bytes() == manifest
+
+
+def test_force_reapplies_recorded_patches(tree):
+    write_patch(tree, 'common', {'en': {'save': 'Store'}})
+    apply(tree)
+    data = read(tree / 'en.json')
+    data['common']['save'] = 'Edited by hand'
+    (tree / 'en.json').write_text(json.dumps(data), encoding='utf-8')
+
+    apply(tree)
+    assert read(tree / 'en.json')['common']['save'] == 'Edited by hand'
+    apply(tree, force=True)
+    assert read(tree / 'en.json')['common']['save'] == 'Store'
+
+
+def test_locale_filter_leaves_other_locales_pending(tree):
+    write_patch(tree, 'common', {'en': {'save': 'Store'}, 'ar': {'save': 'خزن'}})
+    apply(tree, locales=['ar'])
+    assert read(tree / 'en.json')['common']['save'] == 'Save'
+    assert list(read(tree / 'patches' / LEDGER_NAME)['common']) == ['ar']
+    apply(tree)
+    assert read(tree / 'en.json')['common']['save'] == 'Store'
+
+
+def test_patch_producing_an_invalid_tree_is_neither_written_nor_recorded(tree):
+    write_patch(tree, 'common', {'en': {'save': 5}})
+    before = (tree / 'en.json').read_bytes()
+    reports = apply(tree)
+    assert reports['en']['errors'] == ['common.save: expected a string, got int']
+    assert (tree / 'en.json').read_bytes() == before
+    assert not (tree / 'patches' / LEDGER_NAME).exists()
+
+
+def test_patch_for_a_missing_locale_file_is_an_error(tree):
+    write_patch(tree, 'common', {'fr': {'save': 'Enregistrer'}})
+    with pytest.raises(PatchError, match='fr'):
+        apply(tree)
+
+
+def test_merge_deep_merges_and_replace_swaps_the_namespace():
+    data = {'ns': {'a': {'x': 'X', 'y': 'Y'}, 'b': 'B'}}
+    assert apply_patch(data, Patch('ns', 'en', 'merge', {'a': {'y': 'Y2', 'z': 'Z'}})) == 2
+    assert data['ns'] == {'a': {'x': 'X', 'y': 'Y2', 'z': 'Z'}, 'b': 'B'}
+    assert apply_patch(data, Patch('ns', 'en', 'replace', {'c': 'C'})) == 5
+    assert data['ns'] == {'c': 'C'}
+
+
+def test_patch_over_a_string_namespace_replaces_it():
+    data = {'ns': 'legacy'}
+    assert apply_patch(data, Patch('ns', 'en', 'merge', {'a': 'A'})) == 1
+    assert data == {'ns': {'a': 'A'}}
+
+
+@pytest.mark.parametrize('content, message', [
+    ('{"locales": {"en": {"a": "\\q"}}}', 'invalid JSON'),
+    ('[]', 'expected an object'),
+    ('{"mode": "upsert", "locales": {"en": {}}}', 'unknown mode'),
+    ('{"locales": {}}', 'non-empty object'),
+    ('{"locales": {"en": "x"}}', 'must be an object'),
+])
+def test_malformed_patch_files_raise_patch_error(tmp_path, content, message):
+    path = tmp_path / 'common.json'
+    path.write_text(content, encoding='utf-8')
+    with pytest.raises(PatchError, match=f'common.json: .*{message}'):
+        load_patch_file(path)
@@ -0,0 +1,26 @@
+"""Interned bundles (user-012): intern.intern and its decoders in Python and src/i18n/interned.js."""
+from localetools import intern
+
+TREE = {
+    'common': {'save': 'Save', 'cancel': 'Cancel', 'status': 'Status'},
+    'orders': {'status': 'Status', 'col': {'status': 'Status', 'total': 'Total ({{count}})'}},
+    'reports': {'col': {'status': 'Status', 'total': 'Total ({{count}})', 'rtl': 'حالة الطلب'}},
+    'zones': {'title': 'حالة الطلب', 'save': 'Save'},
+}
+
+
+def test_intern_interns_repeats_and_expands_back():
+    bundle = intern.intern(TREE)
+    assert 'Status' in bundle['s']
+    assert bundle['t']['orders']['status'] == bundle['s'].index('Status')
+    assert intern.expand(bundle) == TREE
+
+
+def test_strings_that_do_not_pay_for_a_table_entry_stay_inline():
+    bundle = intern.intern({'a': {'x': 'x', 'y': 'x'}, 'b': 'unique'})
+    assert bundle['s'] == []
+    assert bundle['t'] == {'a': {'x': 'x', 'y': 'x'}, 'b': 'unique'}
+
+
+def test_intern_expands_identically_in_js(run_js):
+    assert run_js('interned.js', 'expandInterned', intern.intern(TREE)) == TREE
@@ -0,0 +1,97 @@
+import pytest
+
+from localetools import merge
+from localetools.merge import merge_flat
+
+BASE = {'a.title': 'Title', 'a.save': 'Save', 'b.cancel': 'Cancel'}
+
+
+def test_one_sided_edits_from_both_sides_combine():
+    ours = {**BASE, 'a.title': 'New title'}
+    theirs = {**BASE, 'b.cancel': 'Dismiss', 'b.added': 'Added'}
+    merged, conflicts = merge_flat(BASE, ours, theirs)
+    assert merged == {'a.title': 'New title', 'a.save': 'Save', 'b.cancel': 'Dismiss', 'b.added': 'Added'}
+    assert conflicts == []
+
+
+def test_same_change_on_both_sides_is_not_a_conflict():
+    changed = {**BASE, 'a.save': 'Store'}
+    merged, conflicts = merge_flat(BASE, changed, dict(changed))
+    assert merged == changed
+    assert conflicts == []
+
+
+def test_one_sided_delete_of_an_untouched_key_wins():
+    theirs = {key: value for key, value in BASE.items() if key != 'a.save'}
+    merged, conflicts = merge_flat(BASE, dict(BASE), theirs)
+    assert 'a.save' not in merged
+    assert conflicts == []
+
+
+def test_delete_against_modify_is_a_value_conflict():
+    ours = {key: value for key, value in BASE.items() if key != 'a.save'}
+    theirs = {**BASE, 'a.save': 'Store'}
+    merged, conflicts = merge_flat(BASE, ours, theirs)
+    assert conflicts == [{'key': 'a.save', 'kind': 'value', 'base': 'Save', 'ours': None, 'theirs': 'Store'}]
+    assert merged['a.save'] == '<<<<<<< ours\n\n=======\nStore\n>>>>>>> theirs'
+
+
+@pytest.mark.parametrize('style, expected', [
+    ('ours', 'Ours'),
+    ('theirs', 'Theirs'),
+    ('markers', '<<<<<<< ours\nOurs\n=======\nTheirs\n>>>>>>> theirs'),
+])
+def test_conflicting_edits_resolve_per_style(style, expected):
+    merged, conflicts = merge_flat(BASE, {**BASE, 'a.title': 'Ours'}, {**BASE, 'a.title': 'Theirs'}, style)
+    assert merged['a.title'] == expected
+    assert [(c['key'], c['kind']) for c in conflicts] == [('a.title', 'value')]
+
+
+@pytest.mark.parametrize('style', merge.STYLES)
+def test_a_deleted_side_loses_to_an_edit_except_with_markers(style):
+    ours = {key: value for key, value in BASE.items() if key != 'a.save'}
+    merged, _ = merge_flat(BASE, ours, {**BASE, 'a.save': 'Store'}, style)
+    if style == 'markers':
+        assert merged['a.save'].startswith('<<<<<<< ours')
+    else:
+        assert merged['a.save'] == 'Store'
+
+
+def test_leaf_on_our_side_replaces_their_object():
+    base = {'a.b': 'B'}
+    ours = {'a': 'Leaf'}
+    theirs = {'a.b': 'B', 'a.c': 'C'}
+    merged, conflicts = merge_flat(base, ours, theirs)
+    assert merged == {'a': 'Leaf'}
+    assert [(c['key'], c['kind']) for c in conflicts] == [('a', 'shape')]
+
+
+def test_object_on_our_side_replaces_their_leaf():
+    base = {'a.b': 'B'}
+    ours = {'a.b': 'B', 'a.c': 'C'}
+    theirs = {'a': 'Leaf'}
+    merged, conflicts = merge_flat(base, ours, theirs)
+    assert merged == {'a.c': 'C'}
+    assert conflicts == [{'key': 'a', 'kind': 'shape', 'base': None, 'ours': None, 'theirs': 'Leaf'}]
+
+
+def test_nested_shape_clashes_report_the_outermost_key_once():
+    merged, conflicts = merge_flat({}, {'a': 'Leaf'}, {'a.b': 'B', 'a.b.c': 'C'})
+    assert merged == {'a': 'Leaf'}
+    assert [c['key'] for c in conflicts if c['kind'] == 'shape'] == ['a']
+
+
+def test_merge_files_treats_an_empty_base_as_no_common_ancestor(tmp_path):
+    base, ours, theirs = (tmp_path / name for name in ('base.json', 'ours.json', 'theirs.json'))
+    base.write_text('', encoding='utf-8')
+    ours.write_text('{"a": {"x": "X"}}', encoding='utf-8')
+    theirs.write_text('{"a": {"y": "Y"}}', encoding='utf-8')
+    assert merge.merge_files(base, ours, theirs) == []
+    assert merge.read_tree(ours) == {'a': {'x': 'X', 'y': 'Y'}}
+
+
+def test_invalid_json_raises_merge_error(tmp_path):
+    path = tmp_path / 'broken.json'
+    path.write_text('{"a": ', encoding='utf-8')
+    with pytest.raises(merge.MergeError, match='invalid JSON'):
+        merge.read_tree(path)
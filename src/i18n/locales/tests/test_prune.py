@@ -0,0 +1,58 @@
+"""Pruning unused keys (user-006): remove_keys and what ``prune --write`` does to locale files."""
+import json
+
+import pytest
+
+from localetools import prune, usage
+
+
+def test_remove_keys_drops_leaves_and_emptied_parents_without_touching_the_input():
+    tree = {'a': {'b': {'c': 'C'}, 'd': 'D'}, 'e': {'f': 'F'}}
+    pruned = prune.remove_keys(tree, ['a.b.c', 'e.f'])
+    assert pruned == {'a': {'d': 'D'}}
+    assert tree == {'a': {'b': {'c': 'C'}, 'd': 'D'}, 'e': {'f': 'F'}}
+
+
+@pytest.fixture
+def project(tmp_path, monkeypatch):
+    """Locales under tmp_path/locales indexed against the sources in tmp_path/src."""
+    src, root = tmp_path / 'src', tmp_path / 'locales'
+    src.mkdir()
+    root.mkdir()
+    (src / 'Page.jsx').write_text(
+        "t('common.save');\nt(`orders.status.${status}`);\nconst nav = { labelKey: 'common.orders' };\n",
+        encoding='utf-8')
+    locale = {
+        'common': {'save': 'Save', 'orders': 'Orders', 'unused': 'Unused'},
+        'orders': {'status': {'new': 'New', 'done': 'Done'}},
+        'legacy': {'title': 'Legacy'},
+    }
+    for lng in ('en', 'ar'):
+        (root / f'{lng}.json').write_text(json.dumps(locale), encoding='utf-8')
+    monkeypatch.setattr(prune, 'load_index', lambda root: usage.load_index(root, src=src))
+    return root
+
+
+def test_dry_run_reports_without_writing(project):
+    before = (project / 'en.json').read_bytes()
+    reports = prune.run(project)
+    assert reports['en']['removed'] == ['common.unused', 'legacy.title']
+    assert set(reports['en']['namespaces']) == {'common', 'legacy'}
+    assert reports['en']['bytes_after'] < reports['en']['bytes_before']
+    assert (project / 'en.json').read_bytes() == before
+
+
+def test_write_removes_unused_keys_from_every_locale(project):
+    prune.run(project, write=True)
+    for lng in ('en', 'ar'):
+        data = json.loads((project / f'{lng}.json').read_text(encoding='utf-8'))
+        assert data == {'common': {'orders': 'Orders', 'save': 'Save'},
+                        'orders': {'status': {'done': 'Done', 'new': 'New'}}}
+    assert prune.run(project, write=True)['en']['keys'] == 0
+
+
+def test_locale_filter_only_rewrites_selected_locales(project):
+    before = (project / 'ar.json').read_bytes()
+    reports = prune.run(project, locales=['en'], write=True)
+    assert list(reports) == ['en']
+    assert (project / 'ar.json').read_bytes() == before
@@ -0,0 +1,50 @@
+"""Release deltas (user-023): release.diff and its inverses in Python and src/i18n/delta.js."""
+import random
+
+import pytest
+
+from localetools import release
+from localetools.catalog import flatten, unflatten
+
+TREE = {'common': {'save': 'Save', 'status': 'Status'}, 'zones': {'title': 'حالة الطلب'}}
+
+
+def random_flat(rng, keys=60):
+    words = ['Save', 'Status', 'Order', 'حالة', 'विवरण', 'Total ({{count}})', '']
+    flat = {}
+    for _ in range(keys):
+        key = '.'.join(rng.choice('abcdef') + str(rng.randrange(4)) for _ in range(rng.randint(1, 3)))
+        if not any(other.startswith(key + '.') or key.startswith(other + '.') for other in flat):
+            flat[key] = ' '.join(rng.choice(words) for _ in range(rng.randint(1, 3)))
+    return flat
+
+
+@pytest.mark.parametrize('seed', range(20))
+def test_apply_delta_inverts_diff(seed):
+    rng = random.Random(seed)
+    old, new = random_flat(rng), random_flat(rng)
+    new.update({key: value for key, value in old.items() if rng.random() < 0.5 and key not in new
+                and not any(k.startswith(key + '.') or key.startswith(k + '.') for k in new)})
+    delta = release.diff(old, new)
+    assert release.apply_delta(old, delta) == new
+    assert not delta['added'].keys() & old.keys()
+    assert delta['changed'].keys() <= old.keys() & new.keys()
+
+
+def test_diff_of_identical_maps_is_empty():
+    flat = flatten(TREE)
+    assert release.diff(flat, dict(flat)) == {'added': {}, 'changed': {}, 'removed': []}
+
+
+@pytest.mark.parametrize('seed', range(5))
+def test_apply_delta_matches_in_js(run_js, seed):
+    rng = random.Random(seed)
+    old, new = random_flat(rng), random_flat(rng)
+    delta = release.diff(old, new)
+    assert run_js('delta.js', 'applyDelta', unflatten(old), delta) == unflatten(new)
+
+
+def test_js_delta_handles_leaf_object_swaps(run_js):
+    old = {'a': 'Leaf', 'b.c': 'C'}
+    new = {'a.x': 'X', 'b': 'Leaf'}
+    assert run_js('delta.js', 'applyDelta', unflatten(old), release.diff(old, new)) == unflatten(new)
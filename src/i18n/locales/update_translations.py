@@ -1,590 +1,770 @@
+"""Maintain the locale JSON files: apply patches from patches/ and build derived bundles.
+
+    python update_translations.py                 # apply pending patches
+    python update_translations.py apply --dry-run
+    python update_translations.py apply --all --locale en
+    python update_translations.py apply --jobs 0  # one worker per CPU
+    python update_translations.py apply --watch   # re-apply on every patch/locale change
+    python update_translations.py apply --profile --trace apply-trace.json --pstats apply.pstats
+    python update_translations.py split           # <lng>/<namespace>.json for lazy loading
+    python update_translations.py usage unused    # en.json keys no source file references
+    python update_translations.py prune --write   # delete those keys from every locale
+    python update_translations.py coverage --fail-under 90
+    python update_translations.py placeholders    # {{placeholders}} kept in every translation
+    python update_translations.py format --check  # files are in canonical (sorted-key) form
+    python update_translations.py build --compress --budget 30k
+    python update_translations.py suggest --locale ar  # reuse existing translations for new strings
+    python update_translations.py duplicates      # repeated values and the bytes they cost
+    python update_translations.py lookup reports.col --locale ar  # via the mmap index, no JSON parsing
+    python update_translations.py search "تفاصيل الطلب"  # keys, values and call sites of UI text
+    python update_translations.py merge BASE OURS THEIRS  # three-way merge of files or directories
+    python update_translations.py telemetry ingest hits.ndjson  # count production key hits
+    python update_translations.py telemetry tiers --coverage 0.95  # hot core bundle + cold chunks
+    python update_translations.py types --check   # JSON Schema + keys.d.ts from en.json, check t() keys
+    python update_translations.py release --keep 10  # versioned snapshots + deltas for cached clients
+    python update_translations.py release diff ar @3 current
+    python update_translations.py compile         # pre-split templates, check CLDR plural forms
+    python update_translations.py pseudo --factor 1.4  # en-XA / ar-XB pseudo-locales for layout testing
+    python update_translations.py bench --keys 10k --keys 500k --compare build/bench/results.json
+
+Locale files are always written atomically with sorted keys and 2-space indent.
+
+Unchanged locales are skipped using the hashes in .cache/manifest.json.
+
+See localetools/patches.py for the patch format.
+"""
+import argparse
+import cProfile
 import json
+import os
+import sys
+from pathlib import Path
+
+from localetools import (bench, build, coverage, engine, indexed, intern, memory, merge, placeholders, profiling, prune, pseudo,
+                         release, schema, search, split, telemetry, templates, usage, watch)
+from localetools.catalog import (SOURCE_LOCALE, discover_locales, dumps, dumps_compact, flatten, load_locale,
+                                 locale_path, write_locale)
+from localetools.patches import PatchError, is_pending, load_ledger, load_patches
+
+
+# ── apply ────────────────────────────────────────────────────────────────────
+def print_watch_update(reports, elapsed):
+    for report in reports:
+        if report['errors']:
+            print(f"{report['locale']}: " + '; '.join(report['errors']))
+        elif report['namespaces']:
+            verb = 'patched' if report['written'] else 'unchanged by' if report['applied'] else 'would patch'
+            print(f"{report['locale']}.json {verb} {', '.join(report['namespaces'])} "
+                  f"({report['changed']} keys, {elapsed * 1000:.1f} ms)")
+    sys.stdout.flush()
+
+
+def print_profile(events):
+    def kib(value):
+        return '-' if value is None else f'{value / 1024:,.0f}'
+
+    print(f"{'stage':<10}{'locale':<8}{'wall ms':>10}{'cpu ms':>10}{'alloc KiB':>11}{'read KiB':>10}{'written KiB':>13}")
+    rows = [(event['stage'], event['locale'] or '', event) for event in events]
+    rows += [(name, 'total', entry) for name, entry in profiling.totals(events).items()]
+    for name, lng, entry in rows:
+        print(f"{name:<10}{lng:<8}{entry['wall'] * 1000:>10.1f}{entry['cpu'] * 1000:>10.1f}"
+              f"{kib(entry['alloc_peak']):>11}{kib(entry['bytes_read']):>10}{kib(entry['bytes_written']):>13}")
+
+
+def run_profiled(args, **options):
+    with profiling.Profiler() as profiler:
+        if args.pstats:
+            profile = cProfile.Profile()
+            reports = profile.runcall(engine.run, profiler=profiler, **options)
+            profile.dump_stats(args.pstats)
+        else:
+            reports = engine.run(profiler=profiler, **options)
+    if args.trace:
+        profiling.write_trace(profiler.events, args.trace)
+    return reports, profiler.events
+
+
+def cmd_apply(args):
+    if args.watch:
+        print('Watching patches/ and the locale files (Ctrl-C to stop)...')
+        try:
+            watch.run(debounce=args.debounce / 1000, poll=args.poll, on_update=print_watch_update,
+                      locales=args.locales, dry_run=args.dry_run)
+        except KeyboardInterrupt:
+            pass
+        return 0
+    options = dict(locales=args.locales, force=args.all, dry_run=args.dry_run, jobs=args.jobs,
+                   use_cache=not args.no_cache)
+    events = None
+    if args.profile or args.trace or args.pstats:
+        reports, events = run_profiled(args, **options)
+    else:
+        reports = engine.run(**options)
+    failed = False
+    for report in reports:
+        name = f"{report['locale']}.json"
+        if report['errors']:
+            failed = True
+            print(f'{name} invalid:')
+            for error in report['errors']:
+                print(f'  {error}')
+        elif report['namespaces']:
+            verb = 'patched' if report['written'] else 'unchanged by' if report['applied'] else 'would patch'
+            print(f"{name} {verb}: {report['changed']} keys changed in {', '.join(report['namespaces'])}")
+        elif report['skipped']:
+            print(f'{name} unchanged (cached)')
+        else:
+            print(f'{name} ok')
+    if events is not None:
+        print()
+        print_profile(events)
+        if args.trace:
+            print(f'trace written to {args.trace}')
+        if args.pstats:
+            print(f'cProfile stats written to {args.pstats} (main process only)')
+    return 1 if failed else 0
+
+
+# ── split ────────────────────────────────────────────────────────────────────
+def cmd_split(args):
+    manifest, written = split.run(out_dir=args.out, locales=args.locales)
+    for lng, written_count in written.items():
+        entries = manifest['locales'][lng]
+        total = sum(entry['bytes'] for entry in entries.values())
+        print(f'{lng}: {len(entries)} namespaces, {total:,} bytes, {written_count} files written')
+    return 0
+
+
+# ── usage ────────────────────────────────────────────────────────────────────
+def cmd_usage(args):
+    index = usage.load_index()
+    flat = flatten(load_locale(locale_path(SOURCE_LOCALE)))
+    if args.query == 'unused':
+        for key in index.unused(flat):
+            print(key)
+    elif args.query == 'missing':
+        for key in index.missing(flat):
+            file, line = index.where(key)[0]
+            print(f'{key}  ({file}:{line})')
+    elif args.query == 'where':
+        for key in args.keys:
+            for file, line in index.where(key):
+                print(f'{key}  {file}:{line}')
+    else:
+        sites = sum(len(sites) for sites in index.keys.values())
+        print(f'{len(index.files)} source files, {sites} t() call sites, {len(index.keys)} distinct keys, '
+              f'{len(index.prefixes)} dynamic prefixes')
+        print(f'{SOURCE_LOCALE}.json: {len(flat)} keys, {len(index.unused(flat))} unused, '
+              f'{len(index.missing(flat))} referenced but missing')
+    return 0
+
+
+# ── prune ────────────────────────────────────────────────────────────────────
+def cmd_prune(args):
+    reports = prune.run(locales=args.locales, write=args.write)
+    verb = 'removed' if args.write else 'would remove'
+    for lng, report in reports.items():
+        saved = report['bytes_before'] - report['bytes_after']
+        print(f"{lng}.json: {verb} {report['keys']} keys, {saved:,} of {report['bytes_before']:,} bytes")
+        for ns, stats in report['namespaces'].items():
+            print(f"  {ns:<20} {stats['keys']:>5} keys {stats['bytes_saved']:>8,} bytes")
+        if args.verbose:
+            for key in report['removed']:
+                print(f'    {key}')
+    return 0
+
+
+# ── coverage ─────────────────────────────────────────────────────────────────
+def cmd_coverage(args):
+    result = coverage.matrix(locales=args.locales, details=args.details)
+    source = result['source']
+    below = [lng for lng, entry in result['pairs'].get(source, {}).items()
+             if args.fail_under is not None and entry['coverage'] < args.fail_under]
+    if args.json:
+        payload = json.dumps(result, ensure_ascii=False, indent=2)
+        if args.json == '-':
+            print(payload)
+            for lng in below:
+                print(f'{lng}: coverage below {args.fail_under}%', file=sys.stderr)
+            return 1 if below else 0
+        with open(args.json, 'w', encoding='utf-8') as f:
+            f.write(payload + '\n')
+    print(coverage.format_table(result))
+    if source in result['pairs']:
+        print()
+        for lng, entry in result['pairs'][source].items():
+            print(f"{lng}: {entry['missing']} missing, {entry['extra']} extra, "
+                  f"{entry['type_mismatch']} type mismatches vs {source}")
+    return 1 if below else 0
+
+
+# ── placeholders ─────────────────────────────────────────────────────────────
+def cmd_placeholders(args):
+    results = placeholders.check(locales=args.locales)
+    failed = 0
+    for lng, problems in results.items():
+        for problem in problems:
+            parts = []
+            if problem['missing']:
+                parts.append('missing ' + ', '.join(f'{{{{{name}}}}}' for name in problem['missing']))
+            if problem['unexpected']:
+                parts.append('unexpected ' + ', '.join(f'{{{{{name}}}}}' for name in problem['unexpected']))
+            print(f"{lng}.json {problem['key']}: {'; '.join(parts)}")
+        failed += len(problems)
+    if failed:
+        print(f'{failed} placeholder mismatches')
+        return 1
+    print(f"Placeholders consistent across {', '.join(results)}.")
+    return 0
+
+
+# ── format ───────────────────────────────────────────────────────────────────
+def cmd_format(args):
+    unformatted = []
+    for lng in discover_locales():
+        if args.locales and lng not in args.locales:
+            continue
+        path = locale_path(lng)
+        data = load_locale(path)
+        if args.check:
+            with open(path, 'r', encoding='utf-8', newline='') as f:
+                if f.read() != dumps(data):
+                    unformatted.append(path.name)
+        elif write_locale(path, data):
+            print(f'{path.name} reformatted')
+    for name in unformatted:
+        print(f'{name} is not in canonical form')
+    return 1 if unformatted else 0
+
+
+# ── build ────────────────────────────────────────────────────────────────────
+def parse_size(text):
+    text = text.strip().lower()
+    if text.endswith('k'):
+        return int(float(text[:-1]) * 1024)
+    return int(text)
+
+
+def format_sizes(sizes):
+    return '  '.join(f"{'-' if sizes[m] is None else f'{sizes[m]:,}':>9}" for m in build.METRICS)
+
+
+def cmd_build(args):
+    if args.budget is not None and args.budget_metric == 'brotli' and build.brotli is None:
+        print('cannot enforce a brotli budget: the brotli package is not installed (pip install brotli)',
+              file=sys.stderr)
+        return 2
+    report = build.build(out_dir=args.out or build.BUILD_DIR, locales=args.locales,
+                         compress=args.compress, dedupe=args.dedupe, intern=args.intern)
+    print(f"{'':<22}" + '  '.join(f'{m:>9}' for m in build.METRICS))
+    for lng, entry in report.items():
+        print(f"{lng + '.json':<22}{format_sizes(entry['sizes'])}")
+        if args.namespaces:
+            for ns, sizes in entry['namespaces'].items():
+                print(f'  {ns:<20}{format_sizes(sizes)}')
+        if entry['dropped_fallback_duplicates']:
+            print(f"  ({entry['dropped_fallback_duplicates']} values identical to {SOURCE_LOCALE} dropped)")
+    if build.brotli is None:
+        print('brotli sizes unavailable (pip install brotli)')
+    if args.budget is not None:
+        over = build.over_budget(report, args.budget, args.budget_metric)
+        for lng in over:
+            size = report[lng]['sizes'][args.budget_metric]
+            print(f'{lng}.json over budget: {size:,} > {args.budget:,} bytes {args.budget_metric}')
+        return 1 if over else 0
+    return 0
+
+
+# ── suggest ──────────────────────────────────────────────────────────────────
+def pending_source_strings():
+    """English strings introduced by patches that have not been applied yet."""
+    ledger = load_ledger()
+    strings = {}
+    for patch in load_patches():
+        if patch.locale == SOURCE_LOCALE and is_pending(patch, ledger):
+            strings.update(flatten(patch.body, patch.namespace))
+    return strings
+
+
+def cmd_suggest(args):
+    tm = memory.TranslationMemory.from_locales()
+    targets = args.locales or [lng for lng in discover_locales() if lng != SOURCE_LOCALE]
+    pending = pending_source_strings() if args.pending else None
+    results = {}
+    for lng in targets:
+        strings = pending if pending is not None else memory.untranslated(lng=lng)
+        results[lng] = {key: tm.suggest(text, lng, args.threshold, args.limit) for key, text in strings.items()}
+    if args.json:
+        print(json.dumps(results, ensure_ascii=False, indent=2))
+        return 0
+    for lng, keys in results.items():
+        matched = {key: found for key, found in keys.items() if found}
+        print(f'{lng}: suggestions for {len(matched)} of {len(keys)} strings ({len(tm)} entries in memory)')
+        for key, found in matched.items():
+            for suggestion in found:
+                print(f"  {key}  {suggestion['score']:.2f}  {suggestion['translation']!r}  "
+                      f"(from {suggestion['key']}: {suggestion['source']!r})")
+    return 0
+
+
+# ── duplicates ───────────────────────────────────────────────────────────────
+def cmd_duplicates(args):
+    for lng in discover_locales():
+        if args.locales and lng not in args.locales:
+            continue
+        data = load_locale(locale_path(lng))
+        found = intern.duplicates(data)
+        wasted = sum(item['bytes_wasted'] for item in found)
+        interned = len(dumps_compact(intern.intern(data)).encode('utf-8'))
+        plain = len(dumps_compact(data).encode('utf-8'))
+        print(f'{lng}.json: {len(found)} repeated values, {wasted:,} bytes in extra copies; '
+              f'interned bundle {interned:,} vs {plain:,} bytes compact')
+        for item in found[:args.top]:
+            print(f"  {item['count']:>4}x {item['bytes_wasted']:>6,} bytes  {item['value']!r}")
+    return 0
+
+
+# ── index / lookup ───────────────────────────────────────────────────────────
+def cmd_index(args):
+    for lng, rebuilt in indexed.build_all(locales=args.locales).items():
+        print(f"{lng}.json {'indexed' if rebuilt else 'index up to date'} ({indexed.index_path(lng)})")
+    return 0
+
+
+def cmd_lookup(args):
+    found, missing = {}, set(args.keys)
+    for lng in args.locales or [SOURCE_LOCALE]:
+        with indexed.open_catalog(lng) as catalog:
+            values = found[lng] = {}
+            for prefix in args.keys:
+                for key, value in catalog.items(prefix):
+                    values[key] = value
+                    missing.discard(prefix)
+    if args.json:
+        print(json.dumps(found, ensure_ascii=False, indent=2))
+        return 0
+    for lng, values in found.items():
+        for key, value in values.items():
+            print(f'{lng}  {key} = {json.dumps(value, ensure_ascii=False)}')
+    for key in sorted(missing):
+        print(f'{key}: not found', file=sys.stderr)
+    return 1 if missing else 0
+
+
+# ── search ───────────────────────────────────────────────────────────────────
+def cmd_search(args):
+    hits = search.load_index().search(' '.join(args.query), args.locales, args.limit)
+    index = usage.load_index()
+    catalogs = {lng: indexed.open_catalog(lng) for lng in discover_locales()}
+    try:
+        for hit in hits:
+            key = hit['key']
+            hit['values'] = {lng: catalog.get(key) for lng, catalog in catalogs.items() if key in catalog}
+            hit['call_sites'] = sorted(set(index.where(key)) | set(index.where(usage.strip_plural(key))))
+    finally:
+        for catalog in catalogs.values():
+            catalog.close()
+    if args.json:
+        print(json.dumps(hits, ensure_ascii=False, indent=2))
+        return 0
+    for hit in hits:
+        print(f"{hit['key']}  (matched in {', '.join(hit['locales'])})")
+        for lng, value in hit['values'].items():
+            print(f'  {lng}  {value}')
+        for rel, line in hit['call_sites']:
+            print(f'  -> src/{rel}:{line}')
+    if not hits:
+        print('no matches')
+    return 0 if hits else 1
+
+
+# ── merge ────────────────────────────────────────────────────────────────────
+def print_conflicts(name, conflicts):
+    for conflict in conflicts:
+        sides = '  '.join(f"{side}={json.dumps(conflict[side], ensure_ascii=False)}"
+                          for side in ('base', 'ours', 'theirs'))
+        print(f"{name}: {conflict['kind']} conflict at {conflict['key']}  {sides}", file=sys.stderr)
+
+
+def cmd_merge(args):
+    paths = [Path(p) for p in (args.base, args.ours, args.theirs)]
+    if all(p.is_dir() for p in paths):
+        results = merge.merge_dirs(*paths, out=args.out, style=args.style)
+    else:
+        results = {args.path or args.ours: merge.merge_files(*paths, out=args.out, style=args.style)}
+    for name, conflicts in results.items():
+        print_conflicts(name, conflicts)
+    return 1 if any(results.values()) else 0
+
+
+# ── telemetry ────────────────────────────────────────────────────────────────
+def cmd_telemetry(args):
+    if args.action == 'ingest' and not args.logs:
+        print('telemetry ingest needs at least one log file', file=sys.stderr)
+        return 2
+    unreadable = [log for log in args.logs if not Path(log).is_file() or not os.access(log, os.R_OK)]
+    if unreadable:
+        print(f"not a readable log file: {', '.join(unreadable)}", file=sys.stderr)
+        return 2
+    counter = telemetry.HitCounter.for_catalog() if args.reset else telemetry.load_counter()
+    if args.action == 'ingest':
+        for log in args.logs:
+            print(f'{log}: {counter.ingest(log):,} new hit events')
+        counter.save(telemetry.state_path())
+    elif args.action == 'report':
+        totals = counter.totals()
+        hit = sum(1 for count in totals if count)
+        print(f'{sum(totals):,} hits on {hit:,} of {len(counter.keys):,} keys; '
+              f'{counter.unknown:,} hits on unknown keys, {counter.malformed:,} malformed lines')
+        for lng, counts in sorted(counter.counts.items()):
+            print(f'  {lng}: {sum(counts):,} hits')
+        for count, key_id in sorted(((c, i) for i, c in enumerate(totals) if c), reverse=True)[:args.top]:
+            print(f'  {count:>10,}  {counter.keys[key_id]}')
+        for key, count in sorted(counter.unknown_sample.items(), key=lambda item: -item[1])[:args.top]:
+            print(f'  {count:>10,}  {key}  (not in the catalog)')
+    else:
+        manifest = telemetry.tiers(out_dir=args.out or telemetry.TIERS_DIR, counter=counter,
+                                   coverage=args.coverage, locales=args.locales)
+        for lng, entry in manifest['locales'].items():
+            cold = sum(chunk['bytes'] for chunk in entry['chunks'].values())
+            print(f"{lng}.json core: {entry['core']['keys']:,} keys, {entry['core']['bytes']:,} bytes; "
+                  f"cold: {len(entry['chunks'])} chunks, {cold:,} bytes")
+    return 0
+
+
+# ── types ────────────────────────────────────────────────────────────────────
+def cmd_types(args):
+    out = Path(args.out or schema.TYPES_DIR)
+    if schema.generate(out_dir=out, force=args.force):
+        print(f'wrote {schema.MANIFEST_NAME}, {schema.SCHEMA_NAME} and {schema.DECLARATIONS_NAME} to {out}')
+    else:
+        print(f'{out} is up to date with {SOURCE_LOCALE}.json')
+    if not args.check:
+        return 0
+    with open(out / schema.MANIFEST_NAME, 'r', encoding='utf-8') as f:
+        keys = json.load(f)['keys']
+    index = usage.load_index()
+    unknown = index.missing(keys)
+    for key in unknown:
+        sites = ', '.join(f'src/{rel}:{line}' for rel, line in index.where(key))
+        print(f'unknown key {key}  ({sites})')
+    return 1 if unknown else 0
+
+
+# ── release ──────────────────────────────────────────────────────────────────
+def cmd_release(args):
+    out = Path(args.out or release.RELEASES_DIR)
+    if args.action == 'create':
+        if args.refs:
+            print('release create takes no versions', file=sys.stderr)
+            return 2
+        _, results = release.run(out_dir=out, locales=args.locales, keep=args.keep, deltas=args.deltas)
+        for lng, (version, released, deltas) in results.items():
+            state = f'released {version}, {deltas} deltas' if released else f'unchanged at {version}'
+            print(f'{lng}: {state}')
+        return 0
+    manifest = release.load_manifest(out)
+    if args.action == 'list':
+        for lng, entry in sorted(manifest['locales'].items()):
+            if args.locales is not None and lng not in args.locales:
+                continue
+            for item in entry['history']:
+                print(f"{lng}  @{item['seq']:<4}{item['version']}  {item['created']}  "
+                      f"{item['keys']:,} keys, {item['bytes']:,} bytes")
+        return 0
+    if len(args.refs) not in (2, 3):
+        print('usage: release diff LNG FROM [TO]', file=sys.stderr)
+        return 2
+    lng, *refs = args.refs
+    old, new = (release.resolve(manifest, lng, ref) for ref in (refs + ['current'])[:2])
+    print(json.dumps(release.delta_between(out, lng, old, new), ensure_ascii=False, indent=2))
+    return 0
+
+
+# ── compile ──────────────────────────────────────────────────────────────────
+def cmd_compile(args):
+    report = templates.run(out_dir=args.out or templates.COMPILED_DIR, locales=args.locales)
+    failed = False
+    for lng, entry in report.items():
+        state = 'written' if entry['written'] else 'unchanged'
+        print(f"{lng}.json {state}: {entry['templates']} templates")
+        if entry['unknown_language']:
+            print(f'  no CLDR plural data for {lng}; plural forms not checked')
+        for base, forms in entry['missing'].items():
+            failed = True
+            print(f"  {base}: missing {', '.join(forms)}")
+        for base, forms in entry['unexpected'].items():
+            print(f"  {base}: {', '.join(forms)} not used in {lng}")
+    return 1 if failed and not args.allow_missing else 0
+
+
+# ── pseudo ───────────────────────────────────────────────────────────────────
+def cmd_pseudo(args):
+    out = args.out or pseudo.PSEUDO_DIR
+    results = pseudo.generate(out_dir=out, factors=args.factors or [1.4], rtl_factor=args.rtl_factor)
+    source = placeholders.signatures(flatten(load_locale(locale_path(SOURCE_LOCALE))))
+    failed = False
+    for code, written in results.items():
+        problems = placeholders.compare(source, placeholders.signatures(flatten(load_locale(locale_path(code, out)))))
+        failed = failed or bool(problems)
+        state = 'written' if written else 'unchanged'
+        print(f'{code}.json {state}' + (f', {len(problems)} placeholder mismatches' if problems else ''))
+    return 1 if failed else 0
+
+
+# ── bench ────────────────────────────────────────────────────────────────────
+def parse_count(text):
+    text = text.strip().lower()
+    if text.endswith('k'):
+        return int(float(text[:-1]) * 1000)
+    return int(text)
+
+
+def print_bench_result(result):
+    peak = '-' if result['peak_bytes'] is None else f"{result['peak_bytes'] / 1024 / 1024:,.1f} MiB"
+    print(f"{result['keys']:>9,} keys  {result['stage']:<14}{result['seconds']:>10.3f} s  {peak:>12}")
+
+
+def cmd_bench(args):
+    print(f"{args.locales_count} locales, depth {args.depth}, seed {args.seed}")
+    results = bench.run(args.keys or [10_000, 50_000], args.locales_count, args.depth, args.seed, args.repeat,
+                        trace_memory=not args.no_memory, only=args.stages, on_result=print_bench_result)
+    status = 0
+    if args.compare:
+        print(f'compared with {args.compare}:')
+        for result, before, ratio in bench.compare(results, args.compare):
+            slower = args.max_regression is not None and ratio > 1 + args.max_regression / 100
+            print(f"{result['keys']:>9,} keys  {result['stage']:<14}{before['seconds']:>10.3f} s -> "
+                  f"{result['seconds']:.3f} s  ({ratio:.2f}x){'  REGRESSION' if slower else ''}")
+            status = 1 if slower else status
+    out = args.out or bench.RESULTS_PATH
+    bench.save(results, out)
+    print(f'results written to {out}')
+    return status
+
+
+# ── cli ──────────────────────────────────────────────────────────────────────
+def bounded(kind, low=None, high=None):
+    """argparse type converting with ``kind`` and rejecting values outside [low, high]."""
+    def convert(text):
+        value = kind(text)
+        if (low is not None and value < low) or (high is not None and value > high):
+            limits = f'at least {low}' if high is None else f'between {low} and {high}'
+            raise argparse.ArgumentTypeError(f'must be {limits}, got {text}')
+        return value
+
+    convert.__name__ = kind.__name__
+    return convert
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.set_defaults(func=cmd_apply, locales=None, all=False, dry_run=False, jobs=1, no_cache=False,
+                        watch=False, poll=False, debounce=200, profile=False, trace=None, pstats=None)
+    commands = parser.add_subparsers(dest='command')
+
+    apply = commands.add_parser('apply', help='apply pending patches to the locale files')
+    apply.add_argument('--locale', dest='locales', action='append', metavar='LNG',
+                       help='only patch this locale (repeatable)')
+    apply.add_argument('--all', action='store_true', help='re-apply patches already recorded as applied')
+    apply.add_argument('--dry-run', action='store_true', help='report changes without writing files')
+    apply.add_argument('--jobs', type=int, default=1, metavar='N',
+                       help='process locales on N worker processes (0 = one per CPU)')
+    apply.add_argument('--no-cache', action='store_true',
+                       help='ignore .cache/manifest.json and re-check every locale')
+    apply.add_argument('--watch', action='store_true', help='keep running and re-apply on file changes')
+    apply.add_argument('--poll', action='store_true', help='with --watch, poll mtimes instead of using inotify')
+    apply.add_argument('--debounce', type=int, default=200, metavar='MS',
+                       help='with --watch, wait this long for a burst of changes to settle (default: 200)')
+    apply.add_argument('--profile', action='store_true',
+                       help='print wall/CPU time, allocations and bytes read/written per stage and locale')
+    apply.add_argument('--trace', metavar='PATH', help='write the stage timings as Chrome trace JSON (implies --profile)')
+    apply.add_argument('--pstats', metavar='PATH', help='write a cProfile stats file of the run (implies --profile)')
+    apply.set_defaults(func=cmd_apply)
+
+    split_cmd = commands.add_parser('split', help='write one file per locale namespace plus a manifest')
+    split_cmd.add_argument('--out', metavar='DIR', help='output directory (default: next to the locale files)')
+    split_cmd.add_argument('--locale', dest='locales', action='append', metavar='LNG',
+                           help='only split this locale (repeatable)')
+    split_cmd.set_defaults(func=cmd_split)
+
+    usage_cmd = commands.add_parser('usage', help='query which keys the source tree references')
+    usage_cmd.add_argument('query', nargs='?', default='summary', choices=('summary', 'unused', 'missing', 'where'))
+    usage_cmd.add_argument('keys', nargs='*', metavar='KEY', help='keys to look up with "where"')
+    usage_cmd.set_defaults(func=cmd_usage)
+
+    prune_cmd = commands.add_parser('prune', help='remove keys no source file references (dry run by default)')
+    prune_cmd.add_argument('--write', action='store_true', help='rewrite the locale files')
+    prune_cmd.add_argument('--locale', dest='locales', action='append', metavar='LNG',
+                           help='only prune this locale (repeatable)')
+    prune_cmd.add_argument('-v', '--verbose', action='store_true', help='list every removed key')
+    prune_cmd.set_defaults(func=cmd_prune)
+
+    coverage_cmd = commands.add_parser('coverage', help='missing/extra/mismatched keys for every locale pair')
+    coverage_cmd.add_argument('--locale', dest='locales', action='append', metavar='LNG',
+                              help='only compare these locales (repeatable)')
+    coverage_cmd.add_argument('--json', metavar='PATH', help="write the matrix as JSON ('-' for stdout)")
+    coverage_cmd.add_argument('--details', action='store_true', help='include the key lists in the JSON')
+    coverage_cmd.add_argument('--fail-under', type=float, metavar='PCT',
+                              help='exit non-zero if any locale covers less than PCT%% of the source keys')
+    coverage_cmd.set_defaults(func=cmd_coverage)
+
+    placeholders_cmd = commands.add_parser('placeholders', help='check {{placeholders}} against en.json')
+    placeholders_cmd.add_argument('--locale', dest='locales', action='append', metavar='LNG',
+                                  help='only check this locale (repeatable)')
+    placeholders_cmd.set_defaults(func=cmd_placeholders)
+
+    format_cmd = commands.add_parser('format', help='rewrite locale files in canonical form')
+    format_cmd.add_argument('--check', action='store_true', help='only report files that are not canonical')
+    format_cmd.add_argument('--locale', dest='locales', action='append', metavar='LNG',
+                            help='only format this locale (repeatable)')
+    format_cmd.set_defaults(func=cmd_format)
+
+    build_cmd = commands.add_parser('build', help='emit minified locale artifacts and a size report')
+    build_cmd.add_argument('--out', metavar='DIR', help='output directory (default: build/i18n)')
+    build_cmd.add_argument('--locale', dest='locales', action='append', metavar='LNG',
+                           help='only build this locale (repeatable)')
+    build_cmd.add_argument('--compress', action='store_true', help='also write .gz (and .br) files')
+    build_cmd.add_argument('--dedupe', action='store_true',
+                           help=f'drop values identical to {SOURCE_LOCALE}, which the fallback already serves')
+    build_cmd.add_argument('--intern', action='store_true',
+                           help='store repeated strings once (expand with src/i18n/interned.js)')
+    build_cmd.add_argument('--namespaces', action='store_true', help='print sizes per namespace')
+    build_cmd.add_argument('--budget', type=parse_size, metavar='BYTES',
+                           help='fail if any locale exceeds this size (e.g. 30000 or 30k)')
+    build_cmd.add_argument('--budget-metric', choices=build.METRICS, default='gzip',
+                           help='size the budget applies to (default: gzip)')
+    build_cmd.set_defaults(func=cmd_build)
+
+    suggest_cmd = commands.add_parser('suggest', help='propose existing translations for untranslated strings')
+    suggest_cmd.add_argument('--locale', dest='locales', action='append', metavar='LNG',
+                             help='target locale (repeatable, default: all)')
+    suggest_cmd.add_argument('--pending', action='store_true',
+                             help=f'suggest for strings in pending {SOURCE_LOCALE} patches instead of missing keys')
+    suggest_cmd.add_argument('--threshold', type=bounded(float, 0, 1), default=0.6,
+                             help='minimum similarity, 0 to 1 (default: 0.6)')
+    suggest_cmd.add_argument('--limit', type=int, default=1, help='suggestions per key (default: 1)')
+    suggest_cmd.add_argument('--json', action='store_true', help='print the suggestions as JSON')
+    suggest_cmd.set_defaults(func=cmd_suggest)
+
+    duplicates_cmd = commands.add_parser('duplicates', help='report values repeated within each locale')
+    duplicates_cmd.add_argument('--locale', dest='locales', action='append', metavar='LNG',
+                                help='only analyse this locale (repeatable)')
+    duplicates_cmd.add_argument('--top', type=int, default=10, help='values to list per locale (default: 10)')
+    duplicates_cmd.set_defaults(func=cmd_duplicates)
+
+    index_cmd = commands.add_parser('index', help='refresh the memory-mapped key indexes in .cache/index')
+    index_cmd.add_argument('--locale', dest='locales', action='append', metavar='LNG',
+                           help='only index this locale (repeatable)')
+    index_cmd.set_defaults(func=cmd_index)
+
+    lookup_cmd = commands.add_parser('lookup', help='print keys (and everything below them) from the index')
+    lookup_cmd.add_argument('keys', nargs='+', metavar='KEY', help='dotted key or prefix, e.g. reports.col')
+    lookup_cmd.add_argument('--locale', dest='locales', action='append', metavar='LNG',
+                            help=f'locale to read (repeatable, default: {SOURCE_LOCALE})')
+    lookup_cmd.add_argument('--json', action='store_true', help='print the values as JSON')
+    lookup_cmd.set_defaults(func=cmd_lookup)
+
+    search_cmd = commands.add_parser('search', help='find keys by their text in any locale, with call sites')
+    search_cmd.add_argument('query', nargs='+', help='text to look for; the last word may be a prefix')
+    search_cmd.add_argument('--locale', dest='locales', action='append', metavar='LNG',
+                            help='only match values of this locale (repeatable)')
+    search_cmd.add_argument('--limit', type=int, default=10, help='maximum number of keys (default: 10)')
+    search_cmd.add_argument('--json', action='store_true', help='print the hits as JSON')
+    search_cmd.set_defaults(func=cmd_search)
+
+    merge_cmd = commands.add_parser('merge', help='three-way merge of locale files or directories (git merge driver)')
+    merge_cmd.add_argument('base', help='common ancestor file or directory (%%O)')
+    merge_cmd.add_argument('ours', help='our version (%%A); receives the result unless --out is given')
+    merge_cmd.add_argument('theirs', help='their version (%%B)')
+    merge_cmd.add_argument('path', nargs='?', help='path of the merged file in the work tree (%%P), for messages')
+    merge_cmd.add_argument('--out', metavar='PATH', help='write the result here instead of over OURS')
+    merge_cmd.add_argument('--style', choices=merge.STYLES, default='markers',
+                           help='how to resolve conflicting values (default: markers)')
+    merge_cmd.set_defaults(func=cmd_merge)
+
+    telemetry_cmd = commands.add_parser('telemetry', help='ingest key-hit logs and build hot/cold bundle tiers')
+    telemetry_cmd.add_argument('action', choices=('ingest', 'report', 'tiers'))
+    telemetry_cmd.add_argument('logs', nargs='*', metavar='LOG', help='NDJSON hit logs to ingest')
+    telemetry_cmd.add_argument('--reset', action='store_true', help='ignore the counts ingested so far')
+    telemetry_cmd.add_argument('--top', type=int, default=20, help='keys to list in the report (default: 20)')
+    telemetry_cmd.add_argument('--coverage', type=float, default=0.95,
+                               help='share of hits the core bundle must serve (default: 0.95)')
+    telemetry_cmd.add_argument('--out', metavar='DIR', help='tiers output directory (default: build/i18n/tiers)')
+    telemetry_cmd.add_argument('--locale', dest='locales', action='append', metavar='LNG',
+                               help='only build tiers for this locale (repeatable)')
+    telemetry_cmd.set_defaults(func=cmd_telemetry)
+
+    types_cmd = commands.add_parser('types', help=f'generate the key manifest, JSON Schema and keys.d.ts from '
+                                                  f'{SOURCE_LOCALE}.json')
+    types_cmd.add_argument('--out', metavar='DIR', help='output directory (default: build/i18n/types)')
+    types_cmd.add_argument('--force', action='store_true', help=f'regenerate even if {SOURCE_LOCALE}.json is unchanged')
+    types_cmd.add_argument('--check', action='store_true', help='fail if any literal t() key is not in the manifest')
+    types_cmd.set_defaults(func=cmd_types)
+
+    release_cmd = commands.add_parser('release', help='snapshot changed locales and write deltas for cached clients')
+    release_cmd.add_argument('action', nargs='?', choices=('create', 'list', 'diff'), default='create')
+    release_cmd.add_argument('refs', nargs='*', metavar='ARG',
+                             help='for diff: LNG FROM [TO], versions as hash prefixes, @SEQ or current')
+    release_cmd.add_argument('--out', metavar='DIR', help='releases directory (default: build/i18n/releases)')
+    release_cmd.add_argument('--locale', dest='locales', action='append', metavar='LNG',
+                             help='only release this locale (repeatable)')
+    release_cmd.add_argument('--keep', type=bounded(int, 1), default=10, metavar='N',
+                             help='snapshots to keep per locale (default: 10)')
+    release_cmd.add_argument('--deltas', type=bounded(int, 0), default=5, metavar='N',
+                             help='earlier versions to write a delta from (default: 5)')
+    release_cmd.set_defaults(func=cmd_release)
+
+    compile_cmd = commands.add_parser('compile', help='emit pre-tokenized bundles and check plural forms')
+    compile_cmd.add_argument('--out', metavar='DIR', help='output directory (default: build/i18n/compiled)')
+    compile_cmd.add_argument('--locale', dest='locales', action='append', metavar='LNG',
+                             help='only compile this locale (repeatable)')
+    compile_cmd.add_argument('--allow-missing', action='store_true',
+                             help='exit zero even when CLDR plural forms are missing')
+    compile_cmd.set_defaults(func=cmd_compile)
+
+    pseudo_cmd = commands.add_parser('pseudo', help=f'generate pseudo-locales from {SOURCE_LOCALE}.json')
+    pseudo_cmd.add_argument('--out', metavar='DIR', help='output directory (default: build/i18n/pseudo)')
+    pseudo_cmd.add_argument('--factor', dest='factors', type=float, action='append', metavar='F',
+                            help='length factor of the accented locale (repeatable, default: 1.4)')
+    pseudo_cmd.add_argument('--rtl-factor', type=float, default=1.0, metavar='F',
+                            help='length factor of the mirrored RTL locale (default: 1.0)')
+    pseudo_cmd.set_defaults(func=cmd_pseudo)
+
+    bench_cmd = commands.add_parser('bench', help='time every stage on synthetic catalogs')
+    bench_cmd.add_argument('--keys', type=parse_count, action='append', metavar='N',
+                           help='keys per locale, e.g. 500k (repeatable, default: 10k and 50k)')
+    bench_cmd.add_argument('--locales', dest='locales_count', type=int, default=6, metavar='N',
+                           help='number of locales, every few in Arabic or Devanagari script (default: 6)')
+    bench_cmd.add_argument('--depth', type=int, default=4, help='maximum nesting depth (default: 4)')
+    bench_cmd.add_argument('--seed', type=int, default=0, help='seed for the synthetic catalogs (default: 0)')
+    bench_cmd.add_argument('--stage', dest='stages', action='append', metavar='NAME',
+                           help='only run this stage (repeatable; load always runs)')
+    bench_cmd.add_argument('--repeat', type=int, default=3, metavar='N',
+                           help='time each stage N times and keep the fastest (default: 3)')
+    bench_cmd.add_argument('--no-memory', action='store_true', help='skip the tracemalloc peak memory pass')
+    bench_cmd.add_argument('--out', metavar='PATH', help='results file (default: build/bench/results.json)')
+    bench_cmd.add_argument('--compare', metavar='PATH', help='earlier results file to compare against')
+    bench_cmd.add_argument('--max-regression', type=float, metavar='PCT',
+                           help='with --compare, exit non-zero if any stage got more than PCT%% slower')
+    bench_cmd.set_defaults(func=cmd_bench)
+    return parser
+
+
+def main(argv=None):
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    if args.watch:
+        ignored = [flag for flag, used in (('--all', args.all), ('--jobs', args.jobs != 1), ('--no-cache', args.no_cache),
+                                           ('--profile', args.profile or args.trace or args.pstats)) if used]
+        if ignored:
+            parser.error(f"--watch cannot be combined with {', '.join(ignored)}")
+    try:
+        return args.func(args)
+    except (PatchError, merge.MergeError, release.ReleaseError) as exc:
+        print(f'error: {exc}', file=sys.stderr)
+        return 1
+
 
-with open('en.json', 'r') as f:
-    data = json.load(f)
-
-# ── common additions ─────────────────────────────────────────────────────────
-data['common'].update({
-    "saving": "Saving\u2026",
-    "save_changes": "Save Changes",
-    "creating": "Creating\u2026",
-    "submitting": "Submitting\u2026",
-    "sending": "Sending\u2026",
-    "exporting": "Exporting\u2026",
-    "track": "Track",
-    "vehicle": "Vehicle",
-    "plate": "Plate",
-    "recipient": "Recipient",
-    "unassigned": "Unassigned",
-    "area": "Area",
-    "emirate": "Emirate",
-    "city": "City",
-    "item": "Item",
-    "orders": "Orders",
-    "company": "Company",
-    "payment_method": "Payment",
-    "no_results_hint": "Try adjusting your search or filters",
-    "load_error": "Unable to load details",
-    "try_again": "Please try again",
-    "export_csv": "Export CSV",
-    "order_num": "Order #"
-})
-
-# ── settings – full replacement ──────────────────────────────────────────────
-data['settings'] = {
-    "title": "Settings",
-    "page_title": "Settings",
-    "page_sub": "Configure your delivery platform",
-    "loading": "Loading settings\u2026",
-    "tabs": {
-        "general": "General",
-        "delivery": "Delivery",
-        "notifications": "Notifications",
-        "categories": "Categories",
-        "users": "Users"
-    },
-    "tab_sub": {
-        "general": "Company info, branding and regional preferences",
-        "delivery": "Delivery defaults, COD rules and feature toggles",
-        "notifications": "Email SMTP and SMS gateway configuration",
-        "categories": "Manage order categories and shipment types",
-        "users": "Manage team members and their roles"
-    },
-    "general": {
-        "company_info_title": "Company Information",
-        "company_info_sub": "Your business identity and contact details",
-        "company_name": "Company Name",
-        "company_phone": "Company Phone",
-        "company_email": "Company Email",
-        "website": "Website",
-        "company_address": "Company Address",
-        "city": "City",
-        "vat_number": "VAT Number",
-        "logo_url": "Logo URL",
-        "regional_title": "Regional Settings",
-        "regional_sub": "Timezone, currency and locale",
-        "timezone": "Timezone",
-        "currency": "Currency",
-        "country": "Country",
-        "default_language": "Default Language"
-    },
-    "delivery": {
-        "defaults_title": "Delivery Defaults",
-        "defaults_sub": "Default values applied to new orders",
-        "default_emirate": "Default Emirate",
-        "default_fee": "Default Delivery Fee (AED)",
-        "max_cod": "Max COD Amount (AED)",
-        "driver_commission": "Driver Commission (%)",
-        "expected_days": "Expected Delivery Days",
-        "max_weight": "Max Weight (kg)",
-        "feature_toggles_title": "Feature Toggles",
-        "feature_toggles_sub": "Enable or disable platform features",
-        "toggle_cod": "Cash on Delivery (COD)",
-        "toggle_cod_desc": "Allow orders to be paid on delivery",
-        "toggle_returns": "Return Orders",
-        "toggle_returns_desc": "Enable return/reverse logistics",
-        "toggle_express": "Express Delivery",
-        "toggle_express_desc": "Allow same-day / express order types",
-        "toggle_sms": "SMS Tracking Notifications",
-        "toggle_sms_desc": "Send automated SMS when status changes",
-        "toggle_email": "Email Tracking Notifications",
-        "toggle_email_desc": "Send automated emails when status changes",
-        "toggle_tips": "Driver Tips",
-        "toggle_tips_desc": "Allow recipients to tip the driver"
-    },
-    "notifications": {
-        "smtp_title": "Email / SMTP",
-        "smtp_sub": "Configure outbound email delivery",
-        "smtp_host": "SMTP Host",
-        "smtp_port": "SMTP Port",
-        "smtp_user": "SMTP Username",
-        "smtp_pass": "SMTP Password",
-        "from_name": "From Name",
-        "reply_to": "Reply-To Email",
-        "sms_title": "SMS Settings",
-        "sms_sub": "Configure SMS gateway for notifications",
-        "sms_sender_id": "SMS Sender ID",
-        "twilio_sid": "Twilio Account SID",
-        "twilio_token": "Twilio Auth Token",
-        "twilio_phone": "Twilio Phone Number",
-        "sms_info": "SMS notifications are sent automatically when an order status changes if SMS Tracking is enabled in Delivery settings."
-    },
-    "categories": {
-        "add": "Add Category",
-        "edit": "Edit Category",
-        "new": "New Category",
-        "name_en": "Name (English) *",
-        "name_ar": "Name (Arabic)",
-        "color": "Color"
-    },
-    "users": {
-        "team_members": "Team Members",
-        "add_user": "Add User",
-        "modal_title": "Add Team Member",
-        "full_name": "Full Name *",
-        "username": "Username *",
-        "email": "Email *",
-        "password": "Password *",
-        "password_placeholder": "Min. 6 characters",
-        "role": "Role",
-        "create_user": "Create User"
-    }
-}
-
-# ── reports additions ────────────────────────────────────────────────────────
-data['reports'].update({
-    "last_year": "Last year",
-    "pdf_report": "PDF Report",
-    "no_data": "No data available",
-    "no_orders_period": "No orders found for the selected period",
-    "no_zone_data": "No zone data yet.",
-    "no_driver_data_text": "No driver data yet",
-    "no_payment_data": "No payment data",
-    "no_client_data": "No client data",
-    "no_client_orders": "No client-linked orders found for the selected period",
-    "no_order_type_data": "No order type data",
-    "no_order_type_sub": "Order types not recorded for this period",
-    "no_delivery_time": "No delivery time data",
-    "no_delivery_time_sub": "No delivered orders with timing data for this period",
-    "tabs": {
-        "overview": "Overview",
-        "daily_volume": "Daily Volume",
-        "by_zone": "By Zone",
-        "driver_performance": "Driver Performance",
-        "clients": "Clients",
-        "order_types": "Order Types",
-        "delivery_time": "Delivery Time",
-        "payments": "Payments",
-        "financial": "Financial",
-        "schedules": "Email Schedules"
-    },
-    "kpi": {
-        "total_orders": "Total Orders",
-        "delivered": "Delivered",
-        "failed": "Failed",
-        "revenue": "Revenue",
-        "cod_collected": "COD Collected",
-        "success_rate": "Success Rate"
-    },
-    "col": {
-        "reason": "Reason",
-        "count": "Count",
-        "pct_failed": "% of Failed",
-        "success_rate": "Success Rate",
-        "revenue": "Revenue",
-        "rating": "Rating",
-        "method": "Method",
-        "avg_time": "Avg Time",
-        "slowest": "Slowest",
-        "success_pct": "Success %",
-        "avg_value": "Avg Value",
-        "pct_total": "% of Total",
-        "cod": "COD",
-        "revenue_generated": "Revenue Generated"
-    },
-    "chart": {
-        "status_breakdown": "Order Status Breakdown",
-        "by_emirate": "Orders by Emirate",
-        "zone_density": "Zone Order Density",
-        "orders_label": "orders",
-        "success_label": "success",
-        "orders_by_zone": "Orders by Zone",
-        "top_drivers": "Top Drivers by Deliveries",
-        "payment_distribution": "Payment Method Distribution",
-        "payment_breakdown": "Payment Breakdown",
-        "top_clients": "Top Clients by Orders",
-        "revenue_by_client": "Revenue by Client",
-        "order_types_dist": "Order Types Distribution",
-        "order_type_breakdown": "Order Type Breakdown",
-        "revenue_trend": "Revenue Trend",
-        "revenue_by_payment": "Revenue by Payment Method",
-        "revenue_by_zone": "Revenue by Zone",
-        "top_clients_revenue": "Top Clients by Revenue",
-        "driver_settlements": "Driver Settlements"
-    },
-    "financial": {
-        "gross_fees": "Gross Fees",
-        "discounts": "Discounts",
-        "net_revenue": "Net Revenue",
-        "cod_collected": "COD Collected",
-        "cod_settled": "COD Settled",
-        "cod_pending": "COD Pending"
-    },
-    "schedules": {
-        "title": "Scheduled Email Reports",
-        "new": "New Schedule",
-        "desc": "Configure automated daily or weekly delivery reports sent to your email.",
-        "daily": "Daily (7:00 AM)",
-        "weekly": "Weekly (Monday 7:00 AM)",
-        "recipients_label": "Recipients (comma-separated emails)",
-        "paused": "Paused",
-        "pause": "Pause",
-        "activate": "Activate",
-        "send_now": "Send Now",
-        "empty_title": "No scheduled reports",
-        "empty_sub": "Create a schedule to receive automated daily or weekly delivery reports by email.",
-        "freq": {"daily": "Daily", "weekly": "Weekly"},
-        "col": {"recipients": "Recipients", "schedule": "Schedule"}
-    }
-})
-
-# ── shipmentTracking additions ───────────────────────────────────────────────
-data['shipmentTracking'].update({
-    "subtitle": "Track, monitor and manage all shipments in real-time",
-    "dispatch_map": "Dispatch Map",
-    "tracking_loading": "Tracking...",
-    "copy_link": "Copy Link",
-    "live_track": "Live Track",
-    "tracking_token": "Tracking Token",
-    "edit_order": "Edit Order",
-    "view_on_map": "View on Map",
-    "search_placeholder": "Search by order #, name, phone, tracking...",
-    "stats": {
-        "total": "TOTAL SHIPMENTS",
-        "in_transit": "IN TRANSIT",
-        "delivered": "DELIVERED",
-        "failed_returned": "FAILED / RETURNED",
-        "today": "TODAY"
-    },
-    "tabs": {
-        "all": "All Shipments",
-        "active": "Active",
-        "delivered": "Delivered",
-        "failed": "Failed",
-        "pending": "Pending"
-    },
-    "col": {"order_num": "Order #", "tracking": "Tracking"},
-    "section": {
-        "order_info": "Order Information",
-        "progress": "Delivery Progress",
-        "driver": "Assigned Driver",
-        "timestamps": "Timestamps",
-        "timeline": "Tracking Timeline",
-        "pod": "Proof of Delivery",
-        "items": "Order Items",
-        "instructions": "Special Instructions"
-    },
-    "timestamp": {
-        "picked_up": "Picked Up",
-        "in_transit": "In Transit",
-        "delivered": "Delivered",
-        "failed": "Failed",
-        "returned": "Returned"
-    },
-    "pod": {"signed_by": "Signed by"},
-    "drawer": {"title": "Shipment Details"}
-})
-
-# ── cod additions ─────────────────────────────────────────────────────────────
-data['cod'].update({
-    "subtitle": "Track cash collections, driver settlements, and COD payments",
-    "export_report": "Export Report",
-    "search_placeholder": "Search orders or drivers...",
-    "no_data": "No COD Data",
-    "no_drivers": "No drivers with COD collections found",
-    "no_phone": "No phone",
-    "view_orders": "View Orders",
-    "settle": "Settle",
-    "no_orders": "No COD Orders",
-    "no_orders_sub": "No cash-on-delivery orders match your filters",
-    "settling": "Settling...",
-    "confirm_settlement": "Confirm Settlement",
-    "stats": {"total": "TOTAL COD", "collected": "COLLECTED", "pending": "PENDING", "orders": "COD ORDERS"},
-    "tabs": {"overview": "Driver Overview", "orders": "COD Orders"},
-    "driver": {"collected": "COLLECTED", "pending": "PENDING", "orders": "ORDERS", "delivered": "DELIVERED"},
-    "col": {"amount": "COD Amount", "delivery_fee": "Delivery Fee"},
-    "status": {"collected": "Collected"},
-    "modal": {
-        "title": "Settle COD",
-        "total_collected": "Total Collected",
-        "delivered_orders": "Delivered Orders",
-        "amount_to_settle": "Amount to Settle",
-        "confirm_text": "This will mark all collected COD amounts for this driver as settled."
-    }
-})
-
-# ── returns additions ─────────────────────────────────────────────────────────
-data['returns'].update({
-    "submit": "Submit Return",
-    "tabs": {"all": "All Returns", "pending": "Pending", "in_progress": "In Progress", "completed": "Completed", "rejected": "Rejected"},
-    "col": {"reason": "Reason", "requested": "Requested"},
-    "modal": {"new_title": "New Return Request", "detail_title": "Return Details"},
-    "form": {"order": "Order *", "select_order": "Select delivered order", "reason": "Reason *", "select_reason": "Select reason"},
-    "detail": {"reason": "Reason", "requested": "Requested", "resolved": "Resolved"}
-})
-
-# ── dispatch additions ────────────────────────────────────────────────────────
-data['dispatch'].update({
-    "title": "Dispatch Board",
-    "subtitle": "Assign drivers to orders in real time",
-    "live_map": "Live Map",
-    "select_driver": "Select Driver...",
-    "assigning": "Assigning...",
-    "assign_driver": "Assign Driver",
-    "no_active": "No active orders",
-    "view": {"board": "Board", "map": "Map"},
-    "col": {"unassigned": "Unassigned", "in_progress": "In Progress"},
-    "map": {"no_locations": "No locations to display", "no_coords": "Orders and drivers need GPS coordinates to appear on the map"},
-    "legend": {"unassigned": "Unassigned", "in_progress": "In Progress", "drivers": "Drivers"},
-    "popup": {"zone": "Zone:", "delivery_address": "Delivery Address"}
-})
-
-# ── invoices additions ────────────────────────────────────────────────────────
-data['invoices'].update({
-    "subtitle": "Auto-generated from confirmed orders \u00b7 Real-time payment tracking",
-    "label": "Invoice",
-    "pdf": "PDF",
-    "mark_paid": "Mark Paid",
-    "mark_as_paid": "Mark as Paid",
-    "download_pdf": "Download PDF",
-    "due_date": "Due Date",
-    "not_set": "Not set",
-    "line_items": "Line Items",
-    "subtotal": "Subtotal:",
-    "tax": "Tax:",
-    "paid_at": "Paid:",
-    "walk_in": "Walk-in",
-    "empty_hint": "Invoices are automatically generated when an order is confirmed. Try confirming an order or adjusting your filters.",
-    "stats": {"total": "TOTAL INVOICED", "collected": "COLLECTED", "pending": "PENDING", "overdue": "OVERDUE"}
-})
-
-# ── performance additions ─────────────────────────────────────────────────────
-data['performance'].update({
-    "subtitle": "Delivery metrics, SLA compliance, and driver scorecards",
-    "delivery_rate": "Delivery Rate",
-    "avg_time": "Avg Delivery Time",
-    "on_time": "On-Time",
-    "failed_returned": "Failed / Returned",
-    "export_title": "Export driver data",
-    "no_orders_period": "No assigned orders found for the selected period",
-    "tabs": {"sla": "SLA Overview", "scorecards": "Driver Scorecards"},
-    "sla": {"first_attempt": "First-Attempt Success", "avg_speed": "Average Speed", "within": "Within SLA", "over": "Over SLA"},
-    "chart": {"status_dist": "Status Distribution", "top_drivers": "Top Drivers", "top_drivers_sub": "By delivery success rate"},
-    "col": {"avg_time": "Avg Time"}
-})
-
-# ── integrations additions ────────────────────────────────────────────────────
-data['integrations'].update({
-    "api_keys_sub": "Authenticate external systems \u2014 Shopify, WooCommerce, ERPs",
-    "generate_key_btn": "Generate Key",
-    "key_created_notice": "API Key Created \u2014 copy now, it will not be shown again",
-    "paused": "Paused",
-    "expires_never": "Never",
-    "revoke": "Revoke",
-    "enable": "Enable",
-    "generating": "Generating\u2026",
-    "webhooks_title": "Webhook Endpoints",
-    "webhooks_sub": "Send real-time HTTP POST events to your apps on order status changes",
-    "add_endpoint": "Add Endpoint",
-    "no_webhooks_hint": "Add an endpoint to receive real-time delivery events",
-    "add_first_endpoint": "Add First Endpoint",
-    "last_fired": "Last fired: ",
-    "test_ping": "Test Ping",
-    "testing": "Testing\u2026",
-    "pause": "Pause",
-    "activate": "Activate",
-    "delivery_log_title": "Webhook Delivery Log",
-    "no_deliveries": "No deliveries yet",
-    "no_deliveries_hint": "Webhook events appear here once triggered",
-    "hmac_hint": "Requests signed with X-Trasealla-Signature HMAC-SHA256.",
-    "create_webhook": "Create Webhook",
-    "modal": {"edit_webhook": "Edit Webhook", "add_webhook": "Add Webhook Endpoint"},
-    "form": {
-        "key_name": "Key Name *",
-        "key_name_placeholder": "e.g. WooCommerce",
-        "permissions": "Permissions",
-        "expires_at": "Expires At (optional)",
-        "endpoint_name": "Endpoint Name *",
-        "endpoint_url": "Endpoint URL *",
-        "description": "Description (optional)"
-    },
-    "col": {
-        "key_preview": "Key Preview",
-        "permissions": "Permissions",
-        "expires": "Expires",
-        "event": "Event",
-        "endpoint": "Endpoint",
-        "http": "HTTP",
-        "duration": "Duration",
-        "attempt": "Attempt",
-        "time": "Time"
-    }
-})
-
-# ── clients additions ─────────────────────────────────────────────────────────
-data['clients'].update({
-    "search_location": "Search Location",
-    "no_results": "No clients match your filters",
-    "empty_title": "No clients yet",
-    "empty_sub": "Add your first client to get started",
-    "add_first": "+ Add First Client",
-    "shown": "shown",
-    "segment_label": "SEGMENT",
-    "orders_done": "done",
-    "step": {
-        "basic_info": "Basic Info",
-        "basic_info_desc": "Name & contact details",
-        "business_info": "Business Info",
-        "business_info_desc": "Type, category & emirate",
-        "address_limit": "Address & Limit",
-        "address_limit_desc": "Location, credit & notes"
-    },
-    "validation": {"full_name": "Full name is required", "phone": "Phone number is required"},
-    "kpi": {
-        "total": "Total Clients", "total_sub": "active",
-        "orders": "Total Orders", "orders_sub": "all time",
-        "corporate": "Corporate B2B", "corporate_sub": "business accounts",
-        "ecommerce": "E-Commerce", "ecommerce_sub": "online stores"
-    },
-    "col": {"client": "Client", "contact": "Contact", "credit_limit": "Credit Limit"},
-    "drawer": {
-        "edit": "Edit Client", "new_order": "New Order",
-        "deactivate": "Deactivate", "activate": "Activate",
-        "profile": "Profile Information", "alt_phone": "Alt Phone", "joined": "Joined",
-        "recent_orders": "Recent Orders",
-        "stat": {"orders": "Total Orders", "delivered": "Delivered", "credit": "Credit Limit"}
-    },
-    "form": {
-        "edit_title": "Edit Client", "new_title": "New Client",
-        "full_name": "Full Name *", "full_name_placeholder": "e.g. Ahmed Al Mansouri",
-        "phone": "Phone *", "phone_placeholder": "+971 50 123 4567",
-        "email": "Email Address", "email_placeholder": "client@company.com",
-        "select_zone": "\u2014 Select a zone (optional) \u2014",
-        "latitude": "Latitude", "longitude": "Longitude",
-        "use_zone_center": "Use Zone Center", "my_gps": "\U0001f4cd My GPS",
-        "street_address": "Street Address",
-        "street_placeholder": "Building, Street, Floor, Flat",
-        "auto_zone": "Auto-populated from zone",
-        "credit_limit": "Credit Limit (AED)", "no_limit_placeholder": "0 = No limit",
-        "update_submit": "Update Client", "create_submit": "Create Client"
-    },
-    "confirm": {"title": "Deactivate Client?", "body": "will be marked as inactive. No data will be deleted.", "deactivate": "Deactivate"}
-})
-
-# ── notifications additions ───────────────────────────────────────────────────
-data['notifications'].update({
-    "sms_test": "SMS Test",
-    "email_test": "Email Test",
-    "send": "Send Notification",
-    "no_sms": "No SMS logs found.",
-    "no_email": "No email logs found.",
-    "empty_hint": "Notifications will appear here when sent.",
-    "sent_success": "Notification sent successfully!",
-    "stats": {"total_sent": "Total Sent", "sms": "SMS", "email": "Email", "push": "Push", "failed": "Failed", "today": "Today"},
-    "list": {"sms_logs": "SMS Logs", "email_logs": "Email Logs", "all": "All Notifications"},
-    "col": {"message": "Message"},
-    "form": {
-        "channels": "Channels", "order_id": "Order ID (optional)", "user_id": "User ID (push target)",
-        "message": "Message *", "characters": "characters", "sending_via": "Sending via:", "submit": "Send Notification"
-    },
-    "channel": {"email": "Email"},
-    "modal": {"send_title": "Send Notification"},
-    "sms_modal": {
-        "title": "SMS Test", "sub": "Send a test SMS via Twilio", "sent": "Sent! SID:",
-        "phone": "Phone (E.164) *", "message": "Message *", "order_id": "Order ID (optional)", "submit": "Send SMS"
-    },
-    "email_modal": {
-        "title": "Email Test", "sub": "Send a test email via Office 365", "sent": "Email sent! ID:",
-        "to": "To (email) *", "message": "Message *", "order_id": "Order ID (optional)", "submit": "Send Email"
-    }
-})
-
-# ── zones additions ───────────────────────────────────────────────────────────
-data['zones'].update({
-    "page_title": "Delivery Zones",
-    "add_btn": "Add Zone",
-    "create_btn": "Create Zone",
-    "edit_title": "Edit Zone",
-    "create_title": "Create New Zone",
-    "form_subtitle": "Define zone boundaries and pricing on the map",
-    "map_hint": "Search a location above or click the map",
-    "form": {"name": "Zone Name *", "emirate": "Emirate *", "base_fee": "Base Fee (AED)", "per_km": "Per km (AED)", "pricing": "Pricing"},
-    "card": {"no_location": "No location \u2014 edit to set coordinates"},
-    "no_location_hint": "No location set \u2014 click map or search above"
-})
-
-# ── orderDetail additions ─────────────────────────────────────────────────────
-data['orderDetail'].update({
-    "all_tracking": "All Tracking",
-    "created": "Created:",
-    "scheduled": "Scheduled:",
-    "picked_up": "Picked up:",
-    "delivered": "Delivered:",
-    "no_items": "No items recorded for this order.",
-    "update_status": "Update Status",
-    "select_driver": "\u2014 Select driver \u2014",
-    "area": "Area",
-    "order_num": "Order #",
-    "section": {"recipient": "Recipient", "order_info": "Order Info", "driver": "Driver", "location": "Location"}
-})
-
-# ── superAdmin (new section) ──────────────────────────────────────────────────
-data['superAdmin'] = {
-    "loading": "Loading dashboard...",
-    "no_tenants": "No tenants found",
-    "view_all": "View All",
-    "col": {"company": "Company", "industry": "Industry", "users": "Users", "max_users": "Max Users", "tenant": "Tenant", "user": "User", "role": "Role"},
-    "status": {"trial": "Trial", "suspended": "Suspended"},
-    "stats": {"total_tenants": "Total Tenants", "active_tenants": "Active Tenants", "trial_tenants": "Trial Tenants", "total_users": "Total Users"},
-    "dashboard": {
-        "title": "Platform Dashboard",
-        "subtitle": "Overview of Trasealla CRM platform",
-        "platform_overview": "Platform Overview",
-        "view_analytics": "View Analytics",
-        "mrr": "Monthly Recurring Revenue",
-        "active_subs": "Active Subscriptions",
-        "suspended": "Suspended Accounts",
-        "trial_conversions": "Trial Conversions",
-        "recent_tenants": "Recent Tenants"
-    },
-    "tenants": {
-        "title": "Tenant Management",
-        "subtitle": "Manage all CRM client accounts",
-        "new": "New Tenant",
-        "search_placeholder": "Search tenants...",
-        "set_max_users": "Set Max Users",
-        "max_users_hint": "Set maximum number of users for this tenant",
-        "max_users_label": "Max Users",
-        "modules_hint": "Select which modules this tenant can access:",
-        "save_modules": "Save Modules"
-    },
-    "modules": {
-        "title": "Module Management",
-        "subtitle": "Configure which modules each tenant can access",
-        "available": "Available Modules",
-        "tenant_access": "Tenant Module Access",
-        "configure_for": "Configure Modules for",
-        "col": {"enabled": "Enabled Modules"}
-    },
-    "users": {
-        "title": "Platform Users",
-        "subtitle": "Manage all users across tenants",
-        "active": "Active Users",
-        "tenants_count": "Tenants",
-        "admins": "Admins",
-        "search_placeholder": "Search users...",
-        "all_tenants": "All Tenants",
-        "no_users": "No users found",
-        "last_login": "Last Login",
-        "never_login": "Never"
-    },
-    "login": {
-        "brand": "Trasealla Solutions",
-        "brand_sub": "Delivery Platform Administration",
-        "title": "Super Admin Access",
-        "subtitle": "Restricted to platform administrators only",
-        "username": "USERNAME",
-        "username_placeholder": "Enter admin username",
-        "password": "PASSWORD",
-        "password_placeholder": "Enter admin password",
-        "authenticating": "Authenticating...",
-        "submit": "Access Admin Panel",
-        "back_to": "Back to",
-        "delivery_link": "Delivery Login \u2192",
-        "connection_error": "Connection error. Please try again."
-    }
-}
-
-with open('en.json', 'w') as f:
-    json.dump(data, f, ensure_ascii=False, indent=2)
-print('en.json done. Top-level keys:', list(data.keys()))
+if __name__ == '__main__':
+    sys.exit(main())
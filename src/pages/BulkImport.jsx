@@ -70,7 +70,7 @@ function downloadCSV(content, filename) {
 
 export default function BulkImport() {
   const { t, i18n } = useTranslation();
-  const isRTL = i18n.language === 'ar';
+  const isRTL = i18n.dir() === 'rtl';
   const fileRef = useRef(null);
   const [step, setStep] = useState(1); // 1=upload, 2=map, 3=preview, 4=importing, 5=done
   const [dragOver, setDragOver] = useState(false);
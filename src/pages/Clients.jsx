@@ -134,7 +134,7 @@ function StepBar({ current, steps }) {
 /* ── Nominatim address search dropdown ── */
 function AddressSearch({ onSelect }) {
   const { t, i18n } = useTranslation();
-  const isRTL = i18n.language === 'ar';
+  const isRTL = i18n.dir() === 'rtl';
   const [q, setQ] = React.useState('');
   const [results, setResults] = React.useState([]);
   const [loading, setLoading] = React.useState(false);
@@ -275,7 +275,7 @@ function LocationPickerMap({ lat, lng, onPick }) {
 /* ── Main component ── */
 export default function Clients() {
   const { t, i18n } = useTranslation();
-  const isRTL = i18n.language === 'ar';
+  const isRTL = i18n.dir() === 'rtl';
   const navigate = useNavigate();
   const [clients,       setClients]       = useState([]);
   const [loading,       setLoading]       = useState(true);
@@ -730,7 +730,7 @@ export default function Clients() {
 
             <div style={{ background:'linear-gradient(135deg,#1e293b,#334155)', padding:'26px 26px 22px', position:'relative' }}>
               <button onClick={() => setDrawer(null)}
-                style={{ position:'absolute', top:14, [i18n.language === 'ar' ? 'left' : 'right']:14, background:'rgba(255,255,255,0.1)',
+                style={{ position:'absolute', top:14, [i18n.dir() === 'rtl' ? 'left' : 'right']:14, background:'rgba(255,255,255,0.1)',
                   border:'none', color:'#fff', width:30, height:30, borderRadius:'50%',
                   cursor:'pointer', display:'flex', alignItems:'center', justifyContent:'center' }}>
                 <Xmark width={15} height={15} />
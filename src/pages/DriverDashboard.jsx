@@ -69,7 +69,7 @@ function ProgressSteps({ current }) {
 /* ── Dashboard ── */
 export default function DriverDashboard() {
   const { t, i18n } = useTranslation();
-  const isRTL = i18n.language === 'ar';
+  const isRTL = i18n.dir() === 'rtl';
   const fmtAED = v => { const n = parseFloat(v); return !isNaN(n) && n > 0 ? `${t('driverDashboard.currency_aed')} ${n.toFixed(2)}` : '\u2014'; };
   const navigate = useNavigate();
   const [data, setData]         = useState(null);
@@ -28,7 +28,7 @@ const fmtTime   = d => d ? new Date(d).toLocaleTimeString('en-AE', { hour: '2-di
 
 export default function DriverHome() {
   const { t, i18n } = useTranslation();
-  const isRTL = i18n.language === 'ar';
+  const isRTL = i18n.dir() === 'rtl';
   const navigate = useNavigate();
   const { toasts, showToast } = useToast();
 
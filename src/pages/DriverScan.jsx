@@ -57,7 +57,7 @@ function getGPS() {
 /* ─────────────────── Order Card ──────────────────────────────────── */
 function OrderCard({ order, onStatusUpdate, onScan, loading }) {
   const { t, i18n } = useTranslation();
-  const isRTL = i18n.language === 'ar';
+  const isRTL = i18n.dir() === 'rtl';
   const [statusNote, setStatusNote] = useState('');
   const [codAmt, setCodAmt]         = useState(order.cod_amount || '');
   const [updating, setUpdating]     = useState(false);
@@ -104,7 +104,7 @@ const miniStatus = {
    ═══════════════════════════════════════════════════════════════ */
 export default function Drivers() {
   const { t, i18n } = useTranslation();
-  const isRTL = i18n.language === 'ar';
+  const isRTL = i18n.dir() === 'rtl';
   const { user } = useContext(AuthContext);
   const [drivers,    setDrivers]    = useState([]);
   const [loading,    setLoading]    = useState(true);
@@ -24,7 +24,7 @@ const STATUS_CONFIG = {
 /* ═══════════════════════════ MAIN COMPONENT ═══════════════════════════ */
 export default function Invoices() {
   const { t, i18n } = useTranslation();
-  const isRTL = i18n.language === 'ar';
+  const isRTL = i18n.dir() === 'rtl';
   const [invoices, setInvoices] = useState([]);
   const [loading, setLoading] = useState(true);
   const [generating, setGenerating] = useState(false);
@@ -528,7 +528,7 @@ function ActionBtn({ onClick, color, flex, children, title }) {
 /* ── Detail Modal ── */
 function DetailModal({ invoice, loading, onClose, onDownload, onStatusChange, fmtDate, fmtMoney }) {
   const { t, i18n } = useTranslation();
-  const isRTL = i18n.language === 'ar';
+  const isRTL = i18n.dir() === 'rtl';
   if (!invoice && !loading) return null;
   const cfg = invoice ? (STATUS_CONFIG[invoice.status] || STATUS_CONFIG.draft) : STATUS_CONFIG.draft;
   const StatusIcon = cfg.Icon;
@@ -89,7 +89,7 @@ function pickupIcon() {
 /* ── Route Info Modal ────────────────────────────────────────── */
 function RouteInfoModal({ info, onClose }) {
   const { t, i18n } = useTranslation();
-  const isRTL = i18n.language === 'ar';
+  const isRTL = i18n.dir() === 'rtl';
   if (!info) return null;
   const mins = info.duration ?? Math.ceil((info.dist / 40) * 60);
   const hrs  = Math.floor(mins / 60);
@@ -249,7 +249,7 @@ function timeAgo(dateStr, t) {
 /* ══════════════════════════════════════════════════════════════ */
 export default function LiveMap() {
   const { t, i18n } = useTranslation();
-  const isRTL = i18n.language === 'ar';
+  const isRTL = i18n.dir() === 'rtl';
   const { tenant } = useContext(AuthContext);
   const [drivers, setDrivers]        = useState({});
   const [filter, setFilter]          = useState('all');
@@ -18,7 +18,7 @@ const LANGUAGES = [
 
 export default function LoginPage() {
   const { t, i18n } = useTranslation();
-  const isRTL = i18n.language === 'ar';
+  const isRTL = i18n.dir() === 'rtl';
   /* ── Login state ── */
   const [username, setUsername] = useState('');
   const [password, setPassword] = useState('');
@@ -25,7 +25,7 @@ const SB = {
 
 export default function Notifications() {
   const { t, i18n } = useTranslation();
-  const isRTL = i18n.language === 'ar';
+  const isRTL = i18n.dir() === 'rtl';
   /* ── state ─────────────────────────────────────────────────── */
   const [tab, setTab] = useState('all');
   const [loading, setLoading] = useState(true);
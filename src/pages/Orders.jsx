@@ -128,7 +128,7 @@ function StatusPill({ status }) {
 /* ── Order Number Tooltip ── */
 function OrderNumCell({ orderNumber, trackingToken, onCopyToken, copied }) {
   const { t, i18n } = useTranslation();
-  const isRTL = i18n.language === 'ar';
+  const isRTL = i18n.dir() === 'rtl';
   const [show, setShow] = useState(false);
   const displayNum = orderNumber ? orderNumber.substring(0, 5) + (orderNumber.length > 5 ? '…' : '') : '—';
   const [justCopied, setJustCopied] = useState(false);
@@ -238,7 +238,7 @@ function StepBar({ current, t }) {
 /* Address search (Nominatim) */
 function AddressSearch({ onSelect }) {
   const { t, i18n } = useTranslation();
-  const isRTL = i18n.language === 'ar';
+  const isRTL = i18n.dir() === 'rtl';
   const [q, setQ]         = useState('');
   const [results, setRes] = useState([]);
   const [open, setOpen]   = useState(false);
@@ -304,7 +304,7 @@ function FlyTo({ center }) {
 /* Location picker map for order form */
 function LocationPickerMap({ lat, lng, onPick, height: customHeight }) {
   const { t, i18n } = useTranslation();
-  const isRTL = i18n.language === 'ar';
+  const isRTL = i18n.dir() === 'rtl';
   const center = (lat && lng) ? [parseFloat(lat), parseFloat(lng)] : [25.2048, 55.2708]; // Dubai default
   const hasPin = lat && lng;
   const isMobile = window.innerWidth <= 768;
@@ -346,7 +346,7 @@ function LocationPickerMap({ lat, lng, onPick, height: customHeight }) {
    ══════════════════════════════════════════════════════════════ */
 export default function Orders() {
   const { t, i18n } = useTranslation();
-  const isRTL = i18n.language === 'ar';
+  const isRTL = i18n.dir() === 'rtl';
   const [searchParams, setSearchParams] = useSearchParams();
   const navigate = useNavigate();
 
@@ -26,7 +26,7 @@ const EMPTY_SURGE = {
 
 export default function Pricing() {
   const { t, i18n } = useTranslation();
-  const isRTL = i18n.language === 'ar';
+  const isRTL = i18n.dir() === 'rtl';
 
   /* ── State ── */
   const [rules, setRules]       = useState([]);
@@ -6,7 +6,7 @@ import './RegisterPage.css';
 
 export default function RegisterPage() {
   const { t, i18n } = useTranslation();
-  const isRTL = i18n.language === 'ar';
+  const isRTL = i18n.dir() === 'rtl';
   const [formData, setFormData] = useState({
     company_name: '',
     full_name: '',
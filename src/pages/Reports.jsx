@@ -41,7 +41,7 @@ const COLORS = ['#f97316', '#244066', '#22c55e', '#ef4444', '#8b5cf6', '#0ea5e9'
 
 export default function Reports() {
   const { t, i18n } = useTranslation();
-  const isRTL = i18n.language === 'ar';
+  const isRTL = i18n.dir() === 'rtl';
   const [period,   setPeriod]   = useState('30');
   const [dateFrom, setDateFrom] = useState('');
   const [dateTo,   setDateTo]   = useState('');
@@ -32,7 +32,7 @@ const CATEGORY_COLORS  = ['#f97316','#3b82f6','#8b5cf6','#16a34a','#ec4899','#ef
 /* ── Toggle switch ────────────────────────────────────────── */
 function Toggle({ on, onChange }) {
   const { i18n } = useTranslation();
-  const isRTL = i18n.language === 'ar';
+  const isRTL = i18n.dir() === 'rtl';
   return (
     <button type="button" onClick={() => onChange(!on)} style={{
       width:44, height:24, borderRadius:12, border:'none', cursor:'pointer',
@@ -285,7 +285,7 @@ function GeneralTab({ data, setData, onSave, saving }) {
 ═══════════════════════════════════════════════════════════════ */
 function DeliveryTab({ data, setData, onSave, saving }) {
   const { t, i18n } = useTranslation();
-  const isRTL = i18n.language === 'ar';
+  const isRTL = i18n.dir() === 'rtl';
   const s = data.settings || {};
   const set = (k, v) => setData(d => ({ ...d, settings: { ...d.settings, [k]: v } }));
 
@@ -475,7 +475,7 @@ function DeliveryTab({ data, setData, onSave, saving }) {
 ═══════════════════════════════════════════════════════════════ */
 function NotificationsTab({ data, setData, onSave, saving }) {
   const { t, i18n } = useTranslation();
-  const isRTL = i18n.language === 'ar';
+  const isRTL = i18n.dir() === 'rtl';
   const s = data.settings || {};
   const set = (k, v) => setData(d => ({ ...d, settings: { ...d.settings, [k]: v } }));
   const [showPass, setShowPass] = useState(false);
@@ -573,7 +573,7 @@ function NotificationsTab({ data, setData, onSave, saving }) {
 ═══════════════════════════════════════════════════════════════ */
 function ShippingLabelsTab({ data, setData, onSave, saving }) {
   const { t, i18n } = useTranslation();
-  const isRTL = i18n.language === 'ar';
+  const isRTL = i18n.dir() === 'rtl';
   const s = data.settings || {};
   const lt = (s.label_template && typeof s.label_template === 'object') ? s.label_template : {};
 
@@ -879,7 +879,7 @@ const MODULE_SECTIONS = {
 
 function RolesTab({ toast }) {
   const { t, i18n } = useTranslation();
-  const isRTL = i18n.language === 'ar';
+  const isRTL = i18n.dir() === 'rtl';
   const [roles, setRoles]         = useState([]);
   const [modules, setModules]     = useState([]);
   const [loading, setLoading]     = useState(true);
@@ -1219,7 +1219,7 @@ function RolesTab({ toast }) {
 ═══════════════════════════════════════════════════════════════ */
 function UsersTab({ toast }) {
   const { t, i18n } = useTranslation();
-  const isRTL = i18n.language === 'ar';
+  const isRTL = i18n.dir() === 'rtl';
   const { user: currentUser } = useContext(AuthContext);
   const [users, setUsers]        = useState([]);
   const [roles, setRoles]        = useState([]);
@@ -1585,7 +1585,7 @@ const TABS = [
 
 export default function Settings() {
   const { t, i18n } = useTranslation();
-  const isRTL = i18n.language === 'ar';
+  const isRTL = i18n.dir() === 'rtl';
   const [tab,     setTab]    = useState('general');
   const [data,    setData]   = useState({});
   const [loading, setLoading]= useState(true);
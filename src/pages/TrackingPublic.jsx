@@ -66,7 +66,7 @@ const S = {
 
 export default function TrackingPublic() {
   const { t, i18n } = useTranslation();
-  const isRTL = i18n.language === 'ar';
+  const isRTL = i18n.dir() === 'rtl';
   const { token } = useParams();
   const mapRef = useRef(null);
   const mapObjRef = useRef(null);
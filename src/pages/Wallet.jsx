@@ -26,7 +26,7 @@ const PER_PAGE = 20;
 
 export default function Wallet() {
   const { t, i18n } = useTranslation();
-  const isRTL = i18n.language === 'ar';
+  const isRTL = i18n.dir() === 'rtl';
 
   const fmtAED = (v) => `${t('wallet.currency_prefix')} ${parseFloat(v || 0).toFixed(2)}`;
 